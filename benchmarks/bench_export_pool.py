@@ -0,0 +1,55 @@
+"""Benchmark exporting a batch of articles serially and in a process pool.
+
+Run with:
+    python -m benchmarks.bench_export_pool [--articles N] [--blocks N]
+        [--format FORMAT] [--workers N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from medium_converter.core.config import ExportConfig
+from medium_converter.core.parser import parse_article
+from medium_converter.exporters import get_exporter
+from medium_converter.exporters.pool import ExportPool
+
+from .bench_parser import make_page
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=50)
+    parser.add_argument("--blocks", type=int, default=100)
+    parser.add_argument("--format", default="docx")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    article = parse_article(make_page(args.blocks))
+    exporter = get_exporter(args.format)
+
+    with tempfile.TemporaryDirectory() as directory:
+        jobs = [
+            (article, str(Path(directory) / f"{i}.{args.format}"))
+            for i in range(args.articles)
+        ]
+
+        start = time.perf_counter()
+        for job_article, output in jobs:
+            exporter.export(job_article, output)
+        serial = time.perf_counter() - start
+        print(f"    serial: {serial:8.2f} s for {args.articles} articles")
+
+        with ExportPool([args.format], ExportConfig(workers=args.workers)) as pool:
+            start = time.perf_counter()
+            pool.export_batch(args.format, jobs)
+            parallel = time.perf_counter() - start
+            print(f"      pool: {parallel:8.2f} s with {pool.workers} workers")
+
+    print(f"   speedup: {serial / parallel:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
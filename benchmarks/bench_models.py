@@ -0,0 +1,73 @@
+"""Benchmark validated and trusted construction of content blocks.
+
+Reports the time to build a list of blocks and the memory and number of
+allocations it retains, measured with tracemalloc.
+
+Run with:
+    python -m benchmarks.bench_models [--blocks N] [--repeat N]
+"""
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+from collections.abc import Callable
+
+from medium_converter.core.models import ContentBlock, ContentType
+
+TEXT = "A paragraph of text that is about as long as a typical one."
+
+
+def build_validated(count: int) -> list[ContentBlock]:
+    """Build blocks through the validating constructor."""
+    return [ContentBlock(type=ContentType.TEXT, content=TEXT) for _ in range(count)]
+
+
+def build_trusted(count: int) -> list[ContentBlock]:
+    """Build blocks through the trusted constructor."""
+    return [ContentBlock.trusted(ContentType.TEXT, TEXT) for _ in range(count)]
+
+
+def measure_allocations(
+    build: Callable[[int], list[ContentBlock]], count: int
+) -> tuple[int, int]:
+    """Return the bytes and number of allocations retained by a build."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    blocks = build(count)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    allocations = sum(stat.count_diff for stat in stats)
+    del blocks
+    return size, allocations
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"Building {args.blocks} text blocks")
+    results = {}
+    for name, build in (("validated", build_validated), ("trusted", build_trusted)):
+        elapsed = min(
+            timeit.repeat(lambda b=build: b(args.blocks), number=1, repeat=args.repeat)
+        )
+        size, allocations = measure_allocations(build, args.blocks)
+        results[name] = elapsed
+        print(
+            f"{name:>10}: {elapsed * 1000:8.2f} ms, "
+            f"{size / 1024:8.0f} KiB, {allocations:7d} allocations"
+        )
+
+    print(f"   speedup: {results['validated'] / results['trusted']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark parsing a batch of pages serially and in a process pool.
+
+Run with:
+    python -m benchmarks.bench_parse_pool [--pages N] [--blocks N] [--workers N]
+"""
+
+import argparse
+import pickle
+import time
+
+from medium_converter.core.config import ParseConfig
+from medium_converter.core.parse_pool import ParsePool
+from medium_converter.core.parser import parse_article
+
+from .bench_parser import make_page
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--blocks", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    pages = [make_page(args.blocks) for _ in range(args.pages)]
+    article = parse_article(pages[0])
+    print(
+        f"Transfer size: {len(pickle.dumps(article)) / 1024:.0f} KiB pickled model, "
+        f"{len(article.to_bytes()) / 1024:.0f} KiB encoded"
+    )
+
+    start = time.perf_counter()
+    for page in pages:
+        parse_article(page)
+    serial = time.perf_counter() - start
+    print(f"    serial: {serial:8.2f} s for {args.pages} pages")
+
+    with ParsePool(ParseConfig(workers=args.workers)) as pool:
+        start = time.perf_counter()
+        pool.parse_many(pages)
+        parallel = time.perf_counter() - start
+        print(f"      pool: {parallel:8.2f} s with {pool.workers} workers")
+
+    print(f"   speedup: {serial / parallel:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
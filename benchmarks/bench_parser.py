@@ -0,0 +1,131 @@
+"""Benchmark the lxml article parser against a BeautifulSoup equivalent.
+
+Run with:
+    python -m benchmarks.bench_parser [--blocks N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from bs4 import BeautifulSoup
+
+from medium_converter.core.models import Article, ContentBlock, ContentType
+from medium_converter.core.parser import parse_article
+
+BLOCK_HTML = """
+<h2>Section heading</h2>
+<p><strong>Bold lead</strong> followed by <em>emphasis</em> and a
+<a href="https://example.com">link</a> in a fairly long paragraph of text
+that wraps over several lines in the page source.</p>
+<figure><img src="https://miro.medium.com/v2/1*abc.png" alt="Diagram">
+<figcaption>A diagram</figcaption></figure>
+<pre data-code-block-lang="python"><span>def f():</span><br><span>  pass</span></pre>
+<blockquote><p>A quotation worth repeating.</p></blockquote>
+<ul><li>First item</li><li>Second item</li><li>Third item</li></ul>
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head>
+<meta charset="utf-8">
+<meta property="og:title" content="Benchmark Article">
+<meta name="author" content="Bench Author">
+<meta property="article:published_time" content="2024-01-01T00:00:00.000Z">
+{scripts}
+</head><body>
+<nav>{nav}</nav>
+<article><section><h1>Benchmark Article</h1>{blocks}</section></article>
+<footer>{nav}</footer>
+</body></html>
+"""
+
+
+def make_page(blocks: int) -> bytes:
+    """Build a synthetic Medium-like page with ``blocks`` block groups."""
+    scripts = "<script>window.__DATA__ = {};</script>" * 50
+    nav = "<div><a href='/'>Home</a><p>Menu entry</p></div>" * 50
+    return PAGE_TEMPLATE.format(
+        scripts=scripts, nav=nav, blocks=BLOCK_HTML * blocks
+    ).encode("utf-8")
+
+
+def parse_article_bs4(html: bytes) -> Article:
+    """Reference implementation using BeautifulSoup on top of lxml."""
+    soup = BeautifulSoup(html, "lxml")
+    title_tag = soup.find("meta", property="og:title")
+    author_tag = soup.find("meta", attrs={"name": "author"})
+    article = soup.find("article") or soup.body
+
+    content = []
+    for element in article.find_all(
+        ["p", "h1", "h2", "h3", "h4", "pre", "blockquote", "figure", "ul", "ol"]
+    ):
+        if element.find_parent(["blockquote", "figure", "ul", "ol", "pre"]):
+            continue
+        name = element.name
+        if name == "p":
+            content.append(
+                ContentBlock(type=ContentType.TEXT, content=element.get_text(" "))
+            )
+        elif name in ("h1", "h2", "h3", "h4"):
+            content.append(
+                ContentBlock(
+                    type=ContentType.HEADING,
+                    content=element.get_text(" "),
+                    metadata={"level": int(name[1])},
+                )
+            )
+        elif name == "pre":
+            content.append(
+                ContentBlock(type=ContentType.CODE, content=element.get_text("\n"))
+            )
+        elif name == "blockquote":
+            content.append(
+                ContentBlock(type=ContentType.QUOTE, content=element.get_text(" "))
+            )
+        elif name == "figure":
+            img = element.find("img")
+            content.append(
+                ContentBlock(
+                    type=ContentType.IMAGE,
+                    content=img.get("src", ""),
+                    metadata={"alt": img.get("alt", "")},
+                )
+            )
+        else:
+            items = [li.get_text(" ") for li in element.find_all("li")]
+            content.append(
+                ContentBlock(type=ContentType.LIST, content="\n".join(items))
+            )
+
+    return Article(
+        title=title_tag["content"] if title_tag else "",
+        author=author_tag["content"] if author_tag else "",
+        date="",
+        content=content,
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    page = make_page(args.blocks)
+    print(f"Page size: {len(page) / 1024:.0f} KiB, {args.blocks * 6} blocks")
+
+    results = {}
+    for name, func in (("lxml", parse_article), ("bs4+lxml", parse_article_bs4)):
+        func(page)  # warm up
+        elapsed = min(
+            timeit.repeat(lambda f=func: f(page), number=1, repeat=args.repeat)
+        )
+        results[name] = elapsed
+        print(f"{name:>10}: {elapsed * 1000:8.2f} ms per article")
+
+    print(f"   speedup: {results['bs4+lxml'] / results['lxml']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -331,6 +331,10 @@ def config_cmd(action: str, key: str | None, value: str | None) -> None:
         medium config reset
     """
     if action == "show":
+        from .core.config import CacheConfig
+
+        cache_config = CacheConfig()
+
         # Example configuration table
         config_table = Table(
             title="⚙️ Configuration", box=box.ROUNDED, border_style="bright_magenta"
@@ -345,8 +349,9 @@ def config_cmd(action: str, key: str | None, value: str | None) -> None:
         config_table.add_row("llm.provider", "openai")
         config_table.add_row("llm.temperature", "0.7")
         config_table.add_row("export.include_metadata", "true")
-        config_table.add_row("cache.enable", "true")
-        config_table.add_row("cache.ttl", "86400")
+        config_table.add_row("cache.enable", str(cache_config.enable).lower())
+        config_table.add_row("cache.ttl", str(cache_config.ttl))
+        config_table.add_row("cache.cache_dir", cache_config.cache_dir)
 
         console.print(config_table)
     elif action == "set" and key and value:
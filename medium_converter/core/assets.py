@@ -0,0 +1,321 @@
+"""Downloading and caching of the images referenced by articles."""
+
+import asyncio
+import hashlib
+import io
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+
+import httpx
+
+from .cache import DiskStore
+from .config import CacheConfig, FetchConfig, ImageConfig
+from .fetcher import FetchSession, ResponseTooLargeError
+from .models import Article, ContentBlock, ContentType, Section
+
+try:
+    from PIL import Image
+
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+# Leading bytes of the image formats that the exporters can embed
+IMAGE_SIGNATURES = {
+    b"\x89PNG\r\n\x1a\n": "png",
+    b"\xff\xd8\xff": "jpg",
+    b"GIF87a": "gif",
+    b"GIF89a": "gif",
+}
+
+PIL_FORMATS = {"png": "PNG", "jpg": "JPEG"}
+
+
+class ImageCache:
+    """Content-addressed on-disk cache of downloaded images.
+
+    Images are stored as files named after a BLAKE2b hash of their content,
+    so identical images referenced by different URLs are stored once. A
+    small index maps each URL to the file holding its image. Image files
+    are not evicted automatically; ``clear`` removes them.
+    """
+
+    def __init__(self, config: CacheConfig | None = None) -> None:
+        """Initialize the image cache.
+
+        Args:
+            config: Optional cache configuration
+        """
+        self.config = config or CacheConfig()
+        self.directory = Path(self.config.cache_dir).expanduser() / "images"
+        self.index = DiskStore(
+            Path(self.config.cache_dir) / "images.sqlite3", self.config.max_size
+        )
+
+    def get(self, url: str) -> Path | None:
+        """Look up the cached image for a URL.
+
+        Args:
+            url: The image URL
+
+        Returns:
+            Path of the cached image, or None if not cached
+        """
+        entry = self.index.get(url)
+        if entry is None:
+            return None
+        path = self.directory / entry[0].decode("utf-8")
+        return path if path.exists() else None
+
+    def put(self, url: str, data: bytes, extension: str) -> Path:
+        """Store the image downloaded from a URL.
+
+        Args:
+            url: The image URL
+            data: The image content
+            extension: File extension matching the image format
+
+        Returns:
+            Path of the cached image
+        """
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        name = f"{digest}.{extension}"
+        path = self.directory / name
+        if not path.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        # The index holds only the file name; the file is not counted
+        self.index.put(url, name.encode("utf-8"), {})
+        return path
+
+    def clear(self) -> None:
+        """Remove all cached images."""
+        self.index.clear()
+        if self.directory.exists():
+            for path in self.directory.iterdir():
+                path.unlink(missing_ok=True)
+
+
+class ImageFetcher:
+    """Downloads images concurrently over one pooled HTTP client.
+
+    Downloads are bounded by ``ImageConfig.max_concurrency`` and the
+    per-request timeout, and results are cached on disk. When Pillow is
+    installed, images wider than ``ImageConfig.max_width`` are downsized
+    and formats the exporters cannot embed, such as WebP, are converted to
+    PNG, both in worker threads so the event loop keeps downloading.
+
+    Example:
+        async with ImageFetcher() as images:
+            article = await images.localize(article)
+        DocxExporter().export(article, "article.docx")
+    """
+
+    def __init__(
+        self,
+        config: ImageConfig | None = None,
+        cache: ImageCache | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            config: Optional image configuration
+            cache: Optional on-disk image cache; a default one is used if
+                omitted, as exporters need the images as files
+            transport: Optional custom transport (mainly useful for testing)
+        """
+        self.config = config or ImageConfig()
+        self.cache = cache or ImageCache()
+        self.session = FetchSession(
+            FetchConfig(
+                timeout=self.config.timeout,
+                connect_timeout=min(self.config.timeout, FetchConfig().connect_timeout),
+                max_connections=self.config.max_concurrency,
+                max_keepalive_connections=self.config.max_concurrency,
+                # Image URLs differ only in their path and query, which URL
+                # normalization for coalescing would not preserve
+                coalesce=False,
+                max_bytes=self.config.max_bytes,
+            ),
+            transport=transport,
+        )
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+    async def fetch(self, url: str) -> Path | None:
+        """Get a local copy of an image, downloading it if not cached.
+
+        Args:
+            url: The image URL
+
+        Returns:
+            Path of the local image, or None if it could not be downloaded
+            or is not in a supported format
+        """
+        path = await asyncio.to_thread(self.cache.get, url)
+        if path is not None:
+            return path
+
+        async with self._semaphore:
+            try:
+                data = await self.session.fetch_bytes(url)
+            except (httpx.HTTPError, ResponseTooLargeError):
+                return None
+
+        prepared = await asyncio.to_thread(prepare_image, data, self.config.max_width)
+        if prepared is None:
+            return None
+        return await asyncio.to_thread(self.cache.put, url, *prepared)
+
+    async def fetch_all(self, urls: Iterable[str]) -> dict[str, Path]:
+        """Get local copies of several images concurrently.
+
+        Args:
+            urls: The image URLs
+
+        Returns:
+            Dict mapping each URL that could be downloaded to its local path
+        """
+        unique = list(dict.fromkeys(urls))
+        paths = await asyncio.gather(*(self.fetch(url) for url in unique))
+        return {
+            url: path
+            for url, path in zip(unique, paths, strict=True)
+            if path is not None
+        }
+
+    async def localize(self, article: Article) -> Article:
+        """Download an article's images and point its image blocks at them.
+
+        Args:
+            article: The article whose images to download
+
+        Returns:
+            A copy of the article whose image blocks refer to local files;
+            images that could not be downloaded keep their URLs
+        """
+        return localize_images(article, await self.fetch_all(image_urls(article)))
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "ImageFetcher":
+        """Open the fetcher."""
+        await self.session.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the fetcher."""
+        await self.aclose()
+
+
+def image_urls(article: Article) -> list[str]:
+    """Get the remote image URLs of an article in document order.
+
+    Args:
+        article: The article to scan
+
+    Returns:
+        Distinct ``http`` and ``https`` URLs of its image blocks
+    """
+    urls = [
+        block.content
+        for block in _blocks(article)
+        if block.type == ContentType.IMAGE
+        and block.content.startswith(("http://", "https://"))
+    ]
+    return list(dict.fromkeys(urls))
+
+
+def localize_images(article: Article, paths: dict[str, Path]) -> Article:
+    """Point an article's image blocks at local files.
+
+    Args:
+        article: The article to rewrite
+        paths: Dict mapping image URLs to local paths
+
+    Returns:
+        A copy of the article; image blocks without a local path are kept
+    """
+
+    def localize(block: ContentBlock) -> ContentBlock:
+        path = paths.get(block.content) if block.type == ContentType.IMAGE else None
+        if path is None:
+            return block
+        return ContentBlock.trusted(block.type, str(path), block.metadata)
+
+    content: list[Section | ContentBlock] = [
+        (
+            Section.trusted(item.title, [localize(block) for block in item.blocks])
+            if isinstance(item, Section)
+            else localize(item)
+        )
+        for item in article.content
+    ]
+    return article.model_copy(update={"content": content})
+
+
+def prepare_image(data: bytes, max_width: int | None) -> tuple[bytes, str] | None:
+    """Detect an image's format and downsize or convert it if needed.
+
+    Without Pillow, only PNG, JPEG and GIF images are accepted, unchanged.
+
+    Args:
+        data: The downloaded image
+        max_width: Width in pixels to downsize wider images to, or None
+
+    Returns:
+        Tuple of the image content and its file extension, or None if the
+        image is not in a supported format
+    """
+    extension = next(
+        (ext for sig, ext in IMAGE_SIGNATURES.items() if data.startswith(sig)), None
+    )
+    if not HAS_PIL:
+        return (data, extension) if extension is not None else None
+
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            image: Image.Image = source
+            width = max_width if max_width is not None else image.width
+            # GIFs are kept as they are, as animated ones would lose frames
+            if extension == "gif" or (
+                extension in PIL_FORMATS and image.width <= width
+            ):
+                return data, extension
+
+            if image.width > width:
+                height = max(1, round(image.height * width / image.width))
+                image = image.resize((width, height), Image.Resampling.LANCZOS)
+
+            if extension == "jpg":
+                if image.mode not in ("RGB", "L"):
+                    image = image.convert("RGB")
+            else:
+                extension = "png"
+                if image.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+                    image = image.convert("RGBA")
+            output = io.BytesIO()
+            image.save(output, PIL_FORMATS[extension])
+            return output.getvalue(), extension
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+
+def _blocks(article: Article) -> Iterable[ContentBlock]:
+    """Iterate over all blocks of an article, including those in sections."""
+    for item in article.content:
+        if isinstance(item, Section):
+            yield from item.blocks
+        else:
+            yield item
@@ -1,21 +1,151 @@
 """Authentication utilities for Medium."""
 
-import browser_cookie3
+import glob
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
 
+from .config import CacheConfig
 
-def get_medium_cookies() -> dict[str, str]:
+# Locations of the Chrome and Firefox cookie databases on Linux, macOS and
+# Windows; a change to any of them invalidates the cached cookies
+COOKIE_DB_PATTERNS = (
+    "~/.config/google-chrome*/*/Cookies",
+    "~/.config/google-chrome*/*/Network/Cookies",
+    "~/Library/Application Support/Google/Chrome*/*/Cookies",
+    "~/Library/Application Support/Google/Chrome*/*/Network/Cookies",
+    "$LOCALAPPDATA/Google/Chrome*/User Data/*/Network/Cookies",
+    "~/.mozilla/firefox/*/cookies.sqlite",
+    "~/snap/firefox/common/.mozilla/firefox/*/cookies.sqlite",
+    "~/Library/Application Support/Firefox/Profiles/*/cookies.sqlite",
+    "$APPDATA/Mozilla/Firefox/Profiles/*/cookies.sqlite",
+)
+
+COOKIE_CACHE_FILE = "cookies.json"
+
+_lock = threading.Lock()
+_memory_cache: dict[str, Any] | None = None
+
+
+def get_medium_cookies(use_cache: bool = True) -> dict[str, str]:
     """Extract Medium cookies from the user's browser.
 
+    Decrypting the browser cookie databases is slow, so the result is cached
+    in memory and in a file readable only by the current user. The cache is
+    reused until the earliest cookie expires or a browser cookie database
+    changes.
+
+    Args:
+        use_cache: Whether to use and update the cookie cache
+
     Returns:
         Dict of cookies for Medium domain
     """
-    try:
-        cookies = browser_cookie3.chrome(domain_name="medium.com")
-        return {cookie.name: cookie.value for cookie in cookies}
-    except Exception:
-        # Fallback to Firefox
+    global _memory_cache
+
+    if not use_cache:
+        cookies, _ = _extract_cookies()
+        return cookies
+
+    with _lock:
+        signature = _cookie_db_signature()
+        entry = _memory_cache
+        if entry is None or not _is_valid(entry, signature):
+            entry = _read_cache_file()
+        if entry is not None and _is_valid(entry, signature):
+            _memory_cache = entry
+            return dict(entry["cookies"])
+
+        cookies, expires_at = _extract_cookies()
+        _memory_cache = {
+            "signature": signature,
+            "expires_at": expires_at,
+            "cookies": cookies,
+        }
+        _write_cache_file(_memory_cache)
+        return dict(cookies)
+
+
+def clear_cookie_cache() -> None:
+    """Remove the in-memory and on-disk cookie caches."""
+    global _memory_cache
+
+    with _lock:
+        _memory_cache = None
+        _cache_file_path().unlink(missing_ok=True)
+
+
+def _extract_cookies() -> tuple[dict[str, str], float | None]:
+    """Read Medium cookies from Chrome, falling back to Firefox.
+
+    Returns:
+        Tuple of cookies and the earliest expiry time, if any
+    """
+    # Imported lazily: loading browser_cookie3 pulls in crypto libraries
+    import browser_cookie3
+
+    for browser in (browser_cookie3.chrome, browser_cookie3.firefox):
         try:
-            cookies = browser_cookie3.firefox(domain_name="medium.com")
-            return {cookie.name: cookie.value for cookie in cookies}
+            jar = list(browser(domain_name="medium.com"))
         except Exception:
-            return {}
+            continue
+
+        expiries = [float(cookie.expires) for cookie in jar if cookie.expires]
+        return (
+            {cookie.name: cookie.value for cookie in jar},
+            min(expiries) if expiries else None,
+        )
+    return {}, None
+
+
+def _cookie_db_signature() -> list[list[Any]]:
+    """Get the paths and modification times of the browser cookie databases."""
+    signature = []
+    for pattern in COOKIE_DB_PATTERNS:
+        for path in glob.glob(os.path.expandvars(os.path.expanduser(pattern))):
+            try:
+                signature.append([path, os.stat(path).st_mtime_ns])
+            except OSError:
+                continue
+    return sorted(signature)
+
+
+def _is_valid(entry: dict[str, Any], signature: list[list[Any]]) -> bool:
+    """Check whether a cache entry is unexpired and matches the databases."""
+    expires_at = entry.get("expires_at")
+    if expires_at is not None and time.time() >= expires_at:
+        return False
+    return bool(entry.get("signature") == signature)
+
+
+def _cache_file_path() -> Path:
+    """Get the path of the on-disk cookie cache."""
+    return Path(CacheConfig().cache_dir).expanduser() / COOKIE_CACHE_FILE
+
+
+def _read_cache_file() -> dict[str, Any] | None:
+    """Read the on-disk cookie cache, if present and well-formed."""
+    try:
+        with open(_cache_file_path(), encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) and "cookies" in entry else None
+
+
+def _write_cache_file(entry: dict[str, Any]) -> None:
+    """Write the on-disk cookie cache with owner-only permissions."""
+    path = _cache_file_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is an optimization; failing to write it is not an error
+        pass
@@ -0,0 +1,402 @@
+"""Persistent on-disk caches for Medium Converter."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..utils.helpers import strip_tracking_params
+from .codec import VERSION as CODEC_VERSION
+from .codec import CodecError
+from .config import CacheConfig
+from .models import Article
+from .parser import PARSER_VERSION, parse_article
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    meta TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+class DiskStore:
+    """A size-bounded key/value store backed by SQLite.
+
+    Entries are evicted least-recently-used first once the total size of the
+    stored values exceeds ``max_size``. The database runs in WAL mode so that
+    several worker processes can share one store safely.
+    """
+
+    def __init__(self, path: str | Path, max_size: int) -> None:
+        """Initialize the store.
+
+        Args:
+            path: Path of the SQLite database file
+            max_size: Maximum total size of stored values in bytes
+        """
+        self.path = Path(path).expanduser()
+        self.max_size = max_size
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return a connection owned by the current thread and process."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> tuple[bytes, dict[str, Any], float] | None:
+        """Get an entry and mark it as recently used.
+
+        Args:
+            key: The entry key
+
+        Returns:
+            Tuple of value, metadata and storage time, or None if missing
+        """
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, meta, stored_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        conn.execute(
+            "UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+        )
+        return bytes(row[0]), json.loads(row[1]), row[2]
+
+    def put(self, key: str, value: bytes, meta: dict[str, Any] | None = None) -> None:
+        """Store an entry, evicting old entries if the store is over its limit.
+
+        Args:
+            key: The entry key
+            value: The value to store
+            meta: Optional JSON-serializable metadata
+        """
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, value, meta, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, json.dumps(meta or {}), len(value), now, now),
+            )
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def touch(self, key: str) -> None:
+        """Reset an entry's storage time, e.g. after a successful revalidation.
+
+        Args:
+            key: The entry key
+        """
+        now = time.time()
+        self._connect().execute(
+            "UPDATE entries SET stored_at = ?, accessed_at = ? WHERE key = ?",
+            (now, now, key),
+        )
+
+    def delete(self, key: str) -> None:
+        """Remove an entry.
+
+        Args:
+            key: The entry key
+        """
+        self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._connect().execute("DELETE FROM entries")
+
+    def total_size(self) -> int:
+        """Return the total size of all stored values in bytes."""
+        row = self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM entries")
+        return int(row.fetchone()[0])
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least-recently-used entries until the store fits its limit."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        excess = int(total[0]) - self.max_size
+        if excess <= 0:
+            return
+
+        freed = 0
+        victims = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at"
+        ):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached HTTP response body with its validators."""
+
+    body: bytes
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    encoding: str | None = None
+
+    def is_fresh(self, ttl: int) -> bool:
+        """Check whether the entry can be served without revalidation.
+
+        Args:
+            ttl: Time-to-live in seconds
+
+        Returns:
+            True if the entry is younger than the TTL
+        """
+        return time.time() - self.stored_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the headers for a conditional revalidation request.
+
+        Returns:
+            Dict of ``If-None-Match``/``If-Modified-Since`` headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @property
+    def text(self) -> str:
+        """The decoded response body."""
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+
+class FetchCache:
+    """On-disk cache of fetched article bodies.
+
+    Bodies are stored zlib-compressed together with their ``ETag`` and
+    ``Last-Modified`` validators, keyed on the article URL without its
+    tracking parameters.
+    """
+
+    def __init__(self, config: CacheConfig | None = None) -> None:
+        """Initialize the fetch cache.
+
+        Args:
+            config: Optional cache configuration
+        """
+        self.config = config or CacheConfig()
+        self.store = DiskStore(
+            Path(self.config.cache_dir) / "fetch.sqlite3", self.config.max_size
+        )
+
+    @staticmethod
+    def _key(url: str) -> str:
+        """Get the cache key for a URL."""
+        return strip_tracking_params(url)
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Look up a cached response.
+
+        Args:
+            url: The URL of the article
+
+        Returns:
+            The cached response, or None if not cached
+        """
+        entry = self.store.get(self._key(url))
+        if entry is None:
+            return None
+
+        value, meta, stored_at = entry
+        return CachedResponse(
+            body=zlib.decompress(value),
+            stored_at=stored_at,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            encoding=meta.get("encoding"),
+        )
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        encoding: str | None = None,
+    ) -> None:
+        """Store a response body and its validators.
+
+        Args:
+            url: The URL of the article
+            body: The raw response body
+            etag: Optional ``ETag`` header value
+            last_modified: Optional ``Last-Modified`` header value
+            encoding: Optional character encoding of the body
+        """
+        meta = {"etag": etag, "last_modified": last_modified, "encoding": encoding}
+        self.store.put(self._key(url), zlib.compress(body), meta)
+
+    def refresh(self, url: str) -> None:
+        """Mark a cached response as fresh after a ``304 Not Modified``.
+
+        Args:
+            url: The URL of the article
+        """
+        self.store.touch(self._key(url))
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self.store.clear()
+
+
+class ParseCache:
+    """On-disk cache of parsed articles, keyed on the raw page content.
+
+    Keys are a BLAKE2b hash of the HTML combined with its declared encoding
+    and the parser version, so an identical page is parsed only once and
+    results are invalidated when the parser or the encoding changes.
+    Articles are stored in the compact binary encoding, zlib-compressed, and
+    are not revalidated on load.
+    """
+
+    def __init__(self, config: CacheConfig | None = None) -> None:
+        """Initialize the parse cache.
+
+        Args:
+            config: Optional cache configuration
+        """
+        self.config = config or CacheConfig()
+        self.store = DiskStore(
+            Path(self.config.cache_dir) / "parse.sqlite3", self.config.max_size
+        )
+
+    @staticmethod
+    def _key(html: bytes, encoding: str | None) -> str:
+        """Get the cache key for a page."""
+        digest = hashlib.blake2b(html, digest_size=16).hexdigest()
+        return f"{PARSER_VERSION}.{CODEC_VERSION}:{encoding or ''}:{digest}"
+
+    def get(self, html: bytes, encoding: str | None = None) -> Article | None:
+        """Look up the parsed article for a page.
+
+        Args:
+            html: The raw HTML of the page
+            encoding: Optional declared encoding of the page
+
+        Returns:
+            The cached article, or None if not cached
+        """
+        entry = self.store.get(self._key(html, encoding))
+        if entry is None:
+            return None
+        try:
+            return Article.from_bytes(zlib.decompress(entry[0]))
+        except (zlib.error, CodecError):
+            return None
+
+    def put(self, html: bytes, article: Article, encoding: str | None = None) -> None:
+        """Store the parsed article for a page.
+
+        Args:
+            html: The raw HTML of the page
+            article: The article parsed from it
+            encoding: Optional declared encoding of the page
+        """
+        value = zlib.compress(article.to_bytes())
+        self.store.put(self._key(html, encoding), value, {})
+
+    def parse(self, html: bytes, encoding: str | None = None) -> Article:
+        """Parse a page, reusing the cached result when there is one.
+
+        Args:
+            html: The raw HTML of the page
+            encoding: Optional declared encoding of the page, e.g. the
+                charset of the HTTP response
+
+        Returns:
+            Structured Article object
+        """
+        article = self.get(html, encoding)
+        if article is None:
+            article = parse_article(html, encoding)
+            self.put(html, article, encoding)
+        return article
+
+    def clear(self) -> None:
+        """Remove all cached articles."""
+        self.store.clear()
+
+
+class BlockCache:
+    """On-disk cache of per-block results, such as LLM-enhanced text.
+
+    Entries are grouped by a namespace naming what produced them, and keyed
+    on a digest of their input, typically built from a block fingerprint,
+    so unchanged blocks can reuse earlier results across runs.
+    """
+
+    def __init__(self, config: CacheConfig | None = None) -> None:
+        """Initialize the block cache.
+
+        Args:
+            config: Optional cache configuration
+        """
+        self.config = config or CacheConfig()
+        self.store = DiskStore(
+            Path(self.config.cache_dir) / "blocks.sqlite3", self.config.max_size
+        )
+
+    def get(self, namespace: str, key: str) -> str | None:
+        """Look up a cached result.
+
+        Args:
+            namespace: What produced the result, e.g. ``"enhance"``
+            key: Digest of the input
+
+        Returns:
+            The cached result, or None if not cached
+        """
+        entry = self.store.get(f"{namespace}:{key}")
+        return entry[0].decode("utf-8") if entry is not None else None
+
+    def put(self, namespace: str, key: str, value: str) -> None:
+        """Store a result.
+
+        Args:
+            namespace: What produced the result, e.g. ``"enhance"``
+            key: Digest of the input
+            value: The result
+        """
+        self.store.put(f"{namespace}:{key}", value.encode("utf-8"), {})
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self.store.clear()
@@ -0,0 +1,49 @@
+"""Single-flight coalescing of duplicate in-flight work."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same result instead of starting their own. Once
+    the work finishes the key is forgotten, so later calls run again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._in_flight: dict[str, asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of keys currently in flight."""
+        return len(self._in_flight)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Run ``func`` for ``key``, or join an identical call in flight.
+
+        Args:
+            key: Key identifying duplicate work
+            func: Zero-argument coroutine function performing the work
+
+        Returns:
+            The (shared) result of the work
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+
+        # Shield the shared task so one caller being cancelled does not
+        # cancel the work for everyone else waiting on it
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: "asyncio.Task[T]") -> None:
+        """Drop a finished task, unless the key has been reused since."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
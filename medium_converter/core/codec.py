@@ -0,0 +1,223 @@
+"""Compact, versioned binary serialization of Articles.
+
+The format is columnar. After ``MAGIC`` and a format version byte come four
+length-prefixed sections:
+
+* a JSON header with the article fields, section boundaries and block
+  metadata, whose keys are interned in a per-article table;
+* one byte per block holding the index of its ``ContentType``;
+* the end offset of each block's content in the text, as uint32;
+* the content of every block, concatenated into one UTF-8 string.
+
+Decoding thus runs one JSON parse and one UTF-8 decode per article rather
+than per block, and builds the models directly, skipping validation.
+"""
+
+import json
+import struct
+import sys
+from array import array
+from datetime import datetime
+from typing import Any
+
+from .models import Article, ContentBlock, ContentType, Section
+
+MAGIC = b"MCA"
+VERSION = 1
+
+CONTENT_TYPES = tuple(ContentType)
+_CONTENT_TYPE_INDEX = {content_type: i for i, content_type in enumerate(CONTENT_TYPES)}
+
+# Kinds of the article date, which is either a datetime or unparsed text
+_DATE_TEXT = 0
+_DATE_DATETIME = 1
+
+_HEADER = struct.Struct("<3sBIIII")
+
+
+class CodecError(ValueError):
+    """Raised when data cannot be encoded or is not a valid encoded article."""
+
+
+def encode_article(article: Article) -> bytes:
+    """Encode an Article in the compact binary format.
+
+    Args:
+        article: The article to encode
+
+    Returns:
+        The encoded article
+
+    Raises:
+        CodecError: If block metadata is not JSON-serializable
+    """
+    keys: dict[str, int] = {}
+    sections: list[list[Any]] = []
+    metadata: list[list[Any]] = []
+    types = bytearray()
+    ends = array("I")
+    texts: list[str] = []
+    position = 0
+
+    def add_block(block: ContentBlock) -> None:
+        nonlocal position
+        if block.metadata:
+            entry: list[Any] = [len(types)]
+            for key, value in block.metadata.items():
+                index = keys.get(key)
+                if index is None:
+                    index = keys[key] = len(keys)
+                entry.append(index)
+                entry.append(value)
+            metadata.append(entry)
+        types.append(_CONTENT_TYPE_INDEX[block.type])
+        texts.append(block.content)
+        position += len(block.content)
+        ends.append(position)
+
+    for item_index, item in enumerate(article.content):
+        if isinstance(item, Section):
+            sections.append([item_index, item.title, len(item.blocks)])
+            for block in item.blocks:
+                add_block(block)
+        else:
+            add_block(item)
+
+    date = article.date
+    header = [
+        article.title,
+        article.author,
+        _DATE_DATETIME if isinstance(date, datetime) else _DATE_TEXT,
+        date.isoformat() if isinstance(date, datetime) else date,
+        article.estimated_reading_time,
+        article.url,
+        article.tags,
+        list(keys),
+        sections,
+        metadata,
+    ]
+    try:
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError) as err:
+        raise CodecError(f"Cannot encode block metadata: {err}") from err
+
+    if sys.byteorder != "little":
+        ends.byteswap()
+    text = "".join(texts).encode("utf-8")
+    ends_bytes = ends.tobytes()
+    return b"".join(
+        (
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                len(header_bytes),
+                len(types),
+                len(ends_bytes),
+                len(text),
+            ),
+            header_bytes,
+            types,
+            ends_bytes,
+            text,
+        )
+    )
+
+
+def decode_article(data: bytes) -> Article:
+    """Decode an Article from the compact binary format.
+
+    Args:
+        data: The encoded article
+
+    Returns:
+        The decoded Article, built without validation
+
+    Raises:
+        CodecError: If the data is not an article in a supported version
+    """
+    if data[: len(MAGIC)] != MAGIC:
+        raise CodecError("Data is not an encoded article")
+    try:
+        _, version, header_size, types_size, ends_size, text_size = _HEADER.unpack_from(
+            data
+        )
+    except struct.error as err:
+        raise CodecError("Truncated article data") from err
+    if version != VERSION:
+        raise CodecError(f"Unsupported article encoding version {version}")
+    if _HEADER.size + header_size + types_size + ends_size + text_size != len(data):
+        raise CodecError("Truncated or corrupt article data")
+
+    position = _HEADER.size
+    header_bytes = data[position : position + header_size]
+    position += header_size
+    types = data[position : position + types_size]
+    position += types_size
+    ends = array("I")
+    ends.frombytes(data[position : position + ends_size])
+    if sys.byteorder != "little":
+        ends.byteswap()
+    position += ends_size
+
+    try:
+        text = data[position:].decode("utf-8")
+        (
+            title,
+            author,
+            date_kind,
+            date,
+            reading_time,
+            url,
+            tags,
+            keys,
+            sections,
+            metadata_entries,
+        ) = json.loads(header_bytes)
+        if date_kind == _DATE_DATETIME:
+            date = datetime.fromisoformat(date)
+
+        metadata: dict[int, dict[str, Any]] = {}
+        for entry in metadata_entries:
+            metadata[entry[0]] = {
+                keys[entry[i]]: entry[i + 1] for i in range(1, len(entry), 2)
+            }
+
+        blocks: list[ContentBlock] = []
+        start = 0
+        for index, type_index in enumerate(types):
+            end = ends[index]
+            blocks.append(
+                ContentBlock.trusted(
+                    CONTENT_TYPES[type_index], text[start:end], metadata.get(index)
+                )
+            )
+            start = end
+
+        content: list[Section | ContentBlock] = list(blocks)
+        if sections:
+            content = []
+            block_index = 0
+            for item_index, section_title, count in sections:
+                # Blocks between the previous section and this one
+                while len(content) < item_index:
+                    content.append(blocks[block_index])
+                    block_index += 1
+                content.append(
+                    Section.trusted(
+                        section_title, blocks[block_index : block_index + count]
+                    )
+                )
+                block_index += count
+            content.extend(blocks[block_index:])
+    except (ValueError, TypeError, IndexError) as err:
+        raise CodecError("Corrupt article data") from err
+
+    return Article.trusted(
+        title=title,
+        author=author,
+        date=date,
+        content=content,
+        estimated_reading_time=reading_time,
+        url=url,
+        tags=tags,
+    )
@@ -0,0 +1,81 @@
+"""Fetch configuration for Medium Converter."""
+
+from pydantic import BaseModel, Field
+
+
+class FetchConfig(BaseModel):
+    """Configuration for the HTTP client used to fetch articles."""
+
+    http2: bool = True
+    follow_redirects: bool = True
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    user_agent: str | None = None
+    coalesce: bool = True
+    prefer_json: bool = True
+    max_bytes: int | None = 10 * 1024 * 1024
+    chunk_size: int = 64 * 1024
+
+
+class CacheConfig(BaseModel):
+    """Configuration for the on-disk fetch cache."""
+
+    enable: bool = True
+    ttl: int = 86400
+    cache_dir: str = "~/.medium-converter/cache"
+    max_size: int = 512 * 1024 * 1024
+
+
+class RateLimitConfig(BaseModel):
+    """Configuration for per-host rate limiting and adaptive concurrency."""
+
+    requests_per_second: float = 5.0
+    burst: int = 10
+    initial_concurrency: int = 4
+    min_concurrency: int = 1
+    max_concurrency: int = 32
+    backoff_factor: float = 0.5
+    default_retry_after: float = 1.0
+    max_retry_after: float = 300.0
+    max_throttle_retries: int = 5
+
+
+class RetryPolicy(BaseModel):
+    """Retry, backoff and request hedging policy for fetches."""
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    jitter: bool = True
+    attempt_timeout: float | None = None
+    retry_statuses: list[int] = Field(default_factory=lambda: [429, 500, 502, 503, 504])
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_window: int = 200
+
+
+class ParseConfig(BaseModel):
+    """Configuration for parsing articles in a pool of worker processes."""
+
+    workers: int | None = None
+    batch_size: int = 4
+
+
+class ImageConfig(BaseModel):
+    """Configuration for downloading the images embedded in exports."""
+
+    max_concurrency: int = 8
+    timeout: float = 30.0
+    max_bytes: int | None = 20 * 1024 * 1024
+    max_width: int | None = 1400
+
+
+class ExportConfig(BaseModel):
+    """Configuration for exporting articles in a pool of worker processes."""
+
+    workers: int | None = None
+    batch_size: int = 2
@@ -1,20 +1,522 @@
 """Async HTTP client for fetching Medium articles."""
 
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import NamedTuple
+
 import httpx
 
+from ..utils.helpers import normalize_medium_url, strip_tracking_params
+from .cache import FetchCache, ParseCache
+from .coalesce import SingleFlight
+from .config import FetchConfig, RetryPolicy
+from .models import Article, ContentBlock
+from .parser import StreamingParser, iter_blocks, parse_article
+from .post_json import PostDataError, parse_post_json, post_json_url
+from .ratelimit import HostRateLimiter, parse_retry_after
+from .retry import LatencyTracker, backoff_delay, is_retryable
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a response body exceeds the configured size limit."""
+
+    def __init__(self, url: str, max_bytes: int) -> None:
+        """Initialize the error.
+
+        Args:
+            url: The URL whose response was too large
+            max_bytes: The configured size limit in bytes
+        """
+        super().__init__(f"Response from {url} exceeds {max_bytes} bytes")
+        self.url = url
+        self.max_bytes = max_bytes
+
+
+class _FetchResult(NamedTuple):
+    """Outcome of a single successful fetch attempt."""
+
+    status_code: int
+    body: bytes
+    encoding: str | None
+    headers: httpx.Headers
+
+
+class FetchSession:
+    """A long-lived, pooled HTTP session for fetching articles.
+
+    The session owns a single HTTP/2-enabled ``httpx.AsyncClient`` so that
+    connections to the same host are reused across articles instead of
+    paying TCP and TLS setup for every URL.
+
+    Example:
+        async with FetchSession() as session:
+            for url in urls:
+                html = await fetch_article(url, session=session)
+    """
+
+    def __init__(
+        self,
+        config: FetchConfig | None = None,
+        cookies: dict[str, str] | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: FetchCache | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        parse_cache: ParseCache | None = None,
+    ) -> None:
+        """Initialize the session.
+
+        Args:
+            config: Optional fetch configuration
+            cookies: Optional cookies for authentication
+            transport: Optional custom transport (mainly useful for testing)
+            cache: Optional on-disk cache for fetched bodies
+            rate_limiter: Optional per-host rate limiter
+            retry_policy: Optional retry and hedging policy
+            parse_cache: Optional on-disk cache for parsed articles
+        """
+        self.config = config or FetchConfig()
+        self.cache = cache if cache is not None and cache.config.enable else None
+        self.parse_cache = (
+            parse_cache
+            if parse_cache is not None and parse_cache.config.enable
+            else None
+        )
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._latencies = LatencyTracker(self.retry_policy.hedge_window)
+        self._cookies = cookies
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._fetches: SingleFlight[tuple[bytes, str | None]] = SingleFlight()
+        self._articles: SingleFlight[Article] = SingleFlight()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The underlying HTTP client, created on first use."""
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client from the session configuration."""
+        config = self.config
+        headers = {"User-Agent": config.user_agent} if config.user_agent else None
+        return httpx.AsyncClient(
+            http2=config.http2,
+            follow_redirects=config.follow_redirects,
+            cookies=self._cookies,
+            headers=headers,
+            transport=self._transport,
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+        )
+
+    async def fetch(self, url: str) -> str:
+        """Fetch a URL and return its decoded body.
+
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Decoded response body
+        """
+        body, encoding = await self._fetch_body(url)
+        return body.decode(encoding or "utf-8", errors="replace")
+
+    async def fetch_bytes(self, url: str) -> bytes:
+        """Fetch a URL and return its raw body without decoding it.
+
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Raw response body
+        """
+        body, _ = await self._fetch_body(url)
+        return body
+
+    async def iter_bytes(self, url: str, buffered: bool = True) -> AsyncIterator[bytes]:
+        """Stream a URL's body in chunks as they arrive.
+
+        The body is neither cached nor coalesced, but the configured size
+        limit still applies.
+
+        Args:
+            url: The URL to fetch
+            buffered: Whether to regroup the body into chunks of the
+                configured size, rather than yield data as soon as it arrives
+
+        Yields:
+            Chunks of the raw response body
+        """
+        async with self._stream(url) as response:
+            response.raise_for_status()
+            chunk_size = self.config.chunk_size if buffered else None
+            async for chunk in self._iter_capped(response, chunk_size):
+                yield chunk
+
+    async def iter_blocks(
+        self, url: str, parser: StreamingParser | None = None
+    ) -> AsyncIterator[ContentBlock]:
+        """Stream an article's content blocks as its page downloads.
+
+        Each block is yielded as soon as its closing tag has arrived, so
+        processing can start before the rest of the page is received.
+
+        Args:
+            url: The URL of the Medium article
+            parser: Optional parser to use, e.g. to read its ``meta``
+                afterwards; unless it has an encoding, the response charset
+                is used
+
+        Yields:
+            Content blocks in document order
+        """
+        async with self._stream(url) as response:
+            response.raise_for_status()
+            parser = parser or StreamingParser()
+            parser.encoding = parser.encoding or response.charset_encoding
+            chunks = self._iter_capped(response, None)
+            async for block in iter_blocks(chunks, parser):
+                yield block
+
+    async def get_article(self, url: str) -> Article:
+        """Fetch and parse an article.
+
+        Medium's compact JSON representation is tried first when enabled in
+        the configuration, falling back to parsing the rendered HTML page.
+        Concurrent calls for the same URL, ignoring tracking parameters, share
+        one fetch and one parse, and therefore receive the same ``Article``
+        instance.
+
+        Args:
+            url: The URL of the Medium article
+
+        Returns:
+            Structured Article object
+        """
+        key = strip_tracking_params(url)
+
+        async def fetch_and_parse() -> Article:
+            article = None
+            if self.config.prefer_json:
+                article = await self._get_article_json(url)
+            if article is None:
+                html, encoding = await self._fetch_body(url)
+                if self.parse_cache is not None:
+                    article = self.parse_cache.parse(html, encoding)
+                else:
+                    article = parse_article(html, encoding)
+            if article.url is None:
+                article.url = normalize_medium_url(url)
+            return article
+
+        if not self.config.coalesce:
+            return await fetch_and_parse()
+        return await self._articles.do(key, fetch_and_parse)
+
+    async def _get_article_json(self, url: str) -> Article | None:
+        """Fetch and parse an article's JSON representation.
+
+        Args:
+            url: The URL of the Medium article
+
+        Returns:
+            Structured Article object, or None if the representation is
+            unavailable, too large or too slow to fetch
+        """
+        try:
+            return parse_post_json(await self.fetch_bytes(post_json_url(url)))
+        except (httpx.HTTPError, PostDataError, ResponseTooLargeError, TimeoutError):
+            return None
+
+    async def _fetch_body(self, url: str) -> tuple[bytes, str | None]:
+        """Fetch a URL's body and charset, coalescing duplicate requests.
+
+        Concurrent fetches of the same URL, ignoring tracking parameters,
+        share a single request unless coalescing is disabled in the
+        configuration.
 
-async def fetch_article(url: str, cookies: dict[str, str] | None = None) -> str:
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Tuple of raw body and declared charset
+        """
+        if not self.config.coalesce:
+            return await self._fetch(url)
+        return await self._fetches.do(
+            strip_tracking_params(url), lambda: self._fetch(url)
+        )
+
+    async def _fetch(self, url: str) -> tuple[bytes, str | None]:
+        """Fetch a URL's body and charset without coalescing.
+
+        When the session has a cache, fresh entries are served without
+        touching the network and stale ones are revalidated with a
+        conditional request.
+
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Tuple of raw body and declared charset
+        """
+        cache = self.cache
+        cached = None
+        headers = None
+        if cache is not None:
+            cached = await asyncio.to_thread(cache.get, url)
+            if cached is not None:
+                if cached.is_fresh(cache.config.ttl):
+                    return cached.body, cached.encoding
+                headers = cached.conditional_headers()
+
+        result = await self._fetch_with_retries(url, headers)
+        if cache is not None and cached is not None and result.status_code == 304:
+            await asyncio.to_thread(cache.refresh, url)
+            return cached.body, cached.encoding
+
+        if cache is not None:
+            await asyncio.to_thread(
+                cache.put,
+                url,
+                result.body,
+                etag=result.headers.get("ETag"),
+                last_modified=result.headers.get("Last-Modified"),
+                encoding=result.encoding,
+            )
+        return result.body, result.encoding
+
+    async def _fetch_with_retries(
+        self, url: str, headers: dict[str, str] | None
+    ) -> "_FetchResult":
+        """Fetch a URL, retrying transient failures with jittered backoff.
+
+        Args:
+            url: The URL to fetch
+            headers: Optional extra request headers
+
+        Returns:
+            The result of the first successful attempt
+        """
+        policy = self.retry_policy
+        # The rate limiter already retries throttling responses
+        throttle_handled = self.rate_limiter is not None
+        attempt = 1
+        while True:
+            try:
+                return await self._attempt_hedged(url, headers)
+            except Exception as err:
+                if attempt >= policy.max_attempts or not is_retryable(
+                    policy, err, throttle_handled
+                ):
+                    raise
+                await asyncio.sleep(backoff_delay(policy, attempt, err))
+                attempt += 1
+
+    async def _attempt_hedged(
+        self, url: str, headers: dict[str, str] | None
+    ) -> "_FetchResult":
+        """Run one attempt, hedging it with a second request if it is slow.
+
+        Once enough latency samples have been observed, a second request is
+        started if the first has not completed within the configured latency
+        quantile. Whichever finishes first wins and the other is cancelled.
+
+        Args:
+            url: The URL to fetch
+            headers: Optional extra request headers
+
+        Returns:
+            The result of the winning request
+        """
+        policy = self.retry_policy
+        if not policy.hedge or len(self._latencies) < policy.hedge_min_samples:
+            return await self._attempt(url, headers)
+
+        delay = self._latencies.quantile(policy.hedge_quantile)
+        primary = asyncio.ensure_future(self._attempt(url, headers))
+        pending: set[asyncio.Future[_FetchResult]] = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            pending.add(asyncio.ensure_future(self._attempt(url, headers)))
+
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                if not pending:
+                    # Both requests failed; surface the error of the last one
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _attempt(
+        self, url: str, headers: dict[str, str] | None
+    ) -> "_FetchResult":
+        """Run a single request attempt, bounded by the per-attempt timeout.
+
+        Args:
+            url: The URL to fetch
+            headers: Optional extra request headers
+
+        Returns:
+            Status, body, charset and headers of the response
+        """
+        started = time.monotonic()
+        async with asyncio.timeout(self.retry_policy.attempt_timeout):
+            async with self._stream(url, headers=headers) as response:
+                if response.status_code == 304:
+                    return _FetchResult(304, b"", None, response.headers)
+
+                response.raise_for_status()
+                body = await self._read_capped(response)
+
+        self._latencies.record(time.monotonic() - started)
+        return _FetchResult(
+            response.status_code, body, response.charset_encoding, response.headers
+        )
+
+    @asynccontextmanager
+    async def _stream(
+        self, url: str, headers: dict[str, str] | None = None
+    ) -> AsyncIterator[httpx.Response]:
+        """Open a streaming GET request, honouring the per-host rate limiter.
+
+        Throttling responses (429/503) are retried once the host's
+        ``Retry-After`` delay has passed, up to the configured limit. The
+        host's request slot is held until the body has been consumed.
+
+        Args:
+            url: The URL to fetch
+            headers: Optional extra request headers
+
+        Yields:
+            The HTTP response, with its body not yet read
+        """
+        if self.rate_limiter is None:
+            async with self.client.stream("GET", url, headers=headers) as response:
+                yield response
+            return
+
+        limiter = self.rate_limiter
+        host = httpx.URL(url).host
+        retries = limiter.config.max_throttle_retries
+        for attempt in range(retries + 1):
+            async with limiter.slot(host) as host_limiter:
+                async with self.client.stream("GET", url, headers=headers) as response:
+                    host_limiter.record(
+                        response.status_code,
+                        parse_retry_after(response.headers.get("Retry-After")),
+                    )
+                    if limiter.is_throttled(response) and attempt < retries:
+                        continue
+                    yield response
+                    return
+
+    async def _iter_capped(
+        self, response: httpx.Response, chunk_size: int | None
+    ) -> AsyncIterator[bytes]:
+        """Iterate over a streaming response body, enforcing the size limit.
+
+        Args:
+            response: A streaming HTTP response
+            chunk_size: Size to regroup the body into, or None for as received
+
+        Yields:
+            Chunks of the response body
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds the configured limit
+        """
+        max_bytes = self.config.max_bytes
+        if max_bytes is None:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+            return
+
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > max_bytes:
+            raise ResponseTooLargeError(str(response.url), max_bytes)
+
+        received = 0
+        async for chunk in response.aiter_bytes(chunk_size):
+            received += len(chunk)
+            if received > max_bytes:
+                raise ResponseTooLargeError(str(response.url), max_bytes)
+            yield chunk
+
+    async def _read_capped(self, response: httpx.Response) -> bytes:
+        """Read a streaming response body, enforcing the size limit.
+
+        Args:
+            response: A streaming HTTP response
+
+        Returns:
+            The complete response body
+        """
+        chunks = [
+            chunk async for chunk in self._iter_capped(response, self.config.chunk_size)
+        ]
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "FetchSession":
+        """Open the session."""
+        # Create the client eagerly so the pool is ready for the first request
+        _ = self.client
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the session."""
+        await self.aclose()
+
+
+async def fetch_article(
+    url: str,
+    cookies: dict[str, str] | None = None,
+    session: FetchSession | None = None,
+) -> str:
     """Fetch a Medium article's HTML content.
 
     Args:
         url: The URL of the Medium article
         cookies: Optional cookies for authentication
+        session: Optional shared session; a temporary one is used if omitted
 
     Returns:
         HTML content of the article
     """
-    async with httpx.AsyncClient(follow_redirects=True, cookies=cookies) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        result: str = response.text
-        return result
+    if session is not None:
+        if cookies:
+            session.client.cookies.update(cookies)
+        return await session.fetch(url)
+
+    async with FetchSession(cookies=cookies) as temporary_session:
+        return await temporary_session.fetch(url)
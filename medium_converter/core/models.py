@@ -1,11 +1,45 @@
 """Data models for Medium Converter."""
 
+import hashlib
+import json
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, NoReturn, TypeVar
 
 from pydantic import BaseModel, Field
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class _EmptyMetadata(dict[str, Any]):
+    """A read-only empty dict, shared by every block without metadata."""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Shared empty metadata is read-only; assign a new dict")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> "_EmptyMetadata":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "_EmptyMetadata":
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_empty_metadata, ())
+
+
+def _empty_metadata() -> "_EmptyMetadata":
+    """Return the shared empty metadata, also when unpickling."""
+    return EMPTY_METADATA
+
+
+# Used by the trusted constructors instead of allocating a dict per block
+EMPTY_METADATA = _EmptyMetadata()
+
+_BLOCK_FIELDS = {"type", "content", "metadata"}
+
 
 class ContentType(str, Enum):
     """Types of content blocks in Medium articles."""
@@ -25,6 +59,52 @@ class ContentBlock(BaseModel):
     content: str
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    @classmethod
+    def trusted(
+        cls,
+        type: ContentType,
+        content: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> "ContentBlock":
+        """Build a block from trusted values, skipping validation.
+
+        Meant for the parsers and decoders, which build thousands of blocks
+        from values of the right types. Blocks without metadata share one
+        read-only empty dict.
+
+        Args:
+            type: The content type
+            content: The block content
+            metadata: Optional metadata, used as is
+
+        Returns:
+            The content block
+        """
+        return construct(
+            cls,
+            {"type": type, "content": content, "metadata": metadata or EMPTY_METADATA},
+            _BLOCK_FIELDS,
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """A stable hash of the block's type, content and metadata.
+
+        Unlike ``hash()``, it is the same in every process and run, so it can
+        key persistent caches of per-block results. It is recomputed on
+        each access, as blocks may be modified.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.type.value.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(self.content.encode("utf-8"))
+        if self.metadata:
+            digest.update(b"\0")
+            digest.update(
+                json.dumps(self.metadata, sort_keys=True, default=str).encode("utf-8")
+            )
+        return digest.hexdigest()
+
 
 class Section(BaseModel):
     """A section of a Medium article."""
@@ -32,6 +112,19 @@ class Section(BaseModel):
     title: str | None = None
     blocks: list[ContentBlock] = Field(default_factory=list)
 
+    @classmethod
+    def trusted(cls, title: str | None, blocks: list[ContentBlock]) -> "Section":
+        """Build a section from trusted values, skipping validation.
+
+        Args:
+            title: The section title
+            blocks: The section's blocks, used as is
+
+        Returns:
+            The section
+        """
+        return construct(cls, {"title": title, "blocks": blocks})
+
 
 class Article(BaseModel):
     """A Medium article."""
@@ -43,3 +136,126 @@ class Article(BaseModel):
     estimated_reading_time: int | None = None
     url: str | None = None
     tags: list[str] = Field(default_factory=list)
+
+    @classmethod
+    def trusted(
+        cls,
+        title: str,
+        author: str,
+        date: str | datetime,
+        content: list[Section | ContentBlock],
+        estimated_reading_time: int | None = None,
+        url: str | None = None,
+        tags: list[str] | None = None,
+    ) -> "Article":
+        """Build an article from trusted values, skipping validation.
+
+        Args:
+            title: The article title
+            author: The author's name
+            date: The publication date
+            content: The article content, used as is
+            estimated_reading_time: Optional reading time in minutes
+            url: Optional article URL
+            tags: Optional tags
+
+        Returns:
+            The article
+        """
+        return construct(
+            cls,
+            {
+                "title": title,
+                "author": author,
+                "date": date,
+                "content": content,
+                "estimated_reading_time": estimated_reading_time,
+                "url": url,
+                "tags": tags if tags is not None else [],
+            },
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """A stable hash of the article's fields and the fingerprints of its blocks.
+
+        Two fetches of an unchanged article have the same fingerprint.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        header = [
+            self.title,
+            self.author,
+            str(self.date),
+            self.estimated_reading_time,
+            self.url,
+            self.tags,
+        ]
+        digest.update(json.dumps(header).encode("utf-8"))
+        for item in self.content:
+            if isinstance(item, Section):
+                digest.update(f"\0section\0{item.title}".encode())
+                for block in item.blocks:
+                    digest.update(block.fingerprint.encode("ascii"))
+            else:
+                digest.update(item.fingerprint.encode("ascii"))
+        return digest.hexdigest()
+
+    def to_bytes(self) -> bytes:
+        """Serialize the article in the compact binary format.
+
+        Returns:
+            The encoded article
+        """
+        from .codec import encode_article
+
+        return encode_article(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Article":
+        """Deserialize an article encoded with ``to_bytes``, without validation.
+
+        Args:
+            data: The encoded article
+
+        Returns:
+            The decoded Article
+        """
+        from .codec import decode_article
+
+        return decode_article(data)
+
+
+def construct(
+    cls: type[ModelT], values: dict[str, Any], fields_set: set[str] | None = None
+) -> ModelT:
+    """Build a model from trusted field values without validation.
+
+    This is a leaner ``model_construct``: it neither fills in defaults nor
+    resolves aliases, so ``values`` must hold every field of the model
+    already in its final form. It is meant for data this package produced
+    itself.
+
+    Args:
+        cls: The model class
+        values: Value of every field, keyed by field name; used as is
+        fields_set: Optional set of all field names, shared between models
+
+    Returns:
+        The model instance
+    """
+    model = _new(cls)
+    _set_dict(model, values)
+    # Sharing the set is safe as it already holds every field name, and
+    # pydantic only ever adds names to it
+    _set_fields_set(model, fields_set if fields_set is not None else set(values))
+    _set_extra(model, None)
+    _set_private(model, None)
+    return model
+
+
+# Slot setters of BaseModel, bound once as they are used for every model
+_new = object.__new__
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
@@ -0,0 +1,118 @@
+"""Parallel parsing of articles in a pool of worker processes."""
+
+import asyncio
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+
+from .config import ParseConfig
+from .models import Article
+from .parser import parse_article
+
+# Tiny document parsed by each worker on startup to load lxml and the parser
+_WARMUP_HTML = b"<html><body><article><p>warm</p></article></body></html>"
+
+
+class ParsePool:
+    """A warm pool of processes parsing article HTML in parallel.
+
+    Parsing is CPU-bound, so a batch parsed in one process is limited to one
+    core. The pool starts its workers up front and returns parsed articles in
+    the compact binary encoding, which is much cheaper to transfer than
+    pickled models.
+    """
+
+    def __init__(self, config: ParseConfig | None = None) -> None:
+        """Initialize the pool and start its workers.
+
+        Args:
+            config: Optional parse configuration
+        """
+        self.config = config or ParseConfig()
+        self.workers = self.config.workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_warm_up
+        )
+        # Workers are spawned on demand; submitting one task per worker
+        # starts them all now instead of during the first batch
+        for future in [self._executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def __enter__(self) -> "ParsePool":
+        """Enter the pool context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Shut the pool down."""
+        self.close()
+
+    def parse_many(
+        self, pages: Iterable[bytes | tuple[bytes, str | None]]
+    ) -> list[Article]:
+        """Parse many pages in parallel.
+
+        Args:
+            pages: Raw HTML of the pages, or pairs of raw HTML and the
+                encoding declared for it, e.g. in the ``Content-Type`` header
+
+        Returns:
+            Parsed articles, in the order of the pages
+        """
+        results = self._executor.map(
+            _parse_encoded, pages, chunksize=self.config.batch_size
+        )
+        return [Article.from_bytes(data) for data in results]
+
+    async def parse(self, html: bytes, encoding: str | None = None) -> Article:
+        """Parse one page in a worker without blocking the event loop.
+
+        Args:
+            html: Raw HTML of the page
+            encoding: Optional encoding declared for the page
+
+        Returns:
+            Structured Article object
+        """
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(
+            self._executor, _parse_encoded, (html, encoding)
+        )
+        return Article.from_bytes(data)
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown(cancel_futures=True)
+
+
+def parse_many(
+    pages: Iterable[bytes | tuple[bytes, str | None]], workers: int | None = None
+) -> list[Article]:
+    """Parse many pages in parallel in a temporary process pool.
+
+    Args:
+        pages: Raw HTML of the pages, or pairs of raw HTML and the encoding
+            declared for it
+        workers: Number of worker processes, defaulting to the CPU count
+
+    Returns:
+        Parsed articles, in the order of the pages
+    """
+    with ParsePool(ParseConfig(workers=workers)) as pool:
+        return pool.parse_many(pages)
+
+
+def _parse_encoded(page: bytes | tuple[bytes, str | None]) -> bytes:
+    """Parse a page, optionally paired with its encoding, and encode the result."""
+    html, encoding = page if isinstance(page, tuple) else (page, None)
+    return parse_article(html, encoding).to_bytes()
+
+
+def _warm_up() -> None:
+    """Load the parser in a new worker process."""
+    parse_article(_WARMUP_HTML)
@@ -1,25 +1,576 @@
 """HTML Parser for Medium articles."""
 
-from bs4 import BeautifulSoup
+import codecs
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from datetime import datetime
+from typing import Any
 
-from .models import Article
+from lxml import etree
 
+from ..utils.helpers import code_span_markers, escape_markdown, unescape_markdown
+from .models import Article, ContentBlock, ContentType, Section
+from .post_json import extract_apollo_state, parse_apollo_state
 
-def parse_article(html: str) -> Article:
+# Bump whenever a change to the parser changes the Articles it produces, so
+# cached parse results from older versions are no longer used
+PARSER_VERSION = 4
+
+# Elements that start a content block; anything nested inside one of them
+# belongs to that block
+BLOCK_TAGS = frozenset(
+    {"p", "h1", "h2", "h3", "h4", "h5", "h6", "pre", "blockquote", "figure"}
+    | {"ul", "ol", "img"}
+)
+
+_WHITESPACE = re.compile(r"[ \t\r\n\f\v]+")
+_READING_TIME = re.compile(r"(\d+)\s*min")
+_SRCSET_WIDTH = re.compile(r"\s+(\d+)w\s*$")
+
+# Pages declare their encoding with a <meta> tag near the start, if at all
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=", re.IGNORECASE)
+CHARSET_SNIFF_BYTES = 1024
+
+
+def parse_article(html: str | bytes, encoding: str | None = None) -> Article:
     """Parse a Medium article's HTML content.
 
+    Pages embedding the post model as ``window.__APOLLO_STATE__`` are mapped
+    from that JSON directly, without building an HTML tree. Otherwise the
+    document is parsed with lxml and only the ``<article>`` subtree is
+    walked, in a single pass, to build the content blocks.
+
+    Args:
+        html: The HTML content of the Medium article, as text or raw bytes
+        encoding: Optional encoding of raw bytes, e.g. the charset of the
+            HTTP response; see ``parse_html``
+
+    Returns:
+        Structured Article object
+    """
+    article = parse_embedded_state(html)
+    if article is not None:
+        return article
+    return parse_html(html, encoding)
+
+
+def parse_embedded_state(html: str | bytes) -> Article | None:
+    """Parse an article from the Apollo state embedded in its page.
+
+    Args:
+        html: The HTML content of the Medium article, as text or raw bytes
+
+    Returns:
+        Structured Article object, or None if the page embeds no post body
+    """
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    state = extract_apollo_state(html)
+    if state is None:
+        return None
+    return parse_apollo_state(state)
+
+
+def parse_html(html: str | bytes, encoding: str | None = None) -> Article:
+    """Parse a Medium article by walking its HTML tree.
+
+    The models are built without validation, as every value comes from the
+    parser itself.
+
     Args:
-        html: The HTML content of the Medium article
+        html: The HTML content of the Medium article, as text or raw bytes
+        encoding: Optional encoding of raw bytes, e.g. the charset of the
+            HTTP response. If omitted, the encoding declared by a ``<meta>``
+            tag is used, or UTF-8 if there is none
 
     Returns:
         Structured Article object
     """
-    BeautifulSoup(html, "lxml")
-    # Placeholder implementation
-    return Article(
-        title="Sample Article Title",
-        author="Sample Author",
-        date="2023-01-01",
-        content=[],
-        estimated_reading_time=5,
+    encoding = _encoding(html, encoding) if isinstance(html, bytes) else None
+    parser = etree.HTMLParser(remove_comments=True, encoding=encoding)
+    root = etree.fromstring(html, parser)
+    if root is None:
+        return Article.trusted(title="", author="", date="", content=[])
+
+    meta = parse_head(root.find("head"))
+    body = root.find("body")
+    article = None
+    if body is not None:
+        article = next(body.iter("article"), body)
+
+    builder = BlockBuilder(title=meta.get("title"))
+    content: list[Section | ContentBlock] = []
+    if article is not None:
+        for event, element in etree.iterwalk(article, events=("start", "end")):
+            block = builder.feed(event, element)
+            if block is not None:
+                content.append(block)
+
+    return Article.trusted(
+        title=meta.get("title") or builder.first_heading or "",
+        author=meta.get("author", ""),
+        date=meta.get("date", ""),
+        content=content,
+        estimated_reading_time=meta.get("reading_time"),
+        url=meta.get("url"),
+        tags=meta.get("tags", []),
     )
+
+
+def parse_head(head: Any) -> dict[str, Any]:
+    """Extract article metadata from the document ``<head>``.
+
+    Args:
+        head: The ``<head>`` element, or None
+
+    Returns:
+        Dict with any of title, author, date, reading_time, url and tags
+    """
+    meta: dict[str, Any] = {}
+    if head is None:
+        return meta
+
+    tags = []
+    for element in head:
+        tag = element.tag
+        if tag == "meta":
+            key = element.get("property") or element.get("name") or ""
+            value = (element.get("content") or element.get("value") or "").strip()
+            if not value:
+                continue
+            if key == "og:title":
+                meta["title"] = value
+            elif key == "author":
+                meta["author"] = value
+            elif key == "article:published_time":
+                meta["date"] = _parse_date(value)
+            elif key == "twitter:data1":
+                match = _READING_TIME.search(value)
+                if match:
+                    meta["reading_time"] = int(match.group(1))
+            elif key == "article:tag":
+                tags.append(value)
+        elif tag == "title" and "title" not in meta and element.text:
+            meta["title"] = element.text.split(" | ")[0].strip()
+        elif tag == "link" and element.get("rel") == "canonical":
+            meta["url"] = element.get("href")
+
+    if tags:
+        meta["tags"] = tags
+    return meta
+
+
+class BlockBuilder:
+    """Turn a stream of parser events into content blocks.
+
+    The builder consumes ``("start", element)`` and ``("end", element)``
+    events in document order and emits a block whenever a top-level block
+    element has been closed, so it works both over a complete tree and over
+    an incremental parser.
+    """
+
+    def __init__(self, title: str | None = None) -> None:
+        """Initialize the builder.
+
+        Args:
+            title: Optional article title; a heading repeating it is skipped
+        """
+        self.title = title.strip() if title else None
+        self.first_heading: str | None = None
+        self._block_root: Any = None
+
+    def feed(self, event: str, element: Any) -> ContentBlock | None:
+        """Process a parser event.
+
+        Args:
+            event: Either ``"start"`` or ``"end"``
+            element: The element the event refers to
+
+        Returns:
+            The finished content block, if the event closed one
+        """
+        if event == "start":
+            if self._block_root is None and element.tag in BLOCK_TAGS:
+                self._block_root = element
+            return None
+
+        if element is not self._block_root:
+            return None
+
+        self._block_root = None
+        return self._element_to_block(element)
+
+    @property
+    def in_block(self) -> bool:
+        """Whether the builder is currently inside a block element."""
+        return self._block_root is not None
+
+    def _element_to_block(self, element: Any) -> ContentBlock | None:
+        """Convert a closed block element into a content block."""
+        tag = element.tag
+
+        if tag == "p":
+            text = inline_text(element)
+            if not text:
+                return None
+            return ContentBlock.trusted(ContentType.TEXT, text)
+
+        if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+            text = inline_text(element, markup=False)
+            if not text:
+                return None
+            plain = unescape_markdown(text)
+            if self.first_heading is None:
+                self.first_heading = plain
+            if self.title is not None and plain == self.title:
+                return None
+            return ContentBlock.trusted(
+                ContentType.HEADING, text, {"level": int(tag[1])}
+            )
+
+        if tag == "pre":
+            return _code_block(element)
+
+        if tag == "blockquote":
+            text = inline_text(element)
+            if not text:
+                return None
+            return ContentBlock.trusted(ContentType.QUOTE, text)
+
+        if tag in ("figure", "img"):
+            return _image_block(element)
+
+        if tag in ("ul", "ol"):
+            items = [inline_text(li) for li in element if li.tag == "li"]
+            items = [item for item in items if item]
+            if not items:
+                return None
+            return ContentBlock.trusted(
+                ContentType.LIST,
+                "\n".join(items),
+                {"list_type": "ordered" if tag == "ol" else "unordered"},
+            )
+
+        return None
+
+
+class StreamingParser:
+    """Parse an article page incrementally as its bytes arrive.
+
+    Blocks are returned as soon as their closing tag has been fed, and the
+    elements they were built from are discarded, so memory use stays flat
+    however long the article is. Only the first ``<article>`` is kept, as in
+    ``parse_html``; blocks seen before it are held back until it is clear
+    whether the page has one. The embedded Apollo state is not used, as it
+    only arrives at the end of the page.
+    """
+
+    def __init__(self, encoding: str | None = None) -> None:
+        """Initialize the parser.
+
+        Args:
+            encoding: Optional encoding of the page, e.g. the charset of the
+                HTTP response. If omitted, the encoding declared by a
+                ``<meta>`` tag in the first chunk is used, or UTF-8 if there
+                is none
+        """
+        self.meta: dict[str, Any] = {}
+        self.encoding = encoding
+        self._parser: Any = None
+        self._builder = BlockBuilder()
+        self._in_head = False
+        self._article: Any = None
+        self._seen_article = False
+        self._pending: list[ContentBlock] = []
+
+    @property
+    def first_heading(self) -> str | None:
+        """The first heading seen, used when the page has no title."""
+        return self._builder.first_heading
+
+    def feed(self, data: bytes) -> list[ContentBlock]:
+        """Feed the next chunk of the page.
+
+        Args:
+            data: Raw bytes of the page
+
+        Returns:
+            The blocks completed by this chunk
+        """
+        if self._parser is None:
+            self._parser = self._create_parser(data)
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> list[ContentBlock]:
+        """Signal the end of the page.
+
+        Returns:
+            The remaining blocks
+        """
+        if self._parser is None:
+            self._parser = self._create_parser(b"")
+        try:
+            self._parser.close()
+        except etree.XMLSyntaxError:
+            # Raised for empty documents; there is nothing left to emit
+            pass
+        blocks = self._drain()
+        if not self._seen_article:
+            blocks = self._pending + blocks
+        self._pending = []
+        return blocks
+
+    def _create_parser(self, data: bytes) -> Any:
+        """Create the pull parser once the first chunk is known."""
+        self.encoding = _encoding(data, self.encoding)
+        return etree.HTMLPullParser(
+            events=("start", "end"), remove_comments=True, encoding=self.encoding
+        )
+
+    def _drain(self) -> list[ContentBlock]:
+        """Process the parser events read so far."""
+        blocks = []
+        for event, element in self._parser.read_events():
+            if not isinstance(element.tag, str):
+                continue
+
+            if event == "start":
+                if element.tag == "head":
+                    self._in_head = True
+                elif element.tag == "article" and not self._seen_article:
+                    self._article = element
+                    self._seen_article = True
+                    self._pending = []
+
+            block = self._builder.feed(event, element)
+            if block is not None:
+                if self._article is not None:
+                    blocks.append(block)
+                elif not self._seen_article:
+                    self._pending.append(block)
+
+            if event == "end":
+                if element.tag == "head":
+                    self._in_head = False
+                    self.meta = parse_head(element)
+                    title = self.meta.get("title")
+                    self._builder.title = title.strip() if title else None
+                if element is self._article:
+                    self._article = None
+                # Head elements are kept until the whole head has been read
+                if not self._builder.in_block and not self._in_head:
+                    _discard(element)
+        return blocks
+
+
+async def iter_blocks(
+    chunks: AsyncIterable[bytes], parser: StreamingParser | None = None
+) -> AsyncIterator[ContentBlock]:
+    """Parse an article page from a stream of bytes, block by block.
+
+    Args:
+        chunks: Chunks of the raw page, such as ``FetchSession.iter_bytes``
+        parser: Optional parser to use, e.g. to read its ``meta`` afterwards
+
+    Yields:
+        Content blocks as soon as their closing tags have arrived
+    """
+    parser = parser or StreamingParser()
+    async for chunk in chunks:
+        for block in parser.feed(chunk):
+            yield block
+    for block in parser.close():
+        yield block
+
+
+def inline_text(element: Any, markup: bool = True) -> str:
+    """Get an element's text, rendering inline formatting as Markdown.
+
+    Literal Markdown characters in the text are backslash-escaped, so they
+    are not read back as formatting.
+
+    Args:
+        element: The element to convert
+        markup: Whether to render bold, italic, code and links
+
+    Returns:
+        Text with whitespace collapsed and inline Markdown applied
+    """
+    parts: list[str] = []
+    _collect_inline(element, parts, markup, True)
+    # Only explicit breaks survive as newlines; text whitespace is collapsed
+    lines = (line.strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _collect_inline(element: Any, parts: list[str], markup: bool, escape: bool) -> None:
+    """Append the inline rendering of an element's contents to ``parts``."""
+    if element.text:
+        parts.append(_literal(element.text, escape))
+
+    for child in element:
+        tag = child.tag
+        if tag == "br":
+            parts.append("\n")
+        elif not isinstance(tag, str):
+            # Comments and processing instructions
+            pass
+        elif markup and tag in ("strong", "b", "em", "i", "code"):
+            inner: list[str] = []
+            if tag == "code":
+                # Code spans are taken literally
+                _collect_inline(child, inner, False, False)
+            else:
+                _collect_inline(child, inner, markup, escape)
+            text = "".join(inner)
+            if text.strip():
+                # Keep surrounding whitespace outside the markers
+                stripped = text.strip()
+                lead = text[: len(text) - len(text.lstrip())]
+                trail = text[len(text.rstrip()) :]
+                if tag == "code":
+                    opening, closing = code_span_markers(stripped)
+                else:
+                    opening = closing = "**" if tag in ("strong", "b") else "*"
+                parts.append(f"{lead}{opening}{stripped}{closing}{trail}")
+        elif markup and tag == "a" and child.get("href"):
+            inner = []
+            _collect_inline(child, inner, markup, escape)
+            parts.append(f"[{''.join(inner).strip()}]({child.get('href')})")
+        else:
+            _collect_inline(child, parts, markup, escape)
+            if tag in ("p", "div", "li"):
+                parts.append("\n")
+
+        if child.tail:
+            parts.append(_literal(child.tail, escape))
+
+
+def _literal(text: str, escape: bool) -> str:
+    """Collapse the whitespace of literal text and escape it if requested."""
+    text = _WHITESPACE.sub(" ", text)
+    return escape_markdown(text) if escape else text
+
+
+def _encoding(html: bytes, declared: str | None) -> str | None:
+    """Get the encoding to decode a page with.
+
+    Args:
+        html: The raw page, or its first chunk
+        declared: The encoding declared outside the page, if any
+
+    Returns:
+        The declared encoding if it is known, otherwise None if the start of
+        the page declares one in a ``<meta>`` tag, which lxml then honours,
+        and UTF-8 if it does not
+    """
+    if declared:
+        try:
+            # lxml only knows the canonical names of some encodings
+            return codecs.lookup(declared).name
+        except LookupError:
+            pass
+    if _META_CHARSET.search(html, 0, CHARSET_SNIFF_BYTES):
+        return None
+    return "utf-8"
+
+
+def _discard(element: Any) -> None:
+    """Free a processed element and the already processed siblings before it."""
+    element.clear(keep_tail=True)
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def _code_block(element: Any) -> ContentBlock:
+    """Build a code block from a ``<pre>`` element, keeping whitespace."""
+    parts: list[str] = []
+    for node in _iter_code_text(element):
+        parts.append(node)
+
+    language = element.get("data-code-block-lang") or ""
+    if not language:
+        for candidate in (element, element.find("code")):
+            if candidate is None:
+                continue
+            for cls in (candidate.get("class") or "").split():
+                if cls.startswith(("language-", "lang-")):
+                    language = cls.split("-", 1)[1]
+                    break
+
+    return ContentBlock.trusted(
+        ContentType.CODE,
+        "".join(parts).strip("\n"),
+        {"language": language} if language else None,
+    )
+
+
+def _iter_code_text(element: Any) -> Iterator[str]:
+    """Yield the text of a code element, turning ``<br>`` into newlines."""
+    if element.text:
+        yield element.text
+    for child in element:
+        if child.tag == "br":
+            yield "\n"
+        elif isinstance(child.tag, str):
+            yield from _iter_code_text(child)
+        if child.tail:
+            yield child.tail
+
+
+def _image_block(element: Any) -> ContentBlock | None:
+    """Build an image block from a ``<figure>`` or ``<img>`` element."""
+    img = element if element.tag == "img" else next(element.iter("img"), None)
+    if img is None:
+        return None
+
+    src = img.get("src") or ""
+    if not src:
+        src = _largest_source(img.get("srcset") or "")
+        for source in element.iter("source"):
+            src = src or _largest_source(source.get("srcset") or "")
+    if not src:
+        return None
+
+    caption = None
+    if element.tag == "figure":
+        figcaption = next(element.iter("figcaption"), None)
+        if figcaption is not None:
+            caption = inline_text(figcaption) or None
+
+    alt = unescape_markdown(caption) if caption else img.get("alt")
+    metadata: dict[str, Any] = {"alt": alt or ""}
+    if caption:
+        metadata["caption"] = caption
+    for key in ("width", "height"):
+        value = img.get(key) or ""
+        if value.isdigit():
+            metadata[key] = int(value)
+
+    return ContentBlock.trusted(ContentType.IMAGE, src, metadata)
+
+
+def _largest_source(srcset: str) -> str:
+    """Pick the widest candidate from a ``srcset`` attribute."""
+    best, best_width = "", -1
+    for candidate in srcset.split(","):
+        candidate = candidate.strip()
+        if not candidate:
+            continue
+        match = _SRCSET_WIDTH.search(candidate)
+        width = int(match.group(1)) if match else 0
+        url = candidate[: match.start()] if match else candidate.split()[0]
+        if width > best_width:
+            best, best_width = url.strip(), width
+    return best
+
+
+def _parse_date(value: str) -> str | datetime:
+    """Parse an ISO 8601 date, keeping the original string if invalid."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
@@ -0,0 +1,461 @@
+"""Parsing of Medium's structured post data into Articles."""
+
+import json
+import math
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from ..utils.helpers import (
+    code_span_markers,
+    escape_markdown,
+    strip_tracking_params,
+)
+from .models import Article, ContentBlock, ContentType
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Medium prefixes its JSON responses with this guard against JSON hijacking
+JSON_PREFIX = b"])}while(1);</x>"
+
+# Script assignment holding the normalized post model embedded in pages
+APOLLO_STATE_MARKER = b"window.__APOLLO_STATE__"
+
+# Root query fields of the Apollo state referencing the page's main post
+ROOT_POST_FIELDS = ("postResult(", "post(")
+
+IMAGE_URL_TEMPLATE = "https://miro.medium.com/v2/resize:fit:1400/{id}"
+
+# Paragraph type codes used by the ``?format=json`` payload
+PARAGRAPH_TYPES = {
+    1: "P",
+    2: "H2",
+    3: "H3",
+    4: "IMG",
+    6: "BQ",
+    7: "PQ",
+    8: "PRE",
+    9: "ULI",
+    10: "OLI",
+    11: "IFRAME",
+    13: "H4",
+    14: "MIXTAPE_EMBED",
+}
+
+# Markup type codes used by the ``?format=json`` payload
+MARKUP_TYPES = {1: "STRONG", 2: "EM", 3: "A", 10: "CODE"}
+
+HEADING_LEVELS = {"H1": 1, "H2": 2, "H3": 2, "H4": 3}
+LIST_TYPES = {"ULI": "unordered", "OLI": "ordered"}
+
+
+class PostDataError(ValueError):
+    """Raised when structured post data is missing or malformed."""
+
+
+def post_json_url(url: str) -> str:
+    """Get the URL of an article's structured JSON representation.
+
+    Args:
+        url: The URL of the Medium article
+
+    Returns:
+        URL requesting the ``format=json`` representation, keeping the query
+        parameters other than tracking ones, such as the ``sk`` token of
+        friend links
+    """
+    parsed = urlparse(strip_tracking_params(url))
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key != "format"
+    ]
+    query.append(("format", "json"))
+    return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+def parse_post_json(data: str | bytes) -> Article:
+    """Parse a Medium ``?format=json`` response into an Article.
+
+    Args:
+        data: The raw response body
+
+    Returns:
+        Structured Article object
+
+    Raises:
+        PostDataError: If the payload does not contain a post with a body,
+            e.g. for member-only previews or collection and user payloads
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    data = data.lstrip()
+    if data.startswith(JSON_PREFIX):
+        data = data[len(JSON_PREFIX) :]
+
+    try:
+        payload = loads_json(data)["payload"]
+        post = payload["value"]
+    except (ValueError, KeyError, TypeError) as err:
+        raise PostDataError("Response does not contain Medium post data") from err
+    if not isinstance(payload, dict) or not isinstance(post, dict):
+        raise PostDataError("Response does not contain Medium post data")
+
+    paragraphs = post.get("content", {}).get("bodyModel", {}).get("paragraphs")
+    if not paragraphs:
+        raise PostDataError("Post data does not contain the article body")
+
+    users = payload.get("references", {}).get("User", {})
+    author = users.get(post.get("creatorId"), {}).get("name", "")
+    virtuals = post.get("virtuals", {})
+
+    return Article(
+        title=post.get("title", ""),
+        author=author,
+        date=_timestamp_to_datetime(post.get("firstPublishedAt")),
+        content=list(paragraphs_to_blocks(paragraphs, title=post.get("title"))),
+        estimated_reading_time=_reading_time(virtuals.get("readingTime")),
+        url=post.get("mediumUrl") or post.get("canonicalUrl") or None,
+        tags=[tag["name"] for tag in virtuals.get("tags", []) if tag.get("name")],
+    )
+
+
+def extract_apollo_state(html: bytes) -> dict[str, Any] | None:
+    """Locate and decode the Apollo state blob embedded in a Medium page.
+
+    The blob is found with a plain byte search, so no HTML tree is built.
+
+    Args:
+        html: The raw HTML of the page
+
+    Returns:
+        The decoded state, or None if the page does not embed one
+    """
+    marker = html.find(APOLLO_STATE_MARKER)
+    if marker == -1:
+        return None
+
+    start = html.find(b"{", marker + len(APOLLO_STATE_MARKER))
+    end = html.find(b"</script>", start)
+    if start == -1 or end == -1:
+        return None
+
+    blob = html[start:end].rstrip().rstrip(b";")
+    try:
+        state = loads_json(blob)
+    except ValueError:
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def parse_apollo_state(state: Mapping[str, Any]) -> Article | None:
+    """Map an Apollo state blob to an Article.
+
+    The page's main post is looked up through the root query; other posts,
+    such as recommendations, are only used if it has no body.
+
+    Args:
+        state: The decoded Apollo state
+
+    Returns:
+        Structured Article object, or None if the state holds no post body
+    """
+    for post in _posts(state):
+        content = next(
+            (value for key, value in post.items() if key.startswith("content")), None
+        )
+        body = _resolve(content, state).get("bodyModel") if content else None
+        if body and body.get("paragraphs"):
+            return _apollo_article(post, body, state)
+    return None
+
+
+def _posts(state: Mapping[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield the main post of an Apollo state first, then every other post."""
+    root = state.get("ROOT_QUERY")
+    if isinstance(root, dict):
+        for key, value in root.items():
+            if key.startswith(ROOT_POST_FIELDS) and isinstance(value, dict):
+                ref = value.get("__ref")
+                post = state.get(ref) if isinstance(ref, str) else None
+                if isinstance(post, dict):
+                    yield post
+
+    for key, value in state.items():
+        if key.startswith("Post:") and isinstance(value, dict) and "title" in value:
+            yield value
+
+
+def _apollo_article(
+    post: Mapping[str, Any], body: Mapping[str, Any], state: Mapping[str, Any]
+) -> Article:
+    """Build an Article from an Apollo post record and its resolved body."""
+    paragraphs = [_resolve(paragraph, state) for paragraph in body["paragraphs"]]
+    creator = _resolve(post.get("creator"), state)
+    tags = [_resolve(tag, state) for tag in post.get("tags") or []]
+
+    return Article(
+        title=post.get("title") or "",
+        author=creator.get("name") or "",
+        date=_timestamp_to_datetime(post.get("firstPublishedAt")),
+        content=list(paragraphs_to_blocks(paragraphs, title=post.get("title"))),
+        estimated_reading_time=_reading_time(post.get("readingTime")),
+        url=post.get("mediumUrl") or None,
+        tags=[
+            tag.get("displayTitle") or tag.get("id", "")
+            for tag in tags
+            if tag.get("displayTitle") or tag.get("id")
+        ],
+    )
+
+
+def loads_json(data: bytes) -> Any:
+    """Decode JSON, using orjson when it is installed.
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        The decoded value
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _resolve(value: Any, state: Mapping[str, Any]) -> dict[str, Any]:
+    """Follow ``{"__ref": key}`` references, resolving nested ones too."""
+    if not isinstance(value, dict):
+        return {}
+    if "__ref" in value:
+        value = state.get(value["__ref"])
+        if not isinstance(value, dict):
+            return {}
+    return {
+        key: (
+            _resolve(item, state)
+            if isinstance(item, dict) and "__ref" in item
+            else item
+        )
+        for key, item in value.items()
+    }
+
+
+def paragraphs_to_blocks(
+    paragraphs: Iterable[Mapping[str, Any]], title: str | None = None
+) -> Iterable[ContentBlock]:
+    """Convert Medium paragraph records into content blocks.
+
+    Paragraph and markup types may be given either as the numeric codes of
+    the JSON payload or as the names used by the embedded page state.
+    Consecutive list items are grouped into a single list block.
+
+    Args:
+        paragraphs: Medium paragraph records
+        title: Optional article title; a paragraph repeating it is skipped
+
+    Yields:
+        Content blocks in document order
+    """
+    list_items: list[str] = []
+    list_type = ""
+
+    for paragraph in paragraphs:
+        kind = _name(paragraph.get("type"), PARAGRAPH_TYPES)
+        text = paragraph.get("text") or ""
+
+        if kind in LIST_TYPES:
+            if list_items and LIST_TYPES[kind] != list_type:
+                yield _list_block(list_items, list_type)
+                list_items = []
+            list_type = LIST_TYPES[kind]
+            list_items.append(apply_markups(text, paragraph.get("markups") or []))
+            continue
+
+        if list_items:
+            yield _list_block(list_items, list_type)
+            list_items = []
+
+        block = _paragraph_to_block(kind, text, paragraph, title)
+        if block is not None:
+            yield block
+
+    if list_items:
+        yield _list_block(list_items, list_type)
+
+
+def apply_markups(text: str, markups: Iterable[Mapping[str, Any]]) -> str:
+    """Render Medium inline markups as inline Markdown.
+
+    Literal Markdown characters outside code spans are backslash-escaped,
+    so they are not read back as formatting. Markups sharing a position are
+    nested, so the one opened last is closed first.
+
+    Args:
+        text: The plain paragraph text
+        markups: Markup records with ``type``, ``start``, ``end`` and ``href``,
+            whose offsets count UTF-16 code units as in JavaScript
+
+    Returns:
+        Text with bold, italic, code and link markup applied
+    """
+    index = _utf16_index(text)
+    # (position, order, nesting, marker, change in code span depth): closing
+    # markers sort before opening ones, outer openers before inner ones and
+    # inner closers before outer ones
+    inserts: list[tuple[int, int, tuple[int, int], str, int]] = []
+    for number, markup in enumerate(markups):
+        kind = _name(markup.get("type"), MARKUP_TYPES)
+        start, end = index(markup.get("start", 0)), index(markup.get("end", 0))
+        if start >= end:
+            continue
+
+        if kind == "STRONG":
+            opening, closing = "**", "**"
+        elif kind == "EM":
+            opening, closing = "*", "*"
+        elif kind == "CODE":
+            opening, closing = code_span_markers(text[start:end])
+        elif kind == "A" and markup.get("href"):
+            opening, closing = "[", f"]({markup['href']})"
+        else:
+            continue
+        code = 1 if kind == "CODE" else 0
+        inserts.append((start, 1, (-end, number), opening, code))
+        inserts.append((end, 0, (-start, -number), closing, -code))
+
+    if not inserts:
+        return escape_markdown(text)
+
+    parts = []
+    position = 0
+    code_depth = 0
+    for insert_at, _, _, marker, code in sorted(inserts, key=lambda item: item[:3]):
+        segment = text[position:insert_at]
+        # Code spans are taken literally
+        parts.append(segment if code_depth else escape_markdown(segment))
+        parts.append(marker)
+        code_depth += code
+        position = insert_at
+    segment = text[position:]
+    parts.append(segment if code_depth else escape_markdown(segment))
+    return "".join(parts)
+
+
+def _utf16_index(text: str) -> Callable[[int], int]:
+    """Map UTF-16 offsets into a text to indices of its characters.
+
+    Args:
+        text: The text the offsets refer to
+
+    Returns:
+        Function converting an offset to an index, clamped to the text
+    """
+    if text.isascii() or all(ord(char) <= 0xFFFF for char in text):
+        return lambda offset: max(0, min(offset, len(text)))
+
+    # Characters outside the BMP take two code units
+    indices = []
+    for position, char in enumerate(text):
+        indices.append(position)
+        if ord(char) > 0xFFFF:
+            indices.append(position + 1)
+    indices.append(len(text))
+    return lambda offset: indices[max(0, min(offset, len(indices) - 1))]
+
+
+def _paragraph_to_block(
+    kind: str, text: str, paragraph: Mapping[str, Any], title: str | None
+) -> ContentBlock | None:
+    """Convert a single non-list paragraph into a content block."""
+    markups = paragraph.get("markups") or []
+
+    if kind in HEADING_LEVELS:
+        if title and text.strip() == title.strip():
+            return None
+        return ContentBlock(
+            type=ContentType.HEADING,
+            content=escape_markdown(text),
+            metadata={"level": HEADING_LEVELS[kind]},
+        )
+
+    if kind == "IMG":
+        image = paragraph.get("metadata") or {}
+        if not image.get("id"):
+            return None
+        metadata: dict[str, Any] = {"alt": text or image.get("alt") or ""}
+        if text:
+            metadata["caption"] = escape_markdown(text)
+        for key in ("width", "height"):
+            if image.get(f"original{key.title()}"):
+                metadata[key] = image[f"original{key.title()}"]
+        return ContentBlock(
+            type=ContentType.IMAGE,
+            content=IMAGE_URL_TEMPLATE.format(id=image["id"]),
+            metadata=metadata,
+        )
+
+    if kind == "PRE":
+        code_metadata = paragraph.get("codeBlockMetadata") or {}
+        language = code_metadata.get("lang") or ""
+        return ContentBlock(
+            type=ContentType.CODE,
+            content=text,
+            metadata={"language": language} if language else {},
+        )
+
+    if kind in ("BQ", "PQ"):
+        return ContentBlock(
+            type=ContentType.QUOTE, content=apply_markups(text, markups)
+        )
+
+    if kind == "MIXTAPE_EMBED":
+        href = (paragraph.get("mixtapeMetadata") or {}).get("href")
+        content = (
+            f"[{escape_markdown(text)}]({href})" if href else escape_markdown(text)
+        )
+        return ContentBlock(type=ContentType.TEXT, content=content)
+
+    if kind == "IFRAME" or not text:
+        return None
+
+    return ContentBlock(type=ContentType.TEXT, content=apply_markups(text, markups))
+
+
+def _list_block(items: list[str], list_type: str) -> ContentBlock:
+    """Build a list block from its items."""
+    return ContentBlock(
+        type=ContentType.LIST,
+        content="\n".join(items),
+        metadata={"list_type": list_type},
+    )
+
+
+def _name(kind: Any, codes: Mapping[int, str]) -> str:
+    """Normalize a numeric or named Medium type to its name."""
+    if isinstance(kind, int):
+        return codes.get(kind, "")
+    return str(kind or "").upper()
+
+
+def _timestamp_to_datetime(timestamp: Any) -> str | datetime:
+    """Convert a millisecond timestamp to a datetime."""
+    if not isinstance(timestamp, int | float) or timestamp <= 0:
+        return ""
+    return datetime.fromtimestamp(timestamp / 1000, tz=UTC)
+
+
+def _reading_time(minutes: Any) -> int | None:
+    """Round a fractional reading time up to whole minutes."""
+    if not isinstance(minutes, int | float) or minutes <= 0:
+        return None
+    return math.ceil(minutes)
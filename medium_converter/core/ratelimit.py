@@ -0,0 +1,182 @@
+"""Per-host rate limiting with adaptive concurrency."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from .config import RateLimitConfig
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Delay in seconds, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class HostLimiter:
+    """Token bucket and AIMD concurrency limit for a single host.
+
+    Requests are admitted while fewer than ``limit`` are in flight and a
+    token is available. The limit grows by one after a full window of
+    successful responses and is multiplied by ``backoff_factor`` whenever
+    the host responds with a throttling status.
+    """
+
+    def __init__(self, config: RateLimitConfig) -> None:
+        """Initialize the host limiter.
+
+        Args:
+            config: Rate limit configuration
+        """
+        self.config = config
+        self.limit = float(config.initial_concurrency)
+        self.in_flight = 0
+        self.tokens = float(config.burst)
+        self.blocked_until = 0.0
+        self._successes = 0
+        self._updated = time.monotonic()
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot and a rate limit token."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+        try:
+            await self._take_token()
+        except BaseException:
+            await self.release()
+            raise
+
+    async def release(self) -> None:
+        """Release a concurrency slot."""
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    async def _take_token(self) -> None:
+        """Wait until the host is not blocked and a token is available."""
+        rate = self.config.requests_per_second
+        while True:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                await asyncio.sleep(self.blocked_until - now)
+                continue
+
+            self.tokens = min(
+                float(self.config.burst), self.tokens + (now - self._updated) * rate
+            )
+            self._updated = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return
+
+            await asyncio.sleep((1.0 - self.tokens) / rate)
+
+    def record(self, status_code: int, retry_after: float | None = None) -> None:
+        """Adapt the concurrency limit to a response.
+
+        Args:
+            status_code: HTTP status code of the response
+            retry_after: Optional delay requested by the server, in seconds
+        """
+        config = self.config
+        if status_code in THROTTLE_STATUS_CODES:
+            self.limit = max(
+                float(config.min_concurrency), self.limit * config.backoff_factor
+            )
+            self._successes = 0
+            delay = config.default_retry_after if retry_after is None else retry_after
+            delay = min(delay, config.max_retry_after)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+            # Drop any burst credit so requests resume at the steady rate
+            self.tokens = 0.0
+            return
+
+        self._successes += 1
+        if self._successes >= int(self.limit):
+            self.limit = min(float(config.max_concurrency), self.limit + 1.0)
+            self._successes = 0
+
+
+class HostRateLimiter:
+    """Rate limiter that keeps an independent :class:`HostLimiter` per host."""
+
+    def __init__(self, config: RateLimitConfig | None = None) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            config: Optional rate limit configuration
+        """
+        self.config = config or RateLimitConfig()
+        self._hosts: dict[str, HostLimiter] = {}
+
+    def host(self, host: str) -> HostLimiter:
+        """Get the limiter for a host, creating it on first use.
+
+        Args:
+            host: The host name
+
+        Returns:
+            The host's limiter
+        """
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            limiter = self._hosts[host] = HostLimiter(self.config)
+        return limiter
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[HostLimiter]:
+        """Hold a request slot for a host.
+
+        Args:
+            host: The host name
+
+        Yields:
+            The host's limiter, to record the response with
+        """
+        limiter = self.host(host)
+        await limiter.acquire()
+        try:
+            yield limiter
+        finally:
+            await limiter.release()
+
+    @staticmethod
+    def is_throttled(response: httpx.Response) -> bool:
+        """Check whether a response asks the client to slow down.
+
+        Args:
+            response: The HTTP response
+
+        Returns:
+            True for throttling status codes
+        """
+        return response.status_code in THROTTLE_STATUS_CODES
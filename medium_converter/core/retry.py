@@ -0,0 +1,97 @@
+"""Retry and hedging helpers for the fetcher."""
+
+import random
+from collections import deque
+
+import httpx
+
+from .config import RetryPolicy
+from .ratelimit import THROTTLE_STATUS_CODES, parse_retry_after
+
+
+def is_retryable(
+    policy: RetryPolicy, error: Exception, throttle_handled: bool = False
+) -> bool:
+    """Check whether a failed attempt should be retried.
+
+    Transport errors (connection resets, read timeouts, ...), per-attempt
+    timeouts and responses with a retryable status code are retried.
+
+    Args:
+        policy: The retry policy
+        error: The error raised by the attempt
+        throttle_handled: Whether throttling responses have already been
+            retried by a rate limiter, so they are not retried again
+
+    Returns:
+        True if the attempt should be retried
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        if throttle_handled and status_code in THROTTLE_STATUS_CODES:
+            return False
+        return status_code in policy.retry_statuses
+    return isinstance(error, httpx.TransportError | TimeoutError)
+
+
+def backoff_delay(policy: RetryPolicy, attempt: int, error: Exception) -> float:
+    """Compute the delay before the next attempt.
+
+    Uses capped exponential backoff with full jitter, and never waits less
+    than a server-provided ``Retry-After`` delay.
+
+    Args:
+        policy: The retry policy
+        attempt: Number of the attempt that just failed, starting at 1
+        error: The error raised by the attempt
+
+    Returns:
+        Delay in seconds
+    """
+    delay = min(policy.backoff_max, policy.backoff_base * 2.0 ** (attempt - 1))
+    if policy.jitter:
+        delay = random.uniform(0.0, delay)
+
+    if isinstance(error, httpx.HTTPStatusError):
+        retry_after = parse_retry_after(error.response.headers.get("Retry-After"))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, policy.backoff_max))
+    return delay
+
+
+class LatencyTracker:
+    """Sliding window of recent request latencies."""
+
+    def __init__(self, window: int) -> None:
+        """Initialize the tracker.
+
+        Args:
+            window: Number of most recent samples to keep
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        """Record a latency sample.
+
+        Args:
+            latency: Request latency in seconds
+        """
+        self._samples.append(latency)
+
+    def quantile(self, q: float) -> float:
+        """Return a latency quantile of the current window.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Latency in seconds, or 0.0 without samples
+        """
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
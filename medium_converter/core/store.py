@@ -0,0 +1,443 @@
+"""Columnar in-memory and memory-mapped storage for many articles."""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal
+
+from .codec import CONTENT_TYPES
+from .models import Article, ContentBlock, ContentType, Section
+
+MAGIC = b"MCS"
+VERSION = 1
+
+# Magic, version, article count, block count and sizes of the text and the
+# JSON side table, padded to keep the offsets that follow 8-byte aligned.
+# The header is followed by the text offsets, metadata ids, content types,
+# text and the JSON side table.
+_HEADER = struct.Struct("<3sBQQQQ4x")
+
+_CONTENT_TYPE_INDEX = {content_type: i for i, content_type in enumerate(CONTENT_TYPES)}
+
+# Kinds of the article date, which is either a datetime or unparsed text
+_DATE_TEXT = 0
+_DATE_DATETIME = 1
+
+
+class StoreError(ValueError):
+    """Raised when a store file is invalid or a read-only store is modified."""
+
+
+class ArticleStore(Sequence[Article]):
+    """A compact, columnar store for large numbers of articles.
+
+    Instead of one model per block, the store keeps the content types of all
+    blocks in a byte array, their texts in one contiguous UTF-8 buffer with
+    an array of offsets, and metadata in a side table of distinct values
+    referenced by index, so that the many identical dicts such as
+    ``{"level": 2}`` are stored once. Articles are materialized as models
+    only when indexed.
+
+    A store can be saved to a file and reopened memory-mapped, in which case
+    block texts are read from the page cache on demand and the store is
+    read-only.
+
+    Example:
+        store = ArticleStore()
+        for article in articles:
+            store.add(article)
+        store.save("archive.mcs")
+
+        with ArticleStore.open("archive.mcs") as archive:
+            matches = archive.find("asyncio")
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, writable store."""
+        # Per article: title, author, date kind, date, reading time, url,
+        # tags, number of content items and sections as [index, title, count]
+        self._articles: list[list[Any]] = []
+        # Index of each article's first block, plus the total block count
+        self._starts = array("Q", [0])
+        self._types: Any = bytearray()
+        # Byte offset of each block's text, plus the end of the buffer
+        self._offsets: Any = array("Q", [0])
+        self._text: Any = bytearray()
+        # Per block: 1 + index of its metadata in the table, or 0 for none
+        self._metadata_ids: Any = array("I")
+        self._metadata: list[dict[str, Any]] = []
+        self._metadata_index: dict[str, int] = {}
+        self._mmap: mmap.mmap | None = None
+
+    @classmethod
+    def open(cls, path: str | Path) -> "ArticleStore":
+        """Open a saved store, memory-mapping its columns.
+
+        Args:
+            path: Path of a file written by ``save``
+
+        Returns:
+            A read-only store backed by the file
+
+        Raises:
+            StoreError: If the file is not a store in a supported version, or
+                is truncated or corrupt
+        """
+        with open(path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as err:
+                # Raised for empty files, which cannot be mapped
+                raise StoreError(f"{path} is not an article store") from err
+
+        try:
+            magic, version, articles, blocks, text_size, table_size = (
+                _HEADER.unpack_from(mapped)
+            )
+        except struct.error as err:
+            mapped.close()
+            raise StoreError(f"{path} is not an article store") from err
+        if magic != MAGIC or version != VERSION:
+            mapped.close()
+            raise StoreError(f"{path} is not an article store in version {VERSION}")
+
+        offsets_size = (blocks + 1) * 8
+        table_start = _HEADER.size + offsets_size + blocks * 5 + text_size
+        try:
+            # Read before any views are taken, so the mapping can be closed
+            if table_start + table_size > len(mapped):
+                raise ValueError("file is shorter than its header declares")
+            table = json.loads(mapped[table_start : table_start + table_size])
+            table_articles = table["articles"]
+            table_metadata = table["metadata"]
+            table_starts = array("Q", table["starts"])
+        except (ValueError, KeyError, TypeError, OverflowError) as err:
+            mapped.close()
+            raise StoreError(f"{path} is truncated or corrupt") from err
+
+        view = memoryview(mapped)
+        position = _HEADER.size
+        offsets = _column(view[position : position + offsets_size], "Q")
+        position += offsets_size
+        metadata_ids = _column(view[position : position + blocks * 4], "I")
+        position += blocks * 4
+        types = view[position : position + blocks]
+        position += blocks
+        text = view[position : position + text_size]
+
+        store = cls()
+        store._mmap = mapped
+        store._offsets = offsets
+        store._metadata_ids = metadata_ids
+        store._types = types
+        store._text = text
+        store._articles = table_articles
+        store._metadata = table_metadata
+        store._starts = table_starts
+        if len(store._articles) != articles:
+            store.close()
+            raise StoreError(f"{path} is truncated or corrupt")
+        return store
+
+    def __enter__(self) -> "ArticleStore":
+        """Enter the store context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the store."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of articles in the store."""
+        return len(self._articles)
+
+    def __getitem__(self, index: Any) -> Any:
+        """Materialize the article (or list of articles) at an index."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("article index out of range")
+        return self._materialize(index)
+
+    def __iter__(self) -> Iterator[Article]:
+        """Iterate over the articles, materializing them one at a time."""
+        for index in range(len(self)):
+            yield self._materialize(index)
+
+    @property
+    def block_count(self) -> int:
+        """The total number of blocks in the store."""
+        return len(self._types)
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the store is backed by a memory-mapped file."""
+        return self._mmap is not None
+
+    def add(self, article: Article) -> int:
+        """Append an article to the store.
+
+        Args:
+            article: The article to add
+
+        Returns:
+            The index of the article in the store
+
+        Raises:
+            StoreError: If the store is read-only
+        """
+        if self.read_only:
+            raise StoreError("Memory-mapped stores are read-only")
+
+        sections = []
+        for item_index, item in enumerate(article.content):
+            if isinstance(item, Section):
+                sections.append([item_index, item.title, len(item.blocks)])
+                for block in item.blocks:
+                    self._add_block(block)
+            else:
+                self._add_block(item)
+
+        date = article.date
+        self._articles.append(
+            [
+                article.title,
+                article.author,
+                _DATE_DATETIME if isinstance(date, datetime) else _DATE_TEXT,
+                date.isoformat() if isinstance(date, datetime) else date,
+                article.estimated_reading_time,
+                article.url,
+                list(article.tags),
+                len(article.content),
+                sections,
+            ]
+        )
+        self._starts.append(len(self._types))
+        return len(self._articles) - 1
+
+    def title(self, index: int) -> str:
+        """Get an article's title without materializing it.
+
+        Args:
+            index: Index of the article
+
+        Returns:
+            The article title
+        """
+        return str(self._articles[index][0])
+
+    def block_text(self, block: int) -> str:
+        """Get the text of a block by its index in the store.
+
+        Args:
+            block: Index of the block across all articles
+
+        Returns:
+            The block content
+        """
+        start, end = self._offsets[block], self._offsets[block + 1]
+        return bytes(self._text[start:end]).decode("utf-8")
+
+    def iter_blocks(
+        self, content_type: ContentType | None = None
+    ) -> Iterator[tuple[int, str]]:
+        """Scan the blocks of all articles without materializing them.
+
+        Args:
+            content_type: Optional content type to restrict the scan to
+
+        Yields:
+            Tuples of article index and block content
+        """
+        wanted = None if content_type is None else _CONTENT_TYPE_INDEX[content_type]
+        article = 0
+        for block, type_index in enumerate(self._types):
+            while self._starts[article + 1] <= block:
+                article += 1
+            if wanted is None or type_index == wanted:
+                yield article, self.block_text(block)
+
+    def find(self, text: str) -> list[int]:
+        """Find the articles whose block content contains some text.
+
+        The raw UTF-8 buffer is searched directly, without decoding it.
+
+        Args:
+            text: The text to look for
+
+        Returns:
+            Indices of the matching articles, in order
+        """
+        needle = text.encode("utf-8")
+        if not needle:
+            return list(range(len(self)))
+
+        buffer = self._text
+        if isinstance(buffer, memoryview):
+            # mmap.find searches the mapped file without copying it
+            assert self._mmap is not None
+            base = self._buffer_start()
+            haystack: Any = self._mmap
+            end = base + len(buffer)
+        else:
+            base, haystack, end = 0, buffer, len(buffer)
+
+        found: list[int] = []
+        position = haystack.find(needle, base, end)
+        while position != -1:
+            block = bisect_right(self._offsets, position - base) - 1
+            # A match spanning two blocks is not a match in either
+            if position - base + len(needle) <= self._offsets[block + 1]:
+                article = bisect_right(self._starts, block) - 1
+                if not found or found[-1] != article:
+                    found.append(article)
+                # Continue after this article's text
+                next_start = self._offsets[self._starts[article + 1]] + base
+                position = haystack.find(needle, next_start, end)
+            else:
+                position = haystack.find(needle, position + 1, end)
+        return found
+
+    def save(self, path: str | Path) -> None:
+        """Write the store to a file that ``open`` can memory-map.
+
+        Args:
+            path: Destination path
+        """
+        offsets = array("Q", self._offsets)
+        metadata_ids = array("I", self._metadata_ids)
+        if sys.byteorder != "little":
+            offsets.byteswap()
+            metadata_ids.byteswap()
+        table = json.dumps(
+            {
+                "articles": self._articles,
+                "starts": list(self._starts),
+                "metadata": self._metadata,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        with open(path, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    len(self._articles),
+                    len(self._types),
+                    len(self._text),
+                    len(table),
+                )
+            )
+            f.write(offsets.tobytes())
+            f.write(metadata_ids.tobytes())
+            f.write(self._types)
+            f.write(self._text)
+            f.write(table)
+
+    def close(self) -> None:
+        """Release the memory-mapped file, if any."""
+        if self._mmap is not None:
+            for view in (self._offsets, self._metadata_ids, self._types, self._text):
+                if isinstance(view, memoryview):
+                    view.release()
+            self._mmap.close()
+            self._mmap = None
+            self._offsets = array("Q", [0])
+            self._metadata_ids = array("I")
+            self._types = bytearray()
+            self._text = bytearray()
+            self._articles = []
+            self._starts = array("Q", [0])
+            self._metadata = []
+            self._metadata_index = {}
+
+    def _add_block(self, block: ContentBlock) -> None:
+        """Append a block to the columns."""
+        metadata_id = 0
+        if block.metadata:
+            key = json.dumps(block.metadata, sort_keys=True)
+            metadata_id = self._metadata_index.get(key, 0)
+            if not metadata_id:
+                self._metadata.append(dict(block.metadata))
+                metadata_id = self._metadata_index[key] = len(self._metadata)
+        self._metadata_ids.append(metadata_id)
+        self._types.append(_CONTENT_TYPE_INDEX[block.type])
+        self._text += block.content.encode("utf-8")
+        self._offsets.append(len(self._text))
+
+    def _buffer_start(self) -> int:
+        """Get the file position of the text buffer of a mapped store."""
+        return _HEADER.size + len(self._offsets) * 8 + len(self._types) * 5
+
+    def _block(self, block: int) -> ContentBlock:
+        """Materialize one block."""
+        metadata_id = self._metadata_ids[block]
+        return ContentBlock.trusted(
+            CONTENT_TYPES[self._types[block]],
+            self.block_text(block),
+            dict(self._metadata[metadata_id - 1]) if metadata_id else None,
+        )
+
+    def _materialize(self, index: int) -> Article:
+        """Build the Article model for an index."""
+        (
+            title,
+            author,
+            date_kind,
+            date,
+            reading_time,
+            url,
+            tags,
+            item_count,
+            sections,
+        ) = self._articles[index]
+        if date_kind == _DATE_DATETIME:
+            date = datetime.fromisoformat(date)
+
+        block = self._starts[index]
+        content: list[Section | ContentBlock] = []
+        pending = iter(sections)
+        section = next(pending, None)
+        for item_index in range(item_count):
+            if section is not None and section[0] == item_index:
+                blocks = [self._block(block + i) for i in range(section[2])]
+                content.append(Section.trusted(section[1], blocks))
+                block += section[2]
+                section = next(pending, None)
+            else:
+                content.append(self._block(block))
+                block += 1
+
+        return Article.trusted(
+            title=title,
+            author=author,
+            date=date,
+            content=content,
+            estimated_reading_time=reading_time,
+            url=url,
+            tags=list(tags),
+        )
+
+
+def _column(view: memoryview, typecode: Literal["I", "Q"]) -> Any:
+    """Interpret a mapped little-endian column as an array of numbers."""
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    column = array(typecode, view.tobytes())
+    column.byteswap()
+    return column
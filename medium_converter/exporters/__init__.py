@@ -1,7 +1,17 @@
 """Exporters for Medium articles."""
 
+import importlib
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike
+from typing import BinaryIO, TextIO
+
+from ..core.models import Article
 from .base import BaseExporter
+from .epub import EPUBExporter
+from .html import HTMLExporter
 from .markdown import MarkdownExporter
+from .render import RenderTree, build_render_tree
 
 try:
     from .docx import DocxExporter
@@ -10,4 +20,93 @@ try:
 except ImportError:
     HAS_DOCX = False
 
-__all__ = ["BaseExporter", "MarkdownExporter", "DocxExporter"]
+# Module and class of the exporter for each format, imported on first use so
+# that optional dependencies are only needed for the formats actually used
+FORMATS = {
+    "markdown": ("markdown", "MarkdownExporter"),
+    "docx": ("docx", "DocxExporter"),
+    "pdf": ("pdf", "PDFExporter"),
+    "html": ("html", "HTMLExporter"),
+    "epub": ("epub", "EPUBExporter"),
+}
+
+
+def get_exporter(format: str) -> BaseExporter:
+    """Create the exporter for an output format.
+
+    Args:
+        format: Name of the format, e.g. ``"pdf"``
+
+    Returns:
+        A new exporter instance
+
+    Raises:
+        ValueError: If the format is unknown
+        ImportError: If the format's optional dependencies are missing
+    """
+    try:
+        module_name, class_name = FORMATS[format]
+    except KeyError:
+        raise ValueError(f"Unknown export format: {format}") from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    exporter: BaseExporter = getattr(module, class_name)()
+    return exporter
+
+
+def export_many(
+    article: Article,
+    formats: Iterable[str],
+    outputs: Mapping[str, str | TextIO | BinaryIO] | None = None,
+    images: Mapping[str, str | PathLike[str]] | None = None,
+    parallel: bool = False,
+) -> dict[str, str | bytes]:
+    """Export an article to several formats from a single render tree.
+
+    The article is prepared for rendering once: inline formatting is parsed
+    once per block and each local image is read once, whichever formats
+    use them.
+
+    Args:
+        article: The article to export
+        formats: Names of the formats, e.g. ``["pdf", "epub"]``
+        outputs: Optional dict mapping format names to output file paths or
+            file-like objects; formats without one are only returned
+        images: Optional dict mapping image URLs to local files, e.g. from
+            ``ImageFetcher.fetch_all``
+        parallel: Whether to export the formats in concurrent threads. This
+            overlaps file output and compression; to spread the rendering
+            itself across cores, use ``ExportPool``
+
+    Returns:
+        Dict mapping each format name to its exported content
+
+    Raises:
+        ValueError: If a format is unknown
+        ImportError: If a format's optional dependencies are missing
+    """
+    # Create every exporter up front so unknown formats fail before any output
+    exporters = {format: get_exporter(format) for format in dict.fromkeys(formats)}
+    outputs = outputs or {}
+    tree = build_render_tree(article, images)
+
+    def export(format: str) -> str | bytes:
+        return exporters[format].export_tree(tree, outputs.get(format))
+
+    if not parallel or len(exporters) < 2:
+        return {format: export(format) for format in exporters}
+    with ThreadPoolExecutor(max_workers=len(exporters)) as executor:
+        return dict(zip(exporters, executor.map(export, exporters), strict=True))
+
+
+__all__ = [
+    "BaseExporter",
+    "MarkdownExporter",
+    "DocxExporter",
+    "EPUBExporter",
+    "HTMLExporter",
+    "FORMATS",
+    "RenderTree",
+    "build_render_tree",
+    "export_many",
+    "get_exporter",
+]
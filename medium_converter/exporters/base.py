@@ -1,9 +1,16 @@
 """Base exporter for Medium articles."""
 
+import os
 from abc import ABC, abstractmethod
 from typing import BinaryIO, TextIO
 
+from .. import __version__
+from ..core.cache import BlockCache
 from ..core.models import Article
+from .render import RenderTree
+
+# Namespace of exported article fingerprints in the block cache
+CACHE_NAMESPACE = "export"
 
 
 class BaseExporter(ABC):
@@ -23,3 +30,60 @@ class BaseExporter(ABC):
             The exported content as string or bytes
         """
         pass
+
+    def export_tree(
+        self, tree: RenderTree, output: str | TextIO | BinaryIO | None = None
+    ) -> str | bytes:
+        """Export an article from its prebuilt render tree.
+
+        Exporters that render from the tree override this, so one tree can
+        drive several formats; the default exports the tree's article.
+
+        Args:
+            tree: The render tree of the article
+            output: Optional output file path or file-like object
+
+        Returns:
+            The exported content as string or bytes
+        """
+        return self.export(tree.article, output)
+
+    def export_incremental(
+        self, article: Article, output: str, cache: BlockCache
+    ) -> bool:
+        """Export an article to a file unless it is unchanged since last time.
+
+        The fingerprint of every exported article is recorded per exporter
+        and output path, together with the exporter's options and the
+        package version; when all of them still match and the file exists,
+        the export is skipped.
+
+        Args:
+            article: The article to export
+            output: Output file path
+            cache: Cache recording the exported fingerprints
+
+        Returns:
+            True if the file was (re)written, False if it was up to date
+        """
+        key = f"{type(self).__name__}:{os.path.abspath(output)}"
+        fingerprint = f"{__version__}:{self._options_key()}:{article.fingerprint}"
+        if os.path.exists(output) and cache.get(CACHE_NAMESPACE, key) == fingerprint:
+            return False
+
+        self.export(article, output)
+        cache.put(CACHE_NAMESPACE, key, fingerprint)
+        return True
+
+    def _options_key(self) -> str:
+        """Describe the options of this exporter instance.
+
+        Returns:
+            A stable representation of the exporter's public attributes
+        """
+        options = sorted(
+            (name, value)
+            for name, value in vars(self).items()
+            if not name.startswith("_")
+        )
+        return repr(options)
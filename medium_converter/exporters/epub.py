@@ -0,0 +1,378 @@
+"""EPUB exporter for Medium articles."""
+
+import hashlib
+import io
+import os
+import uuid
+import zipfile
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from html import escape
+from types import TracebackType
+from typing import BinaryIO, TextIO, cast
+
+from ..core.models import Article, ContentType
+from .base import BaseExporter
+from .html import STYLESHEET_NAME, _stylesheet, html_spans
+from .render import RenderBlock, RenderSection, RenderTree, build_render_tree
+
+# Image formats that EPUB reading systems are required to support
+IMAGE_MEDIA_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+}
+
+_CONTAINER_XML = """<?xml version="1.0" encoding="utf-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+_XHTML_HEAD = """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" \
+lang="{language}" xml:lang="{language}">
+<head>
+<meta charset="utf-8"/>
+<title>{title}</title>
+<link rel="stylesheet" type="text/css" href="{stylesheet}"/>
+</head>
+<body>
+"""
+
+
+class EpubBook:
+    """Writes an EPUB 3 book of many articles incrementally.
+
+    Each article is rendered as a chapter and written into the zip container
+    as soon as it is added, together with any of its images not already in
+    the book, which are stored once by content hash. Only the table of
+    contents and the manifest entries are kept until the book is closed, so
+    memory use is bounded by the largest article rather than the book.
+
+    Images must be local files, e.g. localized with ``ImageFetcher``;
+    remote images are replaced with a placeholder.
+
+    Example:
+        with EpubBook("publication.epub", title="My Publication") as book:
+            for article in articles:
+                book.add(article)
+    """
+
+    def __init__(
+        self,
+        output: str | BinaryIO,
+        title: str,
+        author: str = "",
+        language: str = "en",
+        identifier: str | None = None,
+    ) -> None:
+        """Initialize the book and write its fixed files.
+
+        Args:
+            output: Output file path or binary file-like object
+            title: Title of the book
+            author: Optional author of the book
+            language: Language code of the book
+            identifier: Optional unique identifier; a random UUID is used if
+                omitted
+        """
+        self.title = title
+        self.author = author
+        self.language = language
+        self.identifier = identifier or f"urn:uuid:{uuid.uuid4()}"
+        # Id, path and title of each chapter, in order
+        self._chapters: list[tuple[str, str, str]] = []
+        # Id, path and media type of each image, by content hash
+        self._images: dict[str, tuple[str, str, str]] = {}
+        self._zip = zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED)
+        self._closed = False
+
+        # The mimetype must come first and be stored uncompressed
+        self._zip.writestr(
+            "mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED
+        )
+        self._zip.writestr("META-INF/container.xml", _CONTAINER_XML)
+        self._zip.writestr(f"OEBPS/{STYLESHEET_NAME}", _stylesheet())
+
+    def __enter__(self) -> "EpubBook":
+        """Enter the book context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Finish the book."""
+        self.close()
+
+    @property
+    def chapter_count(self) -> int:
+        """The number of chapters written so far."""
+        return len(self._chapters)
+
+    def add(self, article: Article) -> None:
+        """Write an article to the book as a chapter.
+
+        Args:
+            article: The article to add
+        """
+        self.add_tree(build_render_tree(article))
+
+    def add_tree(self, tree: RenderTree) -> None:
+        """Write an article to the book as a chapter from its render tree.
+
+        Args:
+            tree: The render tree of the article
+        """
+        article = tree.article
+        number = len(self._chapters) + 1
+        href = f"chapters/{number:04d}.xhtml"
+        parts = [
+            _XHTML_HEAD.format(
+                language=escape(self.language),
+                title=escape(article.title),
+                stylesheet=f"../{STYLESHEET_NAME}",
+            ),
+            "<article>\n<header>\n",
+            f"<h1>{escape(article.title)}</h1>\n",
+            f'<p class="byline">By {escape(article.author)} | '
+            f"{escape(str(article.date))}</p>\n",
+        ]
+        if article.estimated_reading_time:
+            minutes = article.estimated_reading_time
+            parts.append(f'<p class="reading-time">{minutes} min read</p>\n')
+        parts.append("</header>\n")
+
+        for item in tree.content:
+            if isinstance(item, RenderSection):
+                parts.append("<section>\n")
+                if item.title:
+                    parts.append(f"<h2>{escape(item.title)}</h2>\n")
+                for block in item.blocks:
+                    parts.append(self._format_block(block, tree))
+                parts.append("</section>\n")
+            else:
+                parts.append(self._format_block(item, tree))
+
+        parts.append("</article>\n</body>\n</html>\n")
+        self._zip.writestr(f"OEBPS/{href}", "".join(parts))
+        self._chapters.append((f"chapter-{number:04d}", href, article.title))
+
+    def close(self) -> None:
+        """Write the navigation document and package file and close the book."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._zip.writestr("OEBPS/nav.xhtml", self._navigation())
+            self._zip.writestr("OEBPS/content.opf", self._package())
+        finally:
+            self._zip.close()
+
+    def _format_block(self, block: RenderBlock, tree: RenderTree) -> str:
+        """Format a content block as XHTML.
+
+        Args:
+            block: The render block to format
+            tree: The render tree holding the block's images
+
+        Returns:
+            The XHTML of the block
+        """
+        if block.type == ContentType.HEADING:
+            level = min(6, block.level + 1)
+            return f"<h{level}>{html_spans(block.spans)}</h{level}>\n"
+
+        elif block.type == ContentType.IMAGE:
+            alt = block.alt
+            src = self._add_image(block, tree)
+            if src is None:
+                return f'<p class="image">[Image: {escape(alt or "Image")}]</p>\n'
+            caption = block.caption
+            figcaption = (
+                f"<figcaption>{html_spans(caption)}</figcaption>" if caption else ""
+            )
+            return (
+                f'<figure><img src="../{src}" alt="{escape(alt)}"/>'
+                f"{figcaption}</figure>\n"
+            )
+
+        elif block.type == ContentType.CODE:
+            language = block.language
+            attribute = f' class="language-{escape(language)}"' if language else ""
+            return f"<pre><code{attribute}>{escape(block.text)}</code></pre>\n"
+
+        elif block.type == ContentType.QUOTE:
+            return f"<blockquote><p>{html_spans(block.spans)}</p></blockquote>\n"
+
+        elif block.type == ContentType.LIST:
+            tag = "ol" if block.ordered else "ul"
+            items = "".join(f"<li>{html_spans(item)}</li>" for item in block.items)
+            return f"<{tag}>{items}</{tag}>\n" if items else ""
+
+        else:
+            return f"<p>{html_spans(block.spans)}</p>\n"
+
+    def _add_image(self, block: RenderBlock, tree: RenderTree) -> str | None:
+        """Write a local image to the book unless it is already there.
+
+        Args:
+            block: The image block
+            tree: The render tree holding the image
+
+        Returns:
+            Path of the image within the book, or None if it cannot be added
+        """
+        extension = os.path.splitext(block.src)[1].lower()
+        media_type = IMAGE_MEDIA_TYPES.get(extension)
+        if media_type is None:
+            return None
+        data = tree.image_data(block)
+        if data is None:
+            return None
+
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if digest not in self._images:
+            href = f"images/{digest}{extension}"
+            self._zip.writestr(f"OEBPS/{href}", data, compress_type=zipfile.ZIP_STORED)
+            self._images[digest] = (f"image-{digest}", href, media_type)
+        return self._images[digest][1]
+
+    def _navigation(self) -> str:
+        """Render the navigation document listing every chapter."""
+        entries = "".join(
+            f'<li><a href="{href}">{escape(title)}</a></li>\n'
+            for _, href, title in self._chapters
+        )
+        return (
+            _XHTML_HEAD.format(
+                language=escape(self.language),
+                title=escape(self.title),
+                stylesheet=STYLESHEET_NAME,
+            )
+            + f'<nav epub:type="toc" id="toc">\n<h1>{escape(self.title)}</h1>\n'
+            + f"<ol>\n{entries}</ol>\n</nav>\n</body>\n</html>\n"
+        )
+
+    def _package(self) -> str:
+        """Render the package document with the manifest and spine."""
+        modified = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        creator = (
+            f"<dc:creator>{escape(self.author)}</dc:creator>\n" if self.author else ""
+        )
+        manifest = [
+            '<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" '
+            'properties="nav"/>',
+            f'<item id="style" href="{STYLESHEET_NAME}" media-type="text/css"/>',
+        ]
+        manifest.extend(
+            f'<item id="{item_id}" href="{href}" media-type="application/xhtml+xml"/>'
+            for item_id, href, _ in self._chapters
+        )
+        manifest.extend(
+            f'<item id="{item_id}" href="{href}" media-type="{media_type}"/>'
+            for item_id, href, media_type in self._images.values()
+        )
+        spine = "".join(
+            f'<itemref idref="{item_id}"/>\n' for item_id, _, _ in self._chapters
+        )
+        return (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<package xmlns="http://www.idpf.org/2007/opf" version="3.0" '
+            'unique-identifier="book-id">\n'
+            '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">\n'
+            f'<dc:identifier id="book-id">{escape(self.identifier)}</dc:identifier>\n'
+            f"<dc:title>{escape(self.title)}</dc:title>\n"
+            f"{creator}"
+            f"<dc:language>{escape(self.language)}</dc:language>\n"
+            f'<meta property="dcterms:modified">{modified}</meta>\n'
+            "</metadata>\n"
+            "<manifest>\n" + "\n".join(manifest) + "\n</manifest>\n"
+            f"<spine>\n{spine}</spine>\n"
+            "</package>\n"
+        )
+
+
+class EPUBExporter(BaseExporter):
+    """Export Medium articles to EPUB format."""
+
+    def export(
+        self, article: Article, output: str | TextIO | BinaryIO | None = None
+    ) -> bytes:
+        """Export an article to a single-chapter EPUB book.
+
+        Args:
+            article: The article to export
+            output: Optional output file path or file-like object.
+                   Note: If TextIO is provided, binary data will be decoded to UTF-8.
+
+        Returns:
+            The exported content as bytes
+        """
+        return self.export_tree(build_render_tree(article), output)
+
+    def export_tree(
+        self, tree: RenderTree, output: str | TextIO | BinaryIO | None = None
+    ) -> bytes:
+        """Export an article to a single-chapter EPUB book from its render tree.
+
+        Args:
+            tree: The render tree of the article
+            output: Optional output file path or file-like object.
+                   Note: If TextIO is provided, binary data will be decoded to UTF-8.
+
+        Returns:
+            The exported content as bytes
+        """
+        article = tree.article
+        buffer = io.BytesIO()
+        with EpubBook(buffer, title=article.title, author=article.author) as book:
+            book.add_tree(tree)
+        data = buffer.getvalue()
+
+        if output:
+            if isinstance(output, str):
+                with open(output, "wb") as f:
+                    f.write(data)
+            elif isinstance(output, io.TextIOBase):
+                # For TextIO, decode binary data
+                # Required for BaseExporter compatibility
+                output.write(data.decode("utf-8", errors="replace"))
+            else:
+                cast(BinaryIO, output).write(data)
+
+        return data
+
+    def export_bundle(
+        self,
+        articles: Iterable[Article],
+        output: str | BinaryIO,
+        title: str,
+        author: str = "",
+    ) -> int:
+        """Export many articles into one EPUB book, one chapter each.
+
+        Articles are consumed and written one at a time, so they can be
+        produced lazily, e.g. read from an ``ArticleStore``.
+
+        Args:
+            articles: The articles to export, in reading order
+            output: Output file path or binary file-like object
+            title: Title of the book
+            author: Optional author of the book
+
+        Returns:
+            The number of chapters written
+        """
+        with EpubBook(output, title=title, author=author) as book:
+            for article in articles:
+                book.add(article)
+            return book.chapter_count
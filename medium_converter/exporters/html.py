@@ -0,0 +1,237 @@
+"""HTML exporter for Medium articles."""
+
+import base64
+import functools
+import io
+import mimetypes
+import os
+from collections.abc import Iterable, Iterator
+from html import escape as escape_html
+from importlib import resources
+from pathlib import Path
+from typing import BinaryIO, TextIO, cast
+
+try:
+    import jinja2
+    from markupsafe import Markup
+
+    HAS_JINJA2 = True
+except ImportError:
+    HAS_JINJA2 = False
+
+from ..core.config import CacheConfig
+from ..core.models import Article
+from .base import BaseExporter
+from .render import RenderBlock, RenderTree, Span, build_render_tree
+
+TEMPLATE_NAME = "article.html.j2"
+STYLESHEET_NAME = "article.css"
+
+
+class HTMLExporter(BaseExporter):
+    """Export Medium articles to standalone HTML pages.
+
+    Templates are compiled once per process, and their compiled bytecode is
+    cached on disk so later processes skip compilation too. Pages are
+    rendered as a stream of chunks that are written as they are produced.
+    """
+
+    def __init__(
+        self, inline_assets: bool = True, cache_config: CacheConfig | None = None
+    ) -> None:
+        """Initialize the HTML exporter.
+
+        Args:
+            inline_assets: Whether to embed the stylesheet and local images
+                in the page, rather than reference them as separate files
+            cache_config: Optional cache configuration locating the cache of
+                compiled templates
+        """
+        if not HAS_JINJA2:
+            raise ImportError(
+                "jinja2 is required for HTML export. "
+                "Install with: pip install medium-converter[html]"
+            )
+        super().__init__()
+        self.inline_assets = inline_assets
+        self.cache_config = cache_config or CacheConfig()
+
+    def export(
+        self, article: Article, output: str | TextIO | BinaryIO | None = None
+    ) -> str:
+        """Export an article to HTML.
+
+        Args:
+            article: The article to export
+            output: Optional output file path or file-like object
+
+        Returns:
+            The exported content as string
+        """
+        return self.export_tree(build_render_tree(article), output)
+
+    def export_tree(
+        self, tree: RenderTree, output: str | TextIO | BinaryIO | None = None
+    ) -> str:
+        """Export an article to HTML from its render tree.
+
+        Args:
+            tree: The render tree of the article
+            output: Optional output file path or file-like object
+
+        Returns:
+            The exported content as string
+        """
+        html_content = "".join(self.iter_tree(tree))
+
+        # Write to file if specified
+        if output:
+            self._write_chunks([html_content], output)
+
+        return html_content
+
+    def export_iter(self, article: Article) -> Iterator[str]:
+        """Render an article to HTML chunk by chunk.
+
+        Args:
+            article: The article to export
+
+        Returns:
+            Iterator over consecutive chunks of the HTML page
+        """
+        return self.iter_tree(build_render_tree(article))
+
+    def iter_tree(self, tree: RenderTree) -> Iterator[str]:
+        """Render an article's render tree to HTML chunk by chunk.
+
+        Args:
+            tree: The render tree of the article
+
+        Returns:
+            Iterator over consecutive chunks of the HTML page
+        """
+        template = _environment(self.cache_config.cache_dir).get_template(TEMPLATE_NAME)
+
+        def image_src(block: RenderBlock) -> str:
+            if not self.inline_assets:
+                return block.src
+            data = tree.image_data(block)
+            if data is None:
+                return block.src
+            mime_type = mimetypes.guess_type(block.src)[0] or "application/octet-stream"
+            return f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+        return template.generate(
+            article=tree.article,
+            content=tree.content,
+            image_src=image_src,
+            stylesheet=Markup(_stylesheet()) if self.inline_assets else None,
+            stylesheet_href=STYLESHEET_NAME,
+        )
+
+    def write(self, article: Article, output: str | TextIO | BinaryIO) -> None:
+        """Stream an article to a file without building the whole page.
+
+        When assets are not inlined and the output is a path, the stylesheet
+        is written next to it.
+
+        Args:
+            article: The article to export
+            output: Output file path or file-like object
+        """
+        self._write_chunks(self.iter_tree(build_render_tree(article)), output)
+
+    def _write_chunks(
+        self, chunks: Iterable[str], output: str | TextIO | BinaryIO
+    ) -> None:
+        """Write HTML chunks to a path, text stream or binary stream."""
+        if isinstance(output, str):
+            if not self.inline_assets:
+                _write_stylesheet(os.path.dirname(os.path.abspath(output)))
+            with open(output, "w", encoding="utf-8") as f:
+                f.writelines(chunks)
+        elif isinstance(output, io.BufferedIOBase | io.RawIOBase):
+            for chunk in chunks:
+                output.write(chunk.encode("utf-8"))
+        else:
+            # Assume TextIO
+            text_output = cast(TextIO, output)
+            for chunk in chunks:
+                text_output.write(chunk)
+
+
+@functools.cache
+def _environment(cache_dir: str) -> "jinja2.Environment":
+    """Create the template environment once per process.
+
+    Args:
+        cache_dir: Cache directory holding the compiled templates
+
+    Returns:
+        The environment, with compiled bytecode cached on disk if possible
+    """
+    bytecode_cache = None
+    directory = Path(cache_dir).expanduser() / "templates"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(directory))
+    except OSError:
+        # The cache is an optimization; templates are then compiled per process
+        pass
+
+    environment = jinja2.Environment(
+        loader=jinja2.PackageLoader("medium_converter.exporters", "templates"),
+        autoescape=True,
+        bytecode_cache=bytecode_cache,
+        keep_trailing_newline=True,
+    )
+    environment.filters["spans"] = lambda spans: Markup(html_spans(spans))
+    return environment
+
+
+@functools.cache
+def _stylesheet() -> str:
+    """Read the page stylesheet once per process."""
+    return (
+        resources.files(__package__)
+        .joinpath("templates", STYLESHEET_NAME)
+        .read_text(encoding="utf-8")
+    )
+
+
+def _write_stylesheet(directory: str) -> None:
+    """Write the stylesheet into a directory unless it is already there."""
+    path = os.path.join(directory, STYLESHEET_NAME)
+    stylesheet = _stylesheet()
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == stylesheet:
+                return
+    except OSError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(stylesheet)
+
+
+def html_spans(spans: Iterable[Span]) -> str:
+    """Convert formatted spans to HTML, escaping their text.
+
+    Args:
+        spans: The formatted spans
+
+    Returns:
+        The HTML of the spans
+    """
+    parts = []
+    for span in spans:
+        text = escape_html(span.text)
+        if span.code:
+            text = f"<code>{text}</code>"
+        if span.italic:
+            text = f"<em>{text}</em>"
+        if span.bold:
+            text = f"<strong>{text}</strong>"
+        if span.href:
+            text = f'<a href="{escape_html(span.href)}">{text}</a>'
+        parts.append(text)
+    return "".join(parts)
@@ -1,9 +1,12 @@
 """Markdown exporter for Medium articles."""
 
-from typing import BinaryIO, TextIO
+import io
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO, TextIO, cast
 
-from ..core.models import Article, ContentBlock, ContentType, Section
+from ..core.models import Article, ContentType
 from .base import BaseExporter
+from .render import RenderBlock, RenderSection, RenderTree, build_render_tree
 
 
 class MarkdownExporter(BaseExporter):
@@ -21,77 +24,123 @@ class MarkdownExporter(BaseExporter):
         Returns:
             The exported content as string
         """
-        md_content = f"# {article.title}\n\n"
-        md_content += f"By {article.author} | {article.date}\n\n"
+        return self.export_tree(build_render_tree(article), output)
+
+    def export_tree(
+        self, tree: RenderTree, output: str | TextIO | BinaryIO | None = None
+    ) -> str:
+        """Export an article to Markdown from its render tree.
+
+        Args:
+            tree: The render tree of the article
+            output: Optional output file path or file-like object
+
+        Returns:
+            The exported content as string
+        """
+        md_content = "".join(self.iter_tree(tree))
+
+        # Write to file if specified
+        if output:
+            self._write_chunks([md_content], output)
+
+        return md_content
+
+    def export_iter(self, article: Article) -> Iterator[str]:
+        """Render an article to Markdown chunk by chunk.
+
+        Args:
+            article: The article to export
+
+        Returns:
+            Iterator over consecutive chunks of the Markdown document
+        """
+        return self.iter_tree(build_render_tree(article))
+
+    def iter_tree(self, tree: RenderTree) -> Iterator[str]:
+        """Render an article's render tree to Markdown chunk by chunk.
+
+        Args:
+            tree: The render tree of the article
+
+        Yields:
+            Consecutive chunks of the Markdown document
+        """
+        article = tree.article
+        yield f"# {article.title}\n\n"
+        yield f"By {article.author} | {article.date}\n\n"
 
         if article.tags:
             tags = ", ".join([f"#{tag.replace(' ', '')}" for tag in article.tags])
-            md_content += f"{tags}\n\n"
+            yield f"{tags}\n\n"
 
         if article.estimated_reading_time:
-            md_content += f"*{article.estimated_reading_time} min read*\n\n"
+            yield f"*{article.estimated_reading_time} min read*\n\n"
 
         # Process content
-        for item in article.content:
-            if isinstance(item, Section):
+        for item in tree.content:
+            if isinstance(item, RenderSection):
                 if item.title:
-                    md_content += f"## {item.title}\n\n"
+                    yield f"## {item.title}\n\n"
 
                 for block in item.blocks:
-                    md_content += self._format_block(block)
-            elif isinstance(item, ContentBlock):
-                md_content += self._format_block(item)
-
-        # Write to file if specified
-        if output:
-            if isinstance(output, str):
-                with open(output, "w", encoding="utf-8") as f:
-                    f.write(md_content)
+                    yield self._format_block(block)
             else:
-                # We need to check the type to avoid mypy errors
-                if hasattr(output, "write") and callable(output.write):
-                    if isinstance(output, BinaryIO):
-                        output.write(md_content.encode("utf-8"))
-                    else:
-                        # Assume TextIO
-                        output.write(md_content)
+                yield self._format_block(item)
 
-        return md_content
+    def write(self, article: Article, output: str | TextIO | BinaryIO) -> None:
+        """Stream an article to a file without building the whole document.
 
-    def _format_block(self, block: ContentBlock) -> str:
+        Args:
+            article: The article to export
+            output: Output file path or file-like object
+        """
+        self._write_chunks(self.iter_tree(build_render_tree(article)), output)
+
+    @staticmethod
+    def _write_chunks(chunks: Iterable[str], output: str | TextIO | BinaryIO) -> None:
+        """Write Markdown chunks to a path, text stream or binary stream."""
+        if isinstance(output, str):
+            with open(output, "w", encoding="utf-8") as f:
+                f.writelines(chunks)
+        elif isinstance(output, io.BufferedIOBase | io.RawIOBase):
+            for chunk in chunks:
+                output.write(chunk.encode("utf-8"))
+        else:
+            # Assume TextIO
+            text_output = cast(TextIO, output)
+            for chunk in chunks:
+                text_output.write(chunk)
+
+    def _format_block(self, block: RenderBlock) -> str:
         """Format a content block as Markdown.
 
         Args:
-            block: The content block to format
+            block: The render block to format
 
         Returns:
             Markdown-formatted string for the block
         """
         if block.type == ContentType.TEXT:
-            return f"{block.content}\n\n"
+            return f"{block.text}\n\n"
         elif block.type == ContentType.HEADING:
-            level = block.metadata.get("level", 2)
-            hashes = "#" * level
-            return f"{hashes} {block.content}\n\n"
+            hashes = "#" * block.level
+            return f"{hashes} {block.text}\n\n"
         elif block.type == ContentType.IMAGE:
-            alt = block.metadata.get("alt", "")
-            return f"![{alt}]({block.content})\n\n"
+            return f"![{block.alt}]({block.src})\n\n"
         elif block.type == ContentType.CODE:
-            lang = block.metadata.get("language", "")
-            return f"```{lang}\n{block.content}\n```\n\n"
+            lang = block.language or ""
+            return f"```{lang}\n{block.text}\n```\n\n"
         elif block.type == ContentType.QUOTE:
-            return f"> {block.content}\n\n"
+            return f"> {block.text}\n\n"
         elif block.type == ContentType.LIST:
-            list_type = block.metadata.get("list_type", "unordered")
-            items = block.content.split("\n")
-            result = ""
+            items = block.text.split("\n")
 
-            for i, item in enumerate(items):
-                if list_type == "ordered":
-                    result += f"{i + 1}. {item}\n"
-                else:
-                    result += f"- {item}\n"
+            if block.ordered:
+                lines = [f"{i + 1}. {item}\n" for i, item in enumerate(items)]
+            else:
+                lines = [f"- {item}\n" for item in items]
 
-            return result + "\n"
+            return "".join(lines) + "\n"
         else:
-            return f"{block.content}\n\n"
+            return f"{block.text}\n\n"
@@ -1,106 +1,368 @@
 """PDF exporter for Medium articles."""
 
-from typing import BinaryIO, TextIO
+import functools
+import io
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, BinaryIO, TextIO, cast
 
-from ..core.models import Article
+from ..core.models import Article, ContentType
 from .base import BaseExporter
+from .render import RenderBlock, RenderSection, RenderTree, Span, build_render_tree
+
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Flowable
+
+# Longest code line before it is wrapped onto the next line
+CODE_LINE_LENGTH = 90
+
+# Padding of the text frame on each side, in points; flowables must fit
+# within the frame less the padding
+FRAME_PADDING = 6
+
+# Height kept free below an image for its caption, in points
+CAPTION_ALLOWANCE = 24
 
 
 class PDFExporter(BaseExporter):
     """Export Medium articles to PDF format."""
 
+    def __init__(self) -> None:
+        """Initialize the PDF exporter."""
+        _require_reportlab()
+        super().__init__()
+
     def export(
         self, article: Article, output: str | TextIO | BinaryIO | None = None
     ) -> bytes:
         """Export an article to PDF.
 
+        The document is written straight to the output path or stream.
+
         Args:
             article: The article to export
-            output: Optional output file path or file-like object
+            output: Optional output file path or file-like object.
+                   Note: If TextIO is provided, binary data will be decoded to UTF-8.
 
         Returns:
             The exported content as bytes
         """
-        try:
-            from io import BytesIO
-
-            # reportlab imports
-            from reportlab.lib import colors
-            from reportlab.lib.pagesizes import A4
-            from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-            from reportlab.lib.units import inch
-            from reportlab.platypus import (
-                Paragraph,
-                SimpleDocTemplate,
-                Spacer,
-            )
-        except ImportError as err:
-            raise ImportError(
-                "PDF export requires reportlab."
-                "Install with 'pip install medium-converter[pdf]'"
-            ) from err
+        return self.export_tree(build_render_tree(article), output)
 
-        # Create a buffer for the PDF
-        buffer = BytesIO()
+    def export_tree(
+        self, tree: RenderTree, output: str | TextIO | BinaryIO | None = None
+    ) -> bytes:
+        """Export an article to PDF from its render tree.
 
-        # Create the PDF document
-        doc = SimpleDocTemplate(
-            buffer if output is None else output if isinstance(output, str) else buffer,
-            pagesize=A4,
-            title=article.title,
-            author=article.author,
-        )
+        Args:
+            tree: The render tree of the article
+            output: Optional output file path or file-like object.
+                   Note: If TextIO is provided, binary data will be decoded to UTF-8.
 
-        # Get styles
-        styles = getSampleStyleSheet()
-        title_style = styles["Title"]
-        styles["Heading1"]
-        styles["Heading2"]
-        normal_style = styles["Normal"]
+        Returns:
+            The exported content as bytes
+        """
+        if isinstance(output, str):
+            with open(output, "wb") as f:
+                return self._build(tree, _Recorder(f))
+        if output is None or isinstance(output, io.TextIOBase):
+            pdf_content = self._build(tree, _Recorder(None))
+            if output is not None:
+                # For TextIO, decode binary data
+                # Required for BaseExporter compatibility
+                output.write(pdf_content.decode("utf-8", errors="replace"))
+            return pdf_content
+        return self._build(tree, _Recorder(cast(BinaryIO, output)))
 
-        # Create PDF elements
-        elements = []
+    def _build(self, tree: RenderTree, recorder: "_Recorder") -> bytes:
+        """Lay out an article and write the PDF through a recorder.
 
-        # Add title
-        elements.append(Paragraph(article.title, title_style))
-        elements.append(Spacer(1, 0.2 * inch))
+        Args:
+            tree: The render tree of the article
+            recorder: Destination of the PDF data
 
-        # Add author and date
-        elements.append(
-            Paragraph(f"By {article.author} | {article.date}", normal_style)
+        Returns:
+            The PDF data
+        """
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Spacer
+
+        article = tree.article
+        doc = SimpleDocTemplate(
+            recorder, pagesize=A4, title=article.title, author=article.author
         )
-        elements.append(Spacer(1, 0.2 * inch))
+        styles = _styles()
+
+        # Create PDF elements
+        elements: list[Flowable] = [
+            _paragraph(article.title, styles["title"]),
+            _paragraph(f"By {article.author} | {article.date}", styles["byline"]),
+        ]
+
+        if article.tags:
+            tags = ", ".join([f"#{tag.replace(' ', '')}" for tag in article.tags])
+            elements.append(_paragraph(tags, styles["byline"]))
 
-        # Add reading time if available
         if article.estimated_reading_time:
             elements.append(
-                Paragraph(
+                _paragraph(
                     f"{article.estimated_reading_time} min read",
-                    ParagraphStyle(
-                        "Italic", parent=normal_style, textColor=colors.gray
-                    ),
+                    styles["reading_time"],
                 )
             )
-            elements.append(Spacer(1, 0.2 * inch))
+        elements.append(Spacer(1, 0.2 * inch))
 
-        # Example code to process content (placeholder)
-        elements.append(
-            Paragraph(
-                "Content will be rendered here in the actual implementation",
-                normal_style,
-            )
-        )
+        # Process content
+        frame = (doc.width - 2 * FRAME_PADDING, doc.height - 2 * FRAME_PADDING)
+        for item in tree.content:
+            if isinstance(item, RenderSection):
+                if item.title:
+                    elements.append(_paragraph(item.title, styles["heading1"]))
+                for block in item.blocks:
+                    elements.extend(self._format_block(block, frame, tree))
+            else:
+                elements.extend(self._format_block(item, frame, tree))
 
-        # Build the PDF
         doc.build(elements)
+        return recorder.getvalue()
 
-        # Get the PDF content
-        pdf_content = buffer.getvalue()
-        buffer.close()
+    def _format_block(
+        self, block: RenderBlock, frame: tuple[float, float], tree: RenderTree
+    ) -> list["Flowable"]:
+        """Format a content block as PDF flowables.
+
+        Args:
+            block: The render block to format
+            frame: Usable width and height of the text frame in points
+            tree: The render tree holding the block's images
+
+        Returns:
+            The flowables rendering the block
+        """
+        from reportlab.platypus import ListFlowable, ListItem, Preformatted
+
+        styles = _styles()
+
+        if block.type == ContentType.HEADING:
+            level = min(3, block.level)
+            return [_spans_paragraph(block.spans, styles[f"heading{level}"])]
+
+        if block.type == ContentType.IMAGE:
+            return _image(block, frame, tree)
+
+        if block.type == ContentType.CODE:
+            return [
+                Preformatted(block.text, styles["code"], maxLineLength=CODE_LINE_LENGTH)
+            ]
+
+        if block.type == ContentType.QUOTE:
+            return [_spans_paragraph(block.spans, styles["quote"])]
+
+        if block.type == ContentType.LIST:
+            items = [
+                ListItem(_spans_paragraph(item, styles["body"])) for item in block.items
+            ]
+            if not items:
+                return []
+            return [
+                ListFlowable(
+                    items,
+                    bulletType="1" if block.ordered else "bullet",
+                    start=None if block.ordered else "•",
+                    spaceAfter=6,
+                )
+            ]
+
+        return [_spans_paragraph(block.spans, styles["body"])]
+
+
+class _Recorder:
+    """Binary stream that keeps the data written through it.
+
+    reportlab writes the finished document in one call, so recording it lets
+    the exporter return the bytes without a second in-memory copy.
+    """
+
+    def __init__(self, target: BinaryIO | None) -> None:
+        """Initialize the recorder.
+
+        Args:
+            target: Optional stream to pass the data on to
+        """
+        self.target = target
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        """Record data and pass it on to the target."""
+        self.chunks.append(data)
+        if self.target is not None:
+            self.target.write(data)
+        return len(data)
+
+    def flush(self) -> None:
+        """Flush the target."""
+        if self.target is not None:
+            self.target.flush()
+
+    def getvalue(self) -> bytes:
+        """Return all data written so far."""
+        return self.chunks[0] if len(self.chunks) == 1 else b"".join(self.chunks)
+
+
+def _require_reportlab() -> None:
+    """Check that reportlab is installed.
+
+    Raises:
+        ImportError: If reportlab is missing
+    """
+    try:
+        import reportlab  # noqa: F401
+    except ImportError as err:
+        raise ImportError(
+            "reportlab is required for PDF export. "
+            "Install with: pip install medium-converter[pdf]"
+        ) from err
+
+
+@functools.cache
+def _styles() -> dict[str, "ParagraphStyle"]:
+    """Build the paragraph styles once per process.
+
+    Returns:
+        Dict mapping the exporter's style names to paragraph styles
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    sample = getSampleStyleSheet()
+    normal = sample["Normal"]
+    return {
+        "title": sample["Title"],
+        "byline": ParagraphStyle("Byline", parent=normal, alignment=TA_CENTER),
+        "reading_time": ParagraphStyle(
+            "ReadingTime",
+            parent=normal,
+            alignment=TA_CENTER,
+            fontName="Helvetica-Oblique",
+            textColor=colors.gray,
+        ),
+        "heading1": sample["Heading1"],
+        "heading2": sample["Heading2"],
+        "heading3": sample["Heading3"],
+        "body": ParagraphStyle("Body", parent=normal, spaceAfter=6, leading=14),
+        "code": ParagraphStyle(
+            "CodeBlock",
+            parent=sample["Code"],
+            fontSize=9,
+            leading=11,
+            backColor=colors.whitesmoke,
+            borderPadding=4,
+            spaceBefore=4,
+            spaceAfter=10,
+        ),
+        "quote": ParagraphStyle(
+            "Quote",
+            parent=normal,
+            fontName="Helvetica-Oblique",
+            leftIndent=18,
+            textColor=colors.dimgray,
+            spaceAfter=6,
+        ),
+        "caption": ParagraphStyle(
+            "Caption",
+            parent=normal,
+            alignment=TA_CENTER,
+            fontSize=8,
+            textColor=colors.gray,
+            spaceAfter=8,
+        ),
+    }
+
+
+def _paragraph(text: str, style: "ParagraphStyle") -> "Flowable":
+    """Create a paragraph of plain text.
+
+    Args:
+        text: The paragraph text
+        style: The paragraph style
+
+    Returns:
+        The paragraph
+    """
+    from reportlab.platypus import Paragraph
+
+    return Paragraph(_escape(text), style)
+
+
+def _spans_paragraph(spans: Iterable[Span], style: "ParagraphStyle") -> "Flowable":
+    """Create a paragraph of formatted spans.
+
+    Args:
+        spans: The formatted spans
+        style: The paragraph style
+
+    Returns:
+        The paragraph
+    """
+    from reportlab.platypus import Paragraph
+
+    return Paragraph(_markup(spans), style)
+
+
+def _image(
+    block: RenderBlock, frame: tuple[float, float], tree: RenderTree
+) -> list["Flowable"]:
+    """Create the flowables for an image block, scaled to fit the frame."""
+    from reportlab.lib.utils import ImageReader
+    from reportlab.platypus import Image
+
+    styles = _styles()
+    alt = block.alt or "Image"
+    # Remote images must first be downloaded with ImageFetcher
+    data = tree.image_data(block)
+    if data is None:
+        return [_paragraph(f"[Image: {alt}]", styles["caption"])]
+
+    try:
+        image_width, image_height = ImageReader(io.BytesIO(data)).getSize()
+    except Exception:
+        return [_paragraph(f"[Image: {alt}]", styles["caption"])]
+
+    width, height = frame
+    caption = "alt" in block.block.metadata
+    scale = min(
+        1.0,
+        width / image_width,
+        (height - (CAPTION_ALLOWANCE if caption else 0)) / image_height,
+    )
+    flowables: list[Flowable] = [
+        Image(io.BytesIO(data), width=image_width * scale, height=image_height * scale)
+    ]
+    if caption:
+        flowables.append(_paragraph(block.alt, styles["caption"]))
+    return flowables
+
+
+def _escape(text: str) -> str:
+    """Escape the characters reportlab treats as markup."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
-        # Write to file if specified and not already written
-        if output and isinstance(output, str):
-            with open(output, "wb") as f:
-                f.write(pdf_content)
 
-        return pdf_content
+def _markup(spans: Iterable[Span]) -> str:
+    """Convert formatted spans to reportlab paragraph markup."""
+    parts = []
+    for span in spans:
+        text = _escape(span.text)
+        if span.code:
+            text = f'<font face="Courier">{text}</font>'
+        if span.italic:
+            text = f"<i>{text}</i>"
+        if span.bold:
+            text = f"<b>{text}</b>"
+        if span.href:
+            href = _escape(span.href).replace('"', "%22")
+            text = f'<link href="{href}" color="blue">{text}</link>'
+        parts.append(text)
+    return "".join(parts)
@@ -0,0 +1,140 @@
+"""Parallel exporting of articles in a pool of worker processes."""
+
+import asyncio
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+
+from ..core.config import ExportConfig
+from ..core.models import Article, ContentBlock, ContentType
+from . import BaseExporter, get_exporter
+
+# Tiny article exported by each worker on startup to load the exporter
+# modules and build their templates and styles
+_WARMUP_ARTICLE = Article(
+    title="Warm",
+    author="Up",
+    date="",
+    content=[ContentBlock(type=ContentType.TEXT, content="warm")],
+)
+
+# Exporters created by a worker process, by format
+_exporters: dict[str, BaseExporter] = {}
+
+
+class ExportPool:
+    """A warm pool of processes exporting articles in parallel.
+
+    Rendering DOCX and PDF documents is CPU-bound pure Python, so a batch
+    exported in one process is limited to one core. The pool starts its
+    workers up front with the exporters for the given formats already
+    loaded, sends them articles in the compact binary encoding and has them
+    write each document straight to its output file, so no document is sent
+    back to the parent process.
+
+    Example:
+        jobs = [(article, f"{i}.pdf") for i, article in enumerate(articles)]
+        with ExportPool(["pdf"]) as pool:
+            pool.export_batch("pdf", jobs)
+    """
+
+    def __init__(
+        self, formats: Iterable[str], config: ExportConfig | None = None
+    ) -> None:
+        """Initialize the pool and start its workers.
+
+        Args:
+            formats: Formats whose exporters the workers load on startup
+            config: Optional export configuration
+        """
+        self.formats = tuple(formats)
+        for format in self.formats:
+            # Fail here, rather than in every worker, on unusable formats
+            get_exporter(format)
+
+        self.config = config or ExportConfig()
+        self.workers = self.config.workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_warm_up, initargs=(self.formats,)
+        )
+        # Workers are spawned on demand; submitting one task per worker
+        # starts them all now instead of during the first batch
+        for future in [self._executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def __enter__(self) -> "ExportPool":
+        """Enter the pool context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Shut the pool down."""
+        self.close()
+
+    def export_batch(
+        self, format: str, jobs: Iterable[tuple[Article, str]]
+    ) -> list[str]:
+        """Export many articles in parallel.
+
+        Args:
+            format: Name of the output format
+            jobs: Pairs of article and output file path
+
+        Returns:
+            The output paths, in the order of the jobs
+        """
+        formats, pages, outputs = [], [], []
+        for article, output in jobs:
+            formats.append(format)
+            pages.append(article.to_bytes())
+            outputs.append(output)
+        return list(
+            self._executor.map(
+                _export_encoded,
+                formats,
+                pages,
+                outputs,
+                chunksize=self.config.batch_size,
+            )
+        )
+
+    async def export(self, article: Article, format: str, output: str) -> str:
+        """Export one article in a worker without blocking the event loop.
+
+        Args:
+            article: The article to export
+            format: Name of the output format
+            output: Output file path
+
+        Returns:
+            The output path
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, _export_encoded, format, article.to_bytes(), output
+        )
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown(cancel_futures=True)
+
+
+def _export_encoded(format: str, data: bytes, output: str) -> str:
+    """Decode an article in a worker and export it to a file."""
+    exporter = _exporters.get(format)
+    if exporter is None:
+        exporter = _exporters[format] = get_exporter(format)
+    exporter.export(Article.from_bytes(data), output)
+    return output
+
+
+def _warm_up(formats: tuple[str, ...]) -> None:
+    """Load the exporters and their templates in a new worker process."""
+    for format in formats:
+        exporter = _exporters[format] = get_exporter(format)
+        exporter.export(_WARMUP_ARTICLE)
@@ -0,0 +1,368 @@
+"""Format-independent render tree shared by the exporters.
+
+Building the tree does the work every exporter would otherwise repeat:
+inline Markdown is parsed into formatted spans, lists are split into
+items, heading levels are normalized and images are resolved to local
+files, whose content is read at most once however many formats use it.
+"""
+
+import re
+import unicodedata
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from os import PathLike
+from typing import Any
+
+from ..core.models import Article, ContentBlock, ContentType, Section
+
+# Highest heading level kept; deeper headings are rendered at this level
+MAX_HEADING_LEVEL = 6
+
+# Escaped characters, code spans and links, whose labels are parsed in
+# turn; only web, mail and relative links are recognized, so no script can
+# be linked
+_INLINE = re.compile(
+    r"\\(?P<escaped>[\\*_\[\]`])"
+    r"|(?<!`)(?P<fence>`++)(?P<code>(?s:.+?))(?<!`)(?P=fence)(?!`)"
+    r"|\[(?P<label>(?:\\.|[^\]\\])+)\]"
+    r"\((?P<href>(?:https?://|mailto:|/|#)[^)\s]*)\)"
+)
+_DELIMITER_RUN = re.compile(r"\*+")
+
+
+@dataclass(frozen=True, slots=True)
+class Span:
+    """A run of text with uniform inline formatting."""
+
+    text: str
+    bold: bool = False
+    italic: bool = False
+    code: bool = False
+    href: str | None = None
+
+
+@dataclass(frozen=True)
+class RenderBlock:
+    """A content block with its inline formatting and assets resolved.
+
+    Spans and list items are parsed on first use, so exporters that work
+    on the source text, such as Markdown, do not pay for them.
+    """
+
+    block: ContentBlock
+    level: int = 1
+    src: str = ""
+
+    @property
+    def type(self) -> ContentType:
+        """The content type of the block."""
+        return self.block.type
+
+    @property
+    def text(self) -> str:
+        """The source text of the block."""
+        return self.block.content
+
+    @property
+    def ordered(self) -> bool:
+        """Whether a list block is numbered."""
+        return bool(self.block.metadata.get("list_type") == "ordered")
+
+    @property
+    def language(self) -> str | None:
+        """The language of a code block, if known."""
+        language = self.block.metadata.get("language")
+        return str(language) if language else None
+
+    @property
+    def alt(self) -> str:
+        """The alternative text of an image block."""
+        return str(self.block.metadata.get("alt", ""))
+
+    @property
+    def local(self) -> bool:
+        """Whether an image block refers to a local file."""
+        return bool(self.src) and not self.src.startswith(("http://", "https://"))
+
+    @cached_property
+    def spans(self) -> tuple[Span, ...]:
+        """The formatted spans of a text, heading or quote block."""
+        return parse_inline(self.text)
+
+    @cached_property
+    def items(self) -> tuple[tuple[Span, ...], ...]:
+        """The formatted spans of each non-empty list item."""
+        return tuple(
+            parse_inline(item) for item in self.text.split("\n") if item.strip()
+        )
+
+    @cached_property
+    def caption(self) -> tuple[Span, ...]:
+        """The formatted spans of an image caption."""
+        return parse_inline(str(self.block.metadata.get("caption") or ""))
+
+
+@dataclass(frozen=True)
+class RenderSection:
+    """A titled group of render blocks."""
+
+    title: str | None
+    blocks: tuple[RenderBlock, ...]
+
+
+@dataclass(frozen=True)
+class RenderTree:
+    """An article prepared for rendering to any number of formats."""
+
+    article: Article
+    content: tuple[RenderSection | RenderBlock, ...]
+    _images: dict[str, bytes | None] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def iter_blocks(self) -> Iterator[RenderBlock]:
+        """Iterate over all blocks, including those in sections."""
+        for item in self.content:
+            if isinstance(item, RenderSection):
+                yield from item.blocks
+            else:
+                yield item
+
+    def image_data(self, block: RenderBlock) -> bytes | None:
+        """Read a local image, at most once per tree.
+
+        Args:
+            block: An image block
+
+        Returns:
+            The image content, or None if it is remote or unreadable
+        """
+        if not block.local:
+            return None
+        if block.src not in self._images:
+            try:
+                with open(block.src, "rb") as f:
+                    self._images[block.src] = f.read()
+            except OSError:
+                self._images[block.src] = None
+        return self._images[block.src]
+
+
+def build_render_tree(
+    article: Article, images: Mapping[str, str | PathLike[str]] | None = None
+) -> RenderTree:
+    """Prepare an article for rendering.
+
+    Args:
+        article: The article to render
+        images: Optional dict mapping image URLs to local files, e.g. from
+            ``ImageFetcher.fetch_all``
+
+    Returns:
+        The render tree of the article
+    """
+    images = images or {}
+
+    def render_block(block: ContentBlock) -> RenderBlock:
+        if block.type == ContentType.HEADING:
+            level = _int(block.metadata.get("level"), 2)
+            return RenderBlock(block, level=max(1, min(MAX_HEADING_LEVEL, level)))
+        if block.type == ContentType.IMAGE:
+            local = images.get(block.content)
+            return RenderBlock(block, src=str(local) if local else block.content)
+        return RenderBlock(block)
+
+    content: list[RenderSection | RenderBlock] = [
+        (
+            RenderSection(item.title, tuple(render_block(b) for b in item.blocks))
+            if isinstance(item, Section)
+            else render_block(item)
+        )
+        for item in article.content
+    ]
+    return RenderTree(article, tuple(content))
+
+
+def parse_inline(text: str) -> tuple[Span, ...]:
+    """Parse inline Markdown into formatted spans.
+
+    Code spans, links, bold and italic emphasis and backslash escapes of
+    the characters escaped by the parsers are recognized. As in
+    CommonMark, a run of ``*`` only opens emphasis when it is followed by
+    non-whitespace and only closes it when it is preceded by non-whitespace,
+    and emphasis may wrap links but not cross their boundaries; unmatched
+    markers are kept as text.
+
+    Args:
+        text: Text with inline Markdown
+
+    Returns:
+        The spans of the text, in order
+    """
+    spans: list[Span] = []
+    _emit(_tokenize(text), spans, 0, 0, None)
+    return tuple(spans)
+
+
+@dataclass(slots=True)
+class _Code:
+    """A code span, whose content is not formatted."""
+
+    text: str
+
+
+@dataclass(slots=True)
+class _Link:
+    """A link and the tokens of its label."""
+
+    href: str
+    tokens: list["_Token"]
+
+
+@dataclass(slots=True)
+class _Delimiter:
+    """A run of emphasis markers and the emphasis it opens and closes."""
+
+    length: int
+    can_open: bool
+    can_close: bool
+    count: int = 0
+    # Whether each emphasis opened or closed here is bold rather than italic
+    opens: list[bool] = field(default_factory=list)
+    closes: list[bool] = field(default_factory=list)
+
+
+_Token = str | _Code | _Link | _Delimiter
+
+
+def _tokenize(text: str) -> list[_Token]:
+    """Split inline Markdown into tokens and pair up its emphasis markers."""
+    tokens: list[_Token] = []
+    position = 0
+    for match in _INLINE.finditer(text):
+        _tokenize_text(text, position, match.start(), tokens)
+        if match.group("escaped") is not None:
+            tokens.append(match.group("escaped"))
+        elif match.group("code") is not None:
+            code = match.group("code")
+            # One space on each side separates the fence from backticks
+            if len(code) > 2 and code[0] == code[-1] == " " and code.strip():
+                code = code[1:-1]
+            tokens.append(_Code(code))
+        else:
+            tokens.append(_Link(match.group("href"), _tokenize(match.group("label"))))
+        position = match.end()
+    _tokenize_text(text, position, len(text), tokens)
+    # Delimiters in link labels were paired within the label
+    _match_emphasis([token for token in tokens if isinstance(token, _Delimiter)])
+    return tokens
+
+
+def _tokenize_text(text: str, start: int, end: int, tokens: list[_Token]) -> None:
+    """Split plain text into literal text and runs of emphasis markers."""
+    position = start
+    for match in _DELIMITER_RUN.finditer(text, start, end):
+        if match.start() > position:
+            tokens.append(text[position : match.start()])
+        before = text[match.start() - 1] if match.start() > 0 else " "
+        after = text[match.end()] if match.end() < len(text) else " "
+        length = match.end() - match.start()
+        tokens.append(
+            _Delimiter(
+                length,
+                can_open=_left_flanking(before, after),
+                can_close=_left_flanking(after, before),
+                count=length,
+            )
+        )
+        position = match.end()
+    if end > position:
+        tokens.append(text[position:end])
+
+
+def _left_flanking(before: str, after: str) -> bool:
+    """Whether a delimiter run between two characters is left-flanking.
+
+    A run is right-flanking if it is left-flanking with the characters
+    swapped.
+    """
+    if after.isspace():
+        return False
+    return not _punctuation(after) or before.isspace() or _punctuation(before)
+
+
+def _punctuation(char: str) -> bool:
+    """Whether a character is Unicode punctuation or a symbol."""
+    return unicodedata.category(char)[0] in "PS"
+
+
+def _match_emphasis(delimiters: list[_Delimiter]) -> None:
+    """Pair emphasis openers with closers, innermost first."""
+    for index, closer in enumerate(delimiters):
+        while closer.can_close and closer.count:
+            for position in range(index - 1, -1, -1):
+                opener = delimiters[position]
+                if opener.can_open and opener.count and _can_pair(opener, closer):
+                    break
+            else:
+                break
+
+            bold = opener.count >= 2 and closer.count >= 2
+            opener.count -= 2 if bold else 1
+            closer.count -= 2 if bold else 1
+            opener.opens.append(bold)
+            closer.closes.append(bold)
+            # Markers between a pair can no longer be matched
+            for between in delimiters[position + 1 : index]:
+                between.can_open = between.can_close = False
+
+
+def _can_pair(opener: _Delimiter, closer: _Delimiter) -> bool:
+    """Apply CommonMark's rule of three to runs that can open and close."""
+    if not (opener.can_close or closer.can_open):
+        return True
+    if (opener.length + closer.length) % 3:
+        return True
+    return opener.length % 3 == 0 and closer.length % 3 == 0
+
+
+def _emit(
+    tokens: list[_Token], spans: list[Span], bold: int, italic: int, href: str | None
+) -> None:
+    """Append the spans of tokens, given the emphasis open around them."""
+    for token in tokens:
+        if isinstance(token, str):
+            _append(spans, Span(token, bold > 0, italic > 0, href=href))
+        elif isinstance(token, _Code):
+            _append(spans, Span(token.text, bold > 0, italic > 0, True, href))
+        elif isinstance(token, _Link):
+            _emit(token.tokens, spans, bold, italic, token.href)
+        else:
+            for closes_bold in token.closes:
+                bold, italic = bold - closes_bold, italic - (not closes_bold)
+            if token.count:
+                # Unmatched markers are literal text
+                _append(spans, Span("*" * token.count, bold > 0, italic > 0, href=href))
+            for opens_bold in token.opens:
+                bold, italic = bold + opens_bold, italic + (not opens_bold)
+
+
+def _append(spans: list[Span], span: Span) -> None:
+    """Append a span, merging it into the previous one if formatted alike."""
+    if not span.text:
+        return
+    if spans and not span.code and not spans[-1].code:
+        last = spans[-1]
+        if (last.bold, last.italic, last.href) == (span.bold, span.italic, span.href):
+            spans[-1] = replace(last, text=last.text + span.text)
+            return
+    spans.append(span)
+
+
+def _int(value: Any, default: int) -> int:
+    """Convert a metadata value to an int, falling back to a default."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
@@ -1,17 +1,34 @@
 """Content enhancement using LLMs."""
 
+import hashlib
+import json
+
+from ..core.cache import BlockCache
 from ..core.models import Article, ContentBlock, Section
 from .config import LLMConfig
 from .prompts import get_enhancement_prompt
-from .providers import get_llm_client
+from .providers import LLMClient, get_llm_client
+
+# Namespace of enhanced texts in the block cache
+CACHE_NAMESPACE = "enhance"
 
 
-async def enhance_article(article: Article, config: LLMConfig | None = None) -> Article:
+async def enhance_article(
+    article: Article,
+    config: LLMConfig | None = None,
+    cache: BlockCache | None = None,
+) -> Article:
     """Enhance an article using LLM.
 
+    With a cache, the enhanced text of every block is stored, and blocks
+    that are unchanged since an earlier run reuse it instead of calling the
+    LLM again, so re-enhancing a lightly edited article only pays for the
+    edited blocks.
+
     Args:
         article: The article to enhance
         config: Optional LLM configuration
+        cache: Optional cache of enhanced texts
 
     Returns:
         Enhanced article
@@ -37,7 +54,7 @@ async def enhance_article(article: Article, config: LLMConfig | None = None) ->
                     )
 
                     try:
-                        enhanced_text = await llm.generate(prompt)
+                        enhanced_text = await _generate(llm, config, prompt, cache)
                         # Use a type check to satisfy mypy
                         content_item = enhanced_article.content[item_index]
                         if isinstance(content_item, Section):
@@ -52,7 +69,7 @@ async def enhance_article(article: Article, config: LLMConfig | None = None) ->
             )
 
             try:
-                enhanced_text = await llm.generate(prompt)
+                enhanced_text = await _generate(llm, config, prompt, cache)
                 # Use a type check to satisfy mypy
                 content_item = enhanced_article.content[item_index]
                 if isinstance(content_item, ContentBlock):
@@ -62,3 +79,29 @@ async def enhance_article(article: Article, config: LLMConfig | None = None) ->
                 print(f"Error enhancing content: {e}")
 
     return enhanced_article
+
+
+async def _generate(
+    llm: LLMClient, config: LLMConfig, prompt: str, cache: BlockCache | None
+) -> str:
+    """Generate a completion, reusing a cached one for the same prompt.
+
+    The prompt embeds the block text, article title and context, so it
+    changes exactly when the block or its enhancement would.
+    """
+    if cache is None:
+        return await llm.generate(prompt)
+
+    key = hashlib.blake2b(
+        json.dumps(
+            [config.provider.value, config.model, config.temperature, prompt]
+        ).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    cached = cache.get(CACHE_NAMESPACE, key)
+    if cached is not None:
+        return cached
+
+    result = await llm.generate(prompt)
+    cache.put(CACHE_NAMESPACE, key, result)
+    return result
@@ -2,7 +2,21 @@
 
 import os
 import re
-from urllib.parse import urlparse
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlparse, urlunparse
+
+# Query parameters that select a different representation of an article
+# rather than tracking where a visitor came from
+PRESERVED_QUERY_PARAMS = ("format",)
+
+# Query parameters that only record where a visitor came from; all others,
+# such as the ``sk`` token of friend links, may change the page content
+TRACKING_QUERY_PARAMS = frozenset({"source", "gi", "fbclid", "gclid", "ref"})
+TRACKING_QUERY_PREFIXES = ("utm_",)
+
+# Characters with a meaning in the inline Markdown of article content
+_MARKDOWN_SPECIAL = re.compile(r"([\\*_\[\]`])")
+_MARKDOWN_ESCAPE = re.compile(r"\\([\\*_\[\]`])")
+_BACKTICK_RUN = re.compile(r"`+")
 
 
 def normalize_medium_url(url: str) -> str:
@@ -16,11 +30,16 @@ def normalize_medium_url(url: str) -> str:
     """
     parsed = urlparse(url)
 
+    # Keep representation parameters, drop tracking parameters
+    query = parse_qs(parsed.query)
+    preserved = {key: query[key][-1] for key in PRESERVED_QUERY_PARAMS if key in query}
+    suffix = f"?{urlencode(preserved)}" if preserved else ""
+
     # Handle medium.com URLs
     if parsed.netloc == "medium.com" or parsed.netloc.endswith(".medium.com"):
         # Remove tracking parameters
         path = parsed.path
-        return f"https://{parsed.netloc}{path}"
+        return f"https://{parsed.netloc}{path}{suffix}"
 
     # Handle custom domain publications
     # This is simplified and would need to be expanded for all Medium publications
@@ -37,12 +56,34 @@ def normalize_medium_url(url: str) -> str:
         parsed.netloc.endswith(f".{domain}") for domain in known_medium_domains
     ):
         path = parsed.path
-        return f"https://{parsed.netloc}{path}"
+        return f"https://{parsed.netloc}{path}{suffix}"
 
     # Return original URL if not recognized
     return url
 
 
+def strip_tracking_params(url: str) -> str:
+    """Remove the tracking parameters from a URL, keeping all others.
+
+    Unlike ``normalize_medium_url``, the result identifies the content served
+    for the URL, so it is suitable as a cache key.
+
+    Args:
+        url: The URL to strip
+
+    Returns:
+        The URL without tracking parameters or fragment
+    """
+    parsed = urlparse(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key not in TRACKING_QUERY_PARAMS
+        and not key.startswith(TRACKING_QUERY_PREFIXES)
+    ]
+    return urlunparse(parsed._replace(query=urlencode(query), fragment=""))
+
+
 def safe_filename(filename: str) -> str:
     """Create a safe filename from a string.
 
@@ -87,3 +128,47 @@ def get_default_output_path(url: str, title: str, format: str) -> str:
 
     # Use current directory
     return os.path.join(os.getcwd(), filename)
+
+
+def escape_markdown(text: str) -> str:
+    """Escape the characters that inline Markdown treats as formatting.
+
+    Args:
+        text: Literal text
+
+    Returns:
+        Text with backslashes before ``\\``, ``*``, ``_``, ``[``, ``]`` and
+        backticks
+    """
+    return _MARKDOWN_SPECIAL.sub(r"\\\1", text)
+
+
+def unescape_markdown(text: str) -> str:
+    """Remove the escapes added by ``escape_markdown``.
+
+    Args:
+        text: Text with escaped Markdown characters
+
+    Returns:
+        The literal text
+    """
+    return _MARKDOWN_ESCAPE.sub(r"\1", text)
+
+
+def code_span_markers(code: str) -> tuple[str, str]:
+    """Get the markers enclosing literal text in an inline Markdown code span.
+
+    The backtick fence is longer than any run of backticks in the text, and
+    a space separates it from text starting or ending with a backtick.
+
+    Args:
+        code: The literal text of the code span
+
+    Returns:
+        Tuple of opening and closing marker
+    """
+    longest = max((len(run) for run in _BACKTICK_RUN.findall(code)), default=0)
+    fence = "`" * (longest + 1)
+    if code.startswith("`") or code.endswith("`"):
+        return f"{fence} ", f" {fence}"
+    return fence, fence
@@ -1,5 +1,11 @@
 """Test fixtures for Medium Converter."""
 
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 
 from medium_converter.core.models import Article, ContentBlock, ContentType, Section
@@ -44,3 +50,63 @@ def sample_article() -> Article:
         url="https://medium.com/sample-article",
         tags=["test", "sample"],
     )
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """Serve Medium-like pages from ``tests/fixtures/pages``.
+
+    ``/<anything>/<slug>`` serves ``<slug>.html`` and
+    ``/<anything>/<slug>?format=json`` serves ``<slug>.json``.
+    """
+
+    def do_GET(self) -> None:
+        """Handle a GET request."""
+        parsed = urlparse(self.path)
+        slug = parsed.path.rstrip("/").rsplit("/", 1)[-1]
+        is_json = parse_qs(parsed.query).get("format") == ["json"]
+        page = FIXTURES_DIR / "pages" / f"{slug}.{'json' if is_json else 'html'}"
+
+        if not slug or not page.is_file():
+            self.send_error(404)
+            return
+
+        body = page.read_bytes()
+        content_type = "application/json" if is_json else "text/html; charset=utf-8"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silence request logging."""
+
+
+@pytest.fixture
+def fixtures_dir() -> Path:
+    """Get the directory holding test fixture files.
+
+    Returns:
+        Path of ``tests/fixtures``
+    """
+    return FIXTURES_DIR
+
+
+@pytest.fixture(scope="session")
+def fixture_server() -> Iterator[str]:
+    """Run a local HTTP server serving the page fixtures.
+
+    Returns:
+        Base URL of the server
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
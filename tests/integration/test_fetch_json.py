@@ -0,0 +1,90 @@
+"""Integration tests for fetching Medium's JSON representation."""
+
+from datetime import UTC, datetime
+
+from medium_converter.core.config import FetchConfig
+from medium_converter.core.fetcher import FetchSession
+from medium_converter.core.models import ContentType
+from medium_converter.core.post_json import parse_post_json, post_json_url
+
+
+def test_post_json_url():
+    """Test building the JSON representation URL."""
+    url = "https://medium.com/@author/post-123?source=rss"
+    assert post_json_url(url) == "https://medium.com/@author/post-123?format=json"
+
+    # Friend link tokens are kept so the full post is returned
+    url = "https://medium.com/@author/post-123?sk=abc&format=html"
+    assert post_json_url(url) == (
+        "https://medium.com/@author/post-123?sk=abc&format=json"
+    )
+
+
+def test_parse_post_json(fixtures_dir):
+    """Test mapping the JSON payload to an Article."""
+    data = (fixtures_dir / "pages" / "sample-post.json").read_bytes()
+    article = parse_post_json(data)
+
+    assert article.title == "Understanding Async Python"
+    assert article.author == "Jane Writer"
+    assert article.date == datetime(2024, 1, 1, tzinfo=UTC)
+    assert article.estimated_reading_time == 5
+    assert article.tags == ["Python", "Asyncio"]
+
+    types = [block.type for block in article.content]
+    assert types == [
+        ContentType.TEXT,
+        ContentType.HEADING,
+        ContentType.TEXT,
+        ContentType.IMAGE,
+        ContentType.CODE,
+        ContentType.QUOTE,
+        ContentType.LIST,
+        ContentType.LIST,
+        ContentType.HEADING,
+        ContentType.TEXT,
+    ]
+
+    blocks = article.content
+    assert blocks[0].content == "**Async code** lets one thread wait on *many things.*"
+    assert blocks[2].content == (
+        "Read the [asyncio docs](https://docs.python.org/3/library/asyncio.html) "
+        "for details."
+    )
+    assert blocks[3].metadata["alt"] == "An event loop diagram"
+    assert blocks[4].metadata == {"language": "python"}
+    assert blocks[6].content == "Tasks\nFutures"
+    assert blocks[7].metadata == {"list_type": "ordered"}
+    assert blocks[7].content == "Create a loop\n`Run` until complete"
+    assert blocks[8].metadata == {"level": 3}
+
+
+async def test_get_article_prefers_json(fixture_server):
+    """Test that the JSON representation is fetched when available."""
+    async with FetchSession() as session:
+        article = await session.get_article(f"{fixture_server}/@author/sample-post")
+
+    assert article.author == "Jane Writer"
+    assert len(article.content) == 10
+
+
+async def test_get_article_falls_back_to_html(fixture_server):
+    """Test that the HTML page is parsed when JSON is unavailable."""
+    url = f"{fixture_server}/@author/html-only"
+
+    async with FetchSession() as session:
+        article = await session.get_article(url)
+
+    assert article.author == "Jane Writer"
+    assert len(article.content) == 10
+
+
+async def test_get_article_json_disabled(fixture_server):
+    """Test that the JSON representation can be skipped."""
+    config = FetchConfig(prefer_json=False)
+
+    async with FetchSession(config=config) as session:
+        article = await session.get_article(f"{fixture_server}/@author/sample-post")
+
+    # Only the HTML page carries the canonical link
+    assert article.url.startswith("https://medium.com/@author/")
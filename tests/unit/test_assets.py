@@ -0,0 +1,137 @@
+"""Tests for image downloading and caching."""
+
+import asyncio
+import io
+
+import httpx
+import pytest
+
+from medium_converter.core.assets import (
+    ImageCache,
+    ImageFetcher,
+    image_urls,
+    prepare_image,
+)
+from medium_converter.core.config import CacheConfig, ImageConfig
+from medium_converter.core.models import Article, ContentBlock, ContentType, Section
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def make_image(width: int, height: int, image_format: str = "PNG") -> bytes:
+    """Create an image of the given size and format."""
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(output, image_format)
+    return output.getvalue()
+
+
+def make_article(*urls: str) -> Article:
+    """Create an article with one image block per URL inside a section."""
+    return Article(
+        title="Images",
+        author="Author",
+        date="2023-01-01",
+        content=[
+            ContentBlock(type=ContentType.TEXT, content="Intro"),
+            Section(
+                title="Gallery",
+                blocks=[
+                    ContentBlock(
+                        type=ContentType.IMAGE, content=url, metadata={"alt": "A"}
+                    )
+                    for url in urls
+                ],
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def image_cache(tmp_path):
+    """Create an image cache in a temporary directory."""
+    return ImageCache(CacheConfig(cache_dir=str(tmp_path)))
+
+
+class TestImageFetcher:
+    """Tests for concurrent image downloads."""
+
+    async def test_fetch_all_bounded_and_cached(self, image_cache):
+        """Test that downloads run concurrently, bounded, and are cached."""
+        png = make_image(10, 10)
+        active = peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, content=png)
+
+        urls = [f"https://miro.medium.com/{i}" for i in range(6)]
+        config = ImageConfig(max_concurrency=3)
+        async with ImageFetcher(
+            config, image_cache, httpx.MockTransport(handler)
+        ) as fetcher:
+            paths = await fetcher.fetch_all(
+                [*urls, urls[0], "https://miro.medium.com/missing"]
+            )
+
+        assert peak == 3
+        assert set(paths) == set(urls)
+        # Identical content is stored once
+        assert len(set(paths.values())) == 1
+        assert paths[urls[0]].read_bytes() == png
+
+        def fail(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("cached images must not be downloaded")
+
+        async with ImageFetcher(
+            config, image_cache, httpx.MockTransport(fail)
+        ) as fetcher:
+            assert await fetcher.fetch(urls[1]) == paths[urls[1]]
+
+    async def test_localize_article(self, image_cache):
+        """Test that image blocks are pointed at the downloaded files."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=make_image(4, 4))
+        )
+        article = make_article("https://miro.medium.com/a", "local.png")
+
+        async with ImageFetcher(cache=image_cache, transport=transport) as fetcher:
+            localized = await fetcher.localize(article)
+
+        assert image_urls(article) == ["https://miro.medium.com/a"]
+        assert image_urls(localized) == []
+        blocks = localized.content[1].blocks
+        assert blocks[0].content.startswith(str(image_cache.directory))
+        assert blocks[0].metadata == {"alt": "A"}
+        assert blocks[1].content == "local.png"
+        # The original article is left untouched
+        assert article.content[1].blocks[0].content == "https://miro.medium.com/a"
+
+
+class TestPrepareImage:
+    """Tests for image format detection and downsizing."""
+
+    def test_keeps_small_images(self):
+        """Test that images within the width limit are kept unchanged."""
+        jpeg = make_image(100, 50, "JPEG")
+        assert prepare_image(jpeg, 1400) == (jpeg, "jpg")
+
+    def test_downsizes_wide_images(self):
+        """Test that wide images are scaled down, keeping the aspect ratio."""
+        data, extension = prepare_image(make_image(2800, 200), 1400)
+
+        assert extension == "png"
+        assert Image.open(io.BytesIO(data)).size == (1400, 100)
+
+    def test_converts_and_rejects(self):
+        """Test that WebP is converted to PNG and non-images are rejected."""
+        data, extension = prepare_image(make_image(10, 10, "WEBP"), None)
+
+        assert extension == "png"
+        assert Image.open(io.BytesIO(data)).format == "PNG"
+        assert prepare_image(b"<html>not an image</html>", None) is None
@@ -0,0 +1,73 @@
+"""Tests for browser cookie extraction."""
+
+import os
+import stat
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from medium_converter.core import auth
+
+
+@pytest.fixture
+def cookie_env(tmp_path, monkeypatch):
+    """Isolate the cookie cache and count browser extractions."""
+    cache_file = tmp_path / "cache" / "cookies.json"
+    db_file = tmp_path / "Cookies"
+    db_file.write_bytes(b"")
+    calls = []
+
+    def extract():
+        calls.append(1)
+        return {"sid": f"value-{len(calls)}"}, time.time() + 3600
+
+    monkeypatch.setattr(auth, "_cache_file_path", lambda: cache_file)
+    monkeypatch.setattr(auth, "COOKIE_DB_PATTERNS", (str(db_file),))
+    monkeypatch.setattr(auth, "_extract_cookies", extract)
+    monkeypatch.setattr(auth, "_memory_cache", None)
+    return SimpleNamespace(cache_file=cache_file, db_file=db_file, calls=calls)
+
+
+def test_cookies_extracted_once(cookie_env):
+    """Test that repeated calls reuse the cached cookies."""
+    assert auth.get_medium_cookies() == {"sid": "value-1"}
+    assert auth.get_medium_cookies() == {"sid": "value-1"}
+    assert len(cookie_env.calls) == 1
+
+
+def test_disk_cache_reused_and_private(cookie_env, monkeypatch):
+    """Test that a fresh process reuses the owner-only on-disk cache."""
+    auth.get_medium_cookies()
+    mode = stat.S_IMODE(os.stat(cookie_env.cache_file).st_mode)
+    assert mode == 0o600
+
+    # Simulate a new process with an empty in-memory cache
+    monkeypatch.setattr(auth, "_memory_cache", None)
+    assert auth.get_medium_cookies() == {"sid": "value-1"}
+    assert len(cookie_env.calls) == 1
+
+
+def test_cache_invalidated_by_database_change(cookie_env):
+    """Test that a modified browser database triggers a new extraction."""
+    auth.get_medium_cookies()
+    mtime = os.stat(cookie_env.db_file).st_mtime_ns + 1_000_000_000
+    os.utime(cookie_env.db_file, ns=(mtime, mtime))
+
+    assert auth.get_medium_cookies() == {"sid": "value-2"}
+
+
+def test_cache_invalidated_by_expiry(cookie_env, monkeypatch):
+    """Test that expired cookies trigger a new extraction."""
+    monkeypatch.setattr(
+        auth, "_extract_cookies", lambda: ({"sid": "expired"}, time.time() - 1)
+    )
+    auth.get_medium_cookies()
+    monkeypatch.setattr(auth, "_extract_cookies", lambda: ({"sid": "new"}, None))
+
+    assert auth.get_medium_cookies() == {"sid": "new"}
+
+
+def test_browser_cookie3_imported_lazily():
+    """Test that importing the auth module does not load browser_cookie3."""
+    assert not hasattr(auth, "browser_cookie3")
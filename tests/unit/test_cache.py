@@ -0,0 +1,144 @@
+"""Tests for the on-disk caches."""
+
+import time
+from unittest.mock import patch
+
+import httpx
+
+from medium_converter.core import cache as cache_module
+from medium_converter.core.cache import DiskStore, FetchCache, ParseCache
+from medium_converter.core.config import CacheConfig
+from medium_converter.core.fetcher import FetchSession
+
+
+class TestDiskStore:
+    """Tests for the SQLite-backed store."""
+
+    def test_put_get(self, tmp_path):
+        """Test storing and retrieving an entry."""
+        store = DiskStore(tmp_path / "store.sqlite3", max_size=1024)
+        store.put("key", b"value", {"a": 1})
+
+        value, meta, stored_at = store.get("key")
+        assert value == b"value"
+        assert meta == {"a": 1}
+        assert stored_at <= time.time()
+        assert store.get("missing") is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted first."""
+        store = DiskStore(tmp_path / "store.sqlite3", max_size=25)
+        store.put("a", b"x" * 10)
+        store.put("b", b"x" * 10)
+        # Mark "a" as recently used so "b" becomes the eviction candidate
+        time.sleep(0.01)
+        store.get("a")
+        store.put("c", b"x" * 10)
+
+        assert store.get("a") is not None
+        assert store.get("b") is None
+        assert store.get("c") is not None
+        assert store.total_size() <= 25
+
+
+class TestFetchCache:
+    """Tests for the fetch cache."""
+
+    def test_roundtrip_with_validators(self, tmp_path):
+        """Test that bodies and validators survive a round trip."""
+        cache = FetchCache(CacheConfig(cache_dir=str(tmp_path)))
+        cache.put(
+            "https://medium.com/article?source=feed",
+            b"<html></html>",
+            etag='"abc"',
+            last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+        )
+
+        cached = cache.get("https://medium.com/article")
+        assert cached.body == b"<html></html>"
+        assert cached.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+
+    def test_friend_link_is_separate_entry(self, tmp_path):
+        """Test that query parameters other than tracking ones are kept."""
+        cache = FetchCache(CacheConfig(cache_dir=str(tmp_path)))
+        cache.put("https://medium.com/article?sk=abc", b"full")
+        cache.put("https://medium.com/article", b"preview")
+
+        assert cache.get("https://medium.com/article?sk=abc").body == b"full"
+        assert cache.get("https://medium.com/article?source=rss").body == b"preview"
+
+    async def test_session_serves_fresh_entry(self, tmp_path):
+        """Test that fresh entries are served without a request."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="<p>body</p>", headers={"ETag": '"v1"'})
+
+        cache = FetchCache(CacheConfig(cache_dir=str(tmp_path)))
+        transport = httpx.MockTransport(handler)
+        async with FetchSession(transport=transport, cache=cache) as session:
+            assert await session.fetch("https://medium.com/a") == "<p>body</p>"
+            assert await session.fetch("https://medium.com/a") == "<p>body</p>"
+
+        assert len(requests) == 1
+
+    async def test_session_revalidates_stale_entry(self, tmp_path):
+        """Test that stale entries are revalidated with a conditional request."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text="<p>body</p>", headers={"ETag": '"v1"'})
+
+        cache = FetchCache(CacheConfig(cache_dir=str(tmp_path), ttl=0))
+        transport = httpx.MockTransport(handler)
+        async with FetchSession(transport=transport, cache=cache) as session:
+            assert await session.fetch("https://medium.com/a") == "<p>body</p>"
+            assert await session.fetch("https://medium.com/a") == "<p>body</p>"
+
+        assert len(requests) == 2
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+class TestParseCache:
+    """Tests for the parse result cache."""
+
+    def test_parse_reuses_result(self, tmp_path, fixtures_dir):
+        """Test that identical pages are parsed only once."""
+        html = (fixtures_dir / "pages" / "sample-post.html").read_bytes()
+        cache = ParseCache(CacheConfig(cache_dir=str(tmp_path)))
+
+        with patch.object(
+            cache_module, "parse_article", wraps=cache_module.parse_article
+        ) as parse:
+            first = cache.parse(html)
+            second = ParseCache(CacheConfig(cache_dir=str(tmp_path))).parse(html)
+
+        assert parse.call_count == 1
+        assert second == first
+        assert second.date == first.date
+
+    def test_parser_version_invalidates(self, tmp_path, fixtures_dir):
+        """Test that results from another parser version are not used."""
+        html = (fixtures_dir / "pages" / "sample-post.html").read_bytes()
+        cache = ParseCache(CacheConfig(cache_dir=str(tmp_path)))
+        cache.parse(html)
+
+        with patch.object(cache_module, "PARSER_VERSION", -1):
+            assert cache.get(html) is None
+        assert cache.get(html) is not None
+
+    def test_encoding_is_part_of_key(self, tmp_path, fixtures_dir):
+        """Test that a page parsed with another encoding is not reused."""
+        html = (fixtures_dir / "pages" / "sample-post.html").read_bytes()
+        cache = ParseCache(CacheConfig(cache_dir=str(tmp_path)))
+        cache.parse(html, "utf-8")
+
+        assert cache.get(html, "utf-8") is not None
+        assert cache.get(html, "iso8859-1") is None
@@ -103,15 +103,18 @@ class TestDocxExporter:
         output_file = tmp_path / "test.docx"
         exporter = DocxExporter()
 
-        with patch("docx.Document") as mock_document:
+        with patch("medium_converter.exporters.docx._new_document") as mock_document:
             # Setup the mock
             mock_doc = MagicMock()
+            mock_doc.save.side_effect = lambda obj: obj.write(b"mock docx content")
             mock_document.return_value = mock_doc
 
-            exporter.export(article, str(output_file))
+            result = exporter.export(article, str(output_file))
 
-            # Check that save was called with the correct path
-            mock_doc.save.assert_called_once_with(str(output_file))
+        # The document is serialized once and the bytes are reused
+        mock_doc.save.assert_called_once()
+        assert result == b"mock docx content"
+        assert output_file.read_bytes() == result
 
     def test_export_to_fileobj(self):
         """Test exporting to a file-like object."""
@@ -126,23 +129,56 @@ class TestDocxExporter:
 
         output = io.BytesIO()
         exporter = DocxExporter()
+        result = exporter.export(article, output)
 
-        # Replace actual implementation with mock
-        with (
-            patch.object(DocxExporter, "_format_block"),
-            patch("docx.Document") as mock_document,
-        ):
-            mock_doc = MagicMock()
-            mock_document.return_value = mock_doc
-            mock_bytes = b"mock docx content"
-            mock_bytesio = MagicMock()
-            mock_bytesio.read.return_value = mock_bytes
-            mock_doc.save.side_effect = lambda obj: None  # Mock the save method
-
-            with patch("io.BytesIO", return_value=mock_bytesio):
-                result = exporter.export(article, output)
-
-                # Check that write was called
-                assert mock_bytesio.read.called
-                # The result should be the mock bytes
-                assert result == mock_bytes
+        assert output.getvalue() == result
+        doc = docx.Document(io.BytesIO(result))
+        assert "This is a test paragraph." in [p.text for p in doc.paragraphs]
+
+    def test_export_styles_and_template(self):
+        """Test that styles are applied and the cached template stays pristine."""
+        article = Article(
+            title="Styled Article",
+            author="Test Author",
+            date="2023-01-01",
+            content=[
+                ContentBlock(type=ContentType.QUOTE, content="A quote."),
+                ContentBlock(
+                    type=ContentType.LIST,
+                    content="One\nTwo",
+                    metadata={"list_type": "ordered"},
+                ),
+            ],
+        )
+
+        exporter = DocxExporter()
+        first = docx.Document(io.BytesIO(exporter.export(article)))
+        second = docx.Document(io.BytesIO(exporter.export(article)))
+
+        styles = {p.text: p.style.name for p in second.paragraphs if p.text}
+        assert styles["Styled Article"] == "Title"
+        assert styles["A quote."] == "Quote"
+        assert styles["One"] == "List Number"
+        assert len(first.paragraphs) == len(second.paragraphs)
+
+    def test_export_local_image(self, tmp_path):
+        """Test that images with a local path are embedded."""
+        pil_image = pytest.importorskip("PIL.Image")
+        image_path = tmp_path / "image.png"
+        pil_image.new("RGB", (20, 10), "blue").save(image_path)
+        article = Article(
+            title="Image Article",
+            author="Test Author",
+            date="2023-01-01",
+            content=[
+                ContentBlock(
+                    type=ContentType.IMAGE,
+                    content=str(image_path),
+                    metadata={"alt": "Blue"},
+                )
+            ],
+        )
+
+        result = DocxExporter().export(article)
+
+        assert len(docx.Document(io.BytesIO(result)).inline_shapes) == 1
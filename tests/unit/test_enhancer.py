@@ -0,0 +1,42 @@
+"""Tests for LLM enhancement."""
+
+from unittest.mock import patch
+
+from medium_converter.core.cache import BlockCache
+from medium_converter.core.config import CacheConfig
+from medium_converter.core.models import ContentBlock, ContentType
+from medium_converter.llm.config import LLMConfig
+from medium_converter.llm.enhancer import enhance_article
+from medium_converter.llm.providers import LLMClient
+
+
+class RecordingClient(LLMClient):
+    """LLM client that records prompts and echoes the text being enhanced."""
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    async def generate(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        text = prompt.split("THE TEXT TO ENHANCE:\n", 1)[1].split("\n\n", 1)[0]
+        return text.upper()
+
+
+async def test_enhance_reuses_cached_blocks(sample_article, tmp_path):
+    """Test that only changed blocks are sent to the LLM again."""
+    cache = BlockCache(CacheConfig(cache_dir=str(tmp_path)))
+    client = RecordingClient()
+
+    with patch("medium_converter.llm.enhancer.get_llm_client", return_value=client):
+        first = await enhance_article(sample_article, LLMConfig(), cache)
+        assert len(client.prompts) == 2
+
+        sample_article.content.append(
+            ContentBlock(type=ContentType.TEXT, content="An edited paragraph.")
+        )
+        second = await enhance_article(sample_article, LLMConfig(), cache)
+
+    assert len(client.prompts) == 3
+    assert "An edited paragraph." in client.prompts[-1]
+    assert second.content[0] == first.content[0]
+    assert second.content[-1].content == "AN EDITED PARAGRAPH."
@@ -0,0 +1,95 @@
+"""Tests for the EPUB exporter."""
+
+import io
+import zipfile
+
+from lxml import etree
+
+from medium_converter.core.models import Article, ContentBlock, ContentType
+from medium_converter.exporters.epub import EpubBook, EPUBExporter
+
+
+def make_article(number: int, image_path: str) -> Article:
+    """Create an article with a shared image and some inline markup."""
+    return Article(
+        title=f"Article {number} & more",
+        author="Author",
+        date="2023-01-01",
+        content=[
+            ContentBlock(type=ContentType.TEXT, content="Some **bold** <text>."),
+            ContentBlock(
+                type=ContentType.IMAGE, content=image_path, metadata={"alt": "Fig"}
+            ),
+            ContentBlock(
+                type=ContentType.IMAGE,
+                content="https://miro.medium.com/remote.png",
+                metadata={"alt": "Remote"},
+            ),
+            ContentBlock(
+                type=ContentType.LIST,
+                content="One\nTwo",
+                metadata={"list_type": "ordered"},
+            ),
+        ],
+    )
+
+
+class TestEPUBExporter:
+    """Tests for the EPUB exporter."""
+
+    def test_export_bundle(self, tmp_path):
+        """Test bundling many articles with deduplicated images."""
+        image_path = tmp_path / "image.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\nfake")
+        output = tmp_path / "bundle.epub"
+
+        chapters = EPUBExporter().export_bundle(
+            (make_article(i, str(image_path)) for i in range(3)),
+            str(output),
+            title="Bundle",
+            author="Editor",
+        )
+
+        assert chapters == 3
+        with zipfile.ZipFile(output) as book:
+            first = book.infolist()[0]
+            assert first.filename == "mimetype"
+            assert first.compress_type == zipfile.ZIP_STORED
+            assert book.read("mimetype") == b"application/epub+zip"
+
+            names = book.namelist()
+            assert len([n for n in names if n.startswith("OEBPS/images/")]) == 1
+            # Every document is well-formed XML
+            for name in names:
+                if name.endswith((".xhtml", ".opf", ".xml")):
+                    etree.fromstring(book.read(name))
+
+            package = etree.fromstring(book.read("OEBPS/content.opf"))
+            namespace = {"opf": "http://www.idpf.org/2007/opf"}
+            assert len(package.findall(".//opf:spine/opf:itemref", namespace)) == 3
+            chapter = book.read("OEBPS/chapters/0002.xhtml").decode("utf-8")
+            assert "<h1>Article 1 &amp; more</h1>" in chapter
+            assert "<strong>bold</strong> &lt;text&gt;." in chapter
+            assert "[Image: Remote]" in chapter
+
+    def test_export_single_article(self, tmp_path):
+        """Test exporting one article to a path and to a stream."""
+        article = make_article(1, str(tmp_path / "missing.png"))
+        output = tmp_path / "article.epub"
+        stream = io.BytesIO()
+
+        result = EPUBExporter().export(article, str(output))
+        EPUBExporter().export(article, stream)
+
+        assert output.read_bytes() == result
+        with zipfile.ZipFile(stream) as book:
+            assert "OEBPS/chapters/0001.xhtml" in book.namelist()
+
+    def test_book_closes_once(self, tmp_path):
+        """Test that closing a book twice is harmless."""
+        book = EpubBook(str(tmp_path / "empty.epub"), title="Empty")
+        book.close()
+        book.close()
+
+        with zipfile.ZipFile(tmp_path / "empty.epub") as archive:
+            assert "OEBPS/content.opf" in archive.namelist()
@@ -0,0 +1,53 @@
+"""Tests for parallel exporting in a process pool."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from medium_converter.core.config import ExportConfig
+from medium_converter.exporters import get_exporter
+from medium_converter.exporters.pool import ExportPool
+
+
+def test_export_batch_matches_serial(sample_article, tmp_path):
+    """Test that workers write the same files as exporting serially."""
+    pytest.importorskip("docx")
+    jobs = [(sample_article, str(tmp_path / f"article-{i}.md")) for i in range(3)]
+
+    with ExportPool(["markdown", "docx"], ExportConfig(workers=2)) as pool:
+        outputs = pool.export_batch("markdown", jobs)
+        docx_output = pool.export_batch(
+            "docx", [(sample_article, str(tmp_path / "article.docx"))]
+        )
+
+    expected = get_exporter("markdown").export(sample_article)
+    assert outputs == [output for _, output in jobs]
+    for output in outputs:
+        with open(output, encoding="utf-8") as f:
+            assert f.read() == expected
+    assert (tmp_path / "article.docx").stat().st_size > 0
+    assert docx_output == [str(tmp_path / "article.docx")]
+
+
+async def test_export_async(sample_article, tmp_path):
+    """Test exporting a single article from async code."""
+    output = str(tmp_path / "article.md")
+
+    with ExportPool(["markdown"], ExportConfig(workers=1)) as pool:
+        assert await pool.export(sample_article, "markdown", output) == output
+
+    assert (tmp_path / "article.md").read_text(encoding="utf-8").startswith("# ")
+
+
+def test_unknown_format():
+    """Test that unknown formats are rejected before workers start."""
+    with pytest.raises(ValueError, match="Unknown export format"):
+        ExportPool(["rtf"])
+
+
+def test_missing_dependency():
+    """Test that formats missing a dependency are rejected up front."""
+    with patch.dict(sys.modules, {"reportlab": None}):
+        with pytest.raises(ImportError, match="reportlab"):
+            ExportPool(["pdf"])
@@ -0,0 +1,417 @@
+"""Tests for the article fetcher."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from medium_converter.core.coalesce import SingleFlight
+from medium_converter.core.config import FetchConfig, RateLimitConfig, RetryPolicy
+from medium_converter.core.fetcher import (
+    FetchSession,
+    ResponseTooLargeError,
+    fetch_article,
+)
+from medium_converter.core.ratelimit import (
+    HostLimiter,
+    HostRateLimiter,
+    parse_retry_after,
+)
+
+
+def make_transport(handler):
+    """Create a mock transport that records every request it receives."""
+    requests = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    return httpx.MockTransport(record), requests
+
+
+class TestFetchSession:
+    """Tests for the pooled fetch session."""
+
+    async def test_reuses_one_client(self):
+        """Test that every fetch in a session goes through the same client."""
+        transport, requests = make_transport(
+            lambda request: httpx.Response(200, text=f"<p>{request.url.path}</p>")
+        )
+
+        async with FetchSession(transport=transport) as session:
+            client = session.client
+            first = await fetch_article("https://medium.com/a", session=session)
+            second = await fetch_article("https://medium.com/b", session=session)
+            assert session.client is client
+
+        assert first == "<p>/a</p>"
+        assert second == "<p>/b</p>"
+        assert len(requests) == 2
+
+    async def test_close_releases_client(self):
+        """Test that leaving the context closes the client."""
+        transport, _ = make_transport(lambda request: httpx.Response(200))
+
+        async with FetchSession(transport=transport) as session:
+            client = session.client
+
+        assert client.is_closed
+        assert session._client is None
+
+    async def test_config_applied(self):
+        """Test that configuration reaches the underlying client."""
+        config = FetchConfig(timeout=5.0, user_agent="medium-converter-test")
+        transport, requests = make_transport(lambda request: httpx.Response(200))
+
+        async with FetchSession(config=config, transport=transport) as session:
+            await session.fetch("https://medium.com/a")
+            assert session.client.timeout.read == 5.0
+
+        assert requests[0].headers["User-Agent"] == "medium-converter-test"
+
+    async def test_http_error_raised(self):
+        """Test that HTTP errors are raised."""
+        transport, _ = make_transport(lambda request: httpx.Response(404))
+
+        async with FetchSession(transport=transport) as session:
+            with pytest.raises(httpx.HTTPStatusError):
+                await session.fetch("https://medium.com/missing")
+
+
+class TestRateLimiting:
+    """Tests for per-host rate limiting."""
+
+    def test_parse_retry_after(self):
+        """Test parsing both forms of the Retry-After header."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("Wed, 01 Jan 2020 00:00:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_aimd_limit(self):
+        """Test additive increase and multiplicative decrease."""
+        limiter = HostLimiter(RateLimitConfig(initial_concurrency=4))
+
+        for _ in range(4):
+            limiter.record(200)
+        assert limiter.limit == 5.0
+
+        limiter.record(429, retry_after=0.0)
+        assert limiter.limit == 2.5
+
+        limiter.record(503, retry_after=0.0)
+        limiter.record(503, retry_after=0.0)
+        assert limiter.limit == 1.0
+
+    async def test_throttled_request_retried(self):
+        """Test that a 429 response is retried after Retry-After."""
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, text="ok"),
+            ]
+        )
+        transport, requests = make_transport(lambda request: next(responses))
+        limiter = HostRateLimiter(RateLimitConfig(requests_per_second=1000.0))
+
+        async with FetchSession(transport=transport, rate_limiter=limiter) as session:
+            assert await session.fetch("https://medium.com/a") == "ok"
+
+        assert len(requests) == 2
+        assert limiter.host("medium.com").limit < 4
+
+    async def test_throttling_not_retried_twice(self):
+        """Test that the retry policy leaves throttling to the rate limiter."""
+        transport, requests = make_transport(
+            lambda request: httpx.Response(429, headers={"Retry-After": "0"})
+        )
+        limiter = HostRateLimiter(
+            RateLimitConfig(requests_per_second=1000.0, max_throttle_retries=2)
+        )
+        policy = RetryPolicy(max_attempts=3, backoff_base=0.0)
+
+        async with FetchSession(
+            transport=transport, rate_limiter=limiter, retry_policy=policy
+        ) as session:
+            with pytest.raises(httpx.HTTPStatusError):
+                await session.fetch("https://medium.com/a")
+
+        assert len(requests) == 3
+
+    async def test_concurrency_bounded(self):
+        """Test that in-flight requests per host never exceed the limit."""
+        limiter = HostRateLimiter(
+            RateLimitConfig(
+                requests_per_second=1000.0, initial_concurrency=2, max_concurrency=2
+            )
+        )
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter.slot("medium.com"):
+                peak = max(peak, limiter.host("medium.com").in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        assert peak == 2
+
+
+class TestCoalescing:
+    """Tests for single-flight request coalescing."""
+
+    async def test_single_flight_shares_result(self):
+        """Test that concurrent calls with one key run the work once."""
+        group = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(group.do("key", work) for _ in range(5)))
+        assert results == [1] * 5
+        assert len(group) == 0
+
+        # Once finished, the key runs again
+        assert await group.do("key", work) == 2
+
+    async def test_duplicate_urls_fetched_once(self):
+        """Test that duplicate URL forms share one network fetch."""
+
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, text="<p>body</p>")
+
+        transport, requests = make_transport(handler)
+        urls = [
+            "https://medium.com/a",
+            "https://medium.com/a?source=rss",
+            "https://medium.com/a?utm_campaign=x",
+        ]
+
+        config = FetchConfig(prefer_json=False)
+
+        async with FetchSession(config=config, transport=transport) as session:
+            articles = await asyncio.gather(*(session.get_article(u) for u in urls))
+
+        assert len(requests) == 1
+        assert articles[0] is articles[1] is articles[2]
+        assert articles[0].url == "https://medium.com/a"
+
+    async def test_coalescing_disabled(self):
+        """Test that coalescing can be turned off."""
+        transport, requests = make_transport(lambda request: httpx.Response(200))
+        config = FetchConfig(coalesce=False)
+
+        async with FetchSession(config=config, transport=transport) as session:
+            await asyncio.gather(
+                session.fetch("https://medium.com/a"),
+                session.fetch("https://medium.com/a"),
+            )
+
+        assert len(requests) == 2
+
+
+class TestStreaming:
+    """Tests for streaming fetches with a size limit."""
+
+    async def test_fetch_bytes_and_charset(self):
+        """Test fetching raw bytes and decoding with the declared charset."""
+        body = "<p>café</p>".encode("latin-1")
+        transport, _ = make_transport(
+            lambda request: httpx.Response(
+                200,
+                content=body,
+                headers={"Content-Type": "text/html; charset=latin-1"},
+            )
+        )
+
+        async with FetchSession(transport=transport) as session:
+            assert await session.fetch_bytes("https://medium.com/a") == body
+            assert await session.fetch("https://medium.com/a") == "<p>café</p>"
+
+    async def test_response_charset_used_for_parsing(self):
+        """Test that pages are parsed with the charset of the response."""
+        body = "<article><p>café</p></article>".encode("latin-1")
+        transport, _ = make_transport(
+            lambda request: httpx.Response(
+                200,
+                content=body,
+                headers={"Content-Type": "text/html; charset=latin-1"},
+            )
+        )
+
+        async with FetchSession(transport=transport) as session:
+            article = await session.get_article("https://medium.com/a")
+            blocks = [b async for b in session.iter_blocks("https://medium.com/a")]
+
+        assert article.content[0].content == "café"
+        assert blocks[0].content == "café"
+
+    async def test_oversized_json_falls_back_to_html(self):
+        """Test that an oversized JSON representation is not fatal."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("format") == "json":
+                return httpx.Response(200, content=b"x" * 2048)
+            return httpx.Response(200, content=b"<article><p>Page</p></article>")
+
+        transport, _ = make_transport(handler)
+        config = FetchConfig(max_bytes=1024)
+
+        async with FetchSession(config=config, transport=transport) as session:
+            article = await session.get_article("https://medium.com/a")
+
+        assert [block.content for block in article.content] == ["Page"]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [b'{"payload":{"value":{"title":"T"}}}', b'{"payload":{"value":"x"}}'],
+    )
+    async def test_json_without_body_falls_back_to_html(self, payload):
+        """Test that JSON without the post's paragraphs is not used."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("format") == "json":
+                return httpx.Response(200, content=payload)
+            return httpx.Response(200, content=b"<article><p>Page</p></article>")
+
+        transport, _ = make_transport(handler)
+
+        async with FetchSession(transport=transport) as session:
+            article = await session.get_article("https://medium.com/a")
+
+        assert [block.content for block in article.content] == ["Page"]
+
+    async def test_oversized_response_rejected(self):
+        """Test that bodies larger than the limit are aborted."""
+        transport, _ = make_transport(
+            lambda request: httpx.Response(200, content=b"x" * 2048)
+        )
+        config = FetchConfig(max_bytes=1024)
+
+        async with FetchSession(config=config, transport=transport) as session:
+            with pytest.raises(ResponseTooLargeError):
+                await session.fetch_bytes("https://medium.com/a")
+
+    async def test_iter_bytes_streams_chunks(self):
+        """Test streaming a body chunk by chunk."""
+
+        async def stream():
+            for chunk in (b"<p>one</p>", b"<p>two</p>"):
+                yield chunk
+
+        transport, _ = make_transport(
+            lambda request: httpx.Response(200, content=stream())
+        )
+
+        async with FetchSession(transport=transport) as session:
+            chunks = [c async for c in session.iter_bytes("https://medium.com/a")]
+
+        assert b"".join(chunks) == b"<p>one</p><p>two</p>"
+
+    async def test_iter_blocks_before_body_complete(self):
+        """Test that blocks are yielded while the page is still arriving."""
+        sent = []
+
+        async def stream():
+            for chunk in (b"<article><p>one</p>", b"<p>two</p>", b"</article>"):
+                sent.append(chunk)
+                yield chunk
+
+        transport, _ = make_transport(
+            lambda request: httpx.Response(200, content=stream())
+        )
+
+        async with FetchSession(transport=transport) as session:
+            blocks = []
+            async for block in session.iter_blocks("https://medium.com/a"):
+                blocks.append((block.content, len(sent)))
+
+        assert blocks[0][0] == "one"
+        assert blocks[0][1] < 3
+        assert [content for content, _ in blocks] == ["one", "two"]
+
+
+class TestRetries:
+    """Tests for the retry policy and request hedging."""
+
+    async def test_transient_errors_retried(self):
+        """Test that connection errors and 5xx responses are retried."""
+        outcomes = iter(
+            [
+                httpx.ConnectError("reset"),
+                httpx.Response(502),
+                httpx.Response(200, text="ok"),
+            ]
+        )
+
+        def handler(request):
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        transport, requests = make_transport(handler)
+        policy = RetryPolicy(max_attempts=3, backoff_base=0.0)
+
+        async with FetchSession(transport=transport, retry_policy=policy) as session:
+            assert await session.fetch("https://medium.com/a") == "ok"
+
+        assert len(requests) == 3
+
+    async def test_gives_up_after_max_attempts(self):
+        """Test that the last error is raised once attempts run out."""
+        transport, requests = make_transport(lambda request: httpx.Response(500))
+        policy = RetryPolicy(max_attempts=2, backoff_base=0.0)
+
+        async with FetchSession(transport=transport, retry_policy=policy) as session:
+            with pytest.raises(httpx.HTTPStatusError):
+                await session.fetch("https://medium.com/a")
+
+        assert len(requests) == 2
+
+    async def test_attempt_timeout(self):
+        """Test that slow attempts time out and are retried."""
+        delays = iter([1.0, 0.0])
+
+        async def handler(request):
+            await asyncio.sleep(next(delays))
+            return httpx.Response(200, text="ok")
+
+        transport, requests = make_transport(handler)
+        policy = RetryPolicy(max_attempts=2, backoff_base=0.0, attempt_timeout=0.05)
+
+        async with FetchSession(transport=transport, retry_policy=policy) as session:
+            assert await session.fetch("https://medium.com/a") == "ok"
+
+        assert len(requests) == 2
+
+    async def test_hedged_request_wins(self):
+        """Test that a slow request is hedged and the faster one wins."""
+        delays = iter([0.0, 0.0, 1.0, 0.0])
+
+        async def handler(request):
+            await asyncio.sleep(next(delays))
+            return httpx.Response(200, text=request.url.path)
+
+        transport, requests = make_transport(handler)
+        policy = RetryPolicy(hedge=True, hedge_min_samples=2)
+        config = FetchConfig(coalesce=False)
+
+        async with FetchSession(
+            config=config, transport=transport, retry_policy=policy
+        ) as session:
+            await session.fetch("https://medium.com/warm-1")
+            await session.fetch("https://medium.com/warm-2")
+
+            started = time.monotonic()
+            assert await session.fetch("https://medium.com/slow") == "/slow"
+            assert time.monotonic() - started < 0.5
+
+        assert len(requests) == 4
@@ -3,9 +3,12 @@
 import os
 
 from medium_converter.utils.helpers import (
+    escape_markdown,
     get_default_output_path,
     normalize_medium_url,
     safe_filename,
+    strip_tracking_params,
+    unescape_markdown,
 )
 
 
@@ -51,3 +54,28 @@ def test_get_default_output_path(monkeypatch):
 
     path = get_default_output_path(url, title, format)
     assert path == "/test/dir/Test_Article_medium.com.md"
+
+
+def test_normalize_medium_url_keeps_format():
+    """Test that the representation parameter survives normalization."""
+    url = "https://medium.com/@author/article-123?format=json&source=rss"
+    normalized = normalize_medium_url(url)
+    assert normalized == "https://medium.com/@author/article-123?format=json"
+
+
+def test_strip_tracking_params():
+    """Test that only tracking parameters are removed."""
+    url = "https://medium.com/@a/post-1?source=rss&sk=abc&utm_medium=email#x"
+    assert strip_tracking_params(url) == "https://medium.com/@a/post-1?sk=abc"
+    assert strip_tracking_params("https://medium.com/@a/post-1?source=rss") == (
+        "https://medium.com/@a/post-1"
+    )
+
+
+def test_escape_markdown():
+    """Test escaping and unescaping inline Markdown characters."""
+    text = r"f(*args, **kw) [x] `y` a_b \ c"
+    escaped = escape_markdown(text)
+
+    assert escaped == r"f(\*args, \*\*kw) \[x\] \`y\` a\_b \\ c"
+    assert unescape_markdown(escaped) == text
@@ -0,0 +1,108 @@
+"""Tests for the HTML exporter."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from medium_converter.core.cache import BlockCache
+from medium_converter.core.config import CacheConfig
+from medium_converter.core.models import Article, ContentBlock, ContentType
+
+# Skip tests if jinja2 is not available
+pytest.importorskip("jinja2")
+
+from medium_converter.exporters.html import HTMLExporter, html_spans  # noqa: E402
+from medium_converter.exporters.render import parse_inline  # noqa: E402
+
+
+@pytest.fixture
+def cache_config(tmp_path):
+    """Create a cache configuration in a temporary directory."""
+    return CacheConfig(cache_dir=str(tmp_path / "cache"))
+
+
+class TestHTMLExporter:
+    """Tests for the HTML exporter."""
+
+    def test_export_article(self, sample_article, cache_config):
+        """Test exporting an article with sections and formatted blocks."""
+        result = HTMLExporter(cache_config=cache_config).export(sample_article)
+
+        assert result.startswith("<!DOCTYPE html>")
+        assert "<title>Sample Article Title</title>" in result
+        assert "<h2>Sample Section</h2>" in result
+        assert '<code class="language-python">print(&#39;Hello, world!&#39;)' in result
+        assert "<style>" in result
+        # Compiled templates are cached on disk
+        assert list((Path(cache_config.cache_dir) / "templates").iterdir())
+
+    def test_write_streams(self, sample_article, cache_config, tmp_path):
+        """Test streaming to a path, a text stream and a binary stream."""
+        exporter = HTMLExporter(cache_config=cache_config)
+        expected = exporter.export(sample_article)
+        path = tmp_path / "article.html"
+        text, binary = io.StringIO(), io.BytesIO()
+
+        exporter.write(sample_article, str(path))
+        exporter.write(sample_article, text)
+        exporter.write(sample_article, binary)
+
+        assert path.read_text(encoding="utf-8") == expected
+        assert text.getvalue() == expected
+        assert binary.getvalue() == expected.encode("utf-8")
+
+    def test_assets(self, cache_config, tmp_path):
+        """Test inlined and externally referenced stylesheets and images."""
+        image_path = tmp_path / "image.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\nfake")
+        article = Article(
+            title="Assets",
+            author="Author",
+            date="2023-01-01",
+            content=[
+                ContentBlock(
+                    type=ContentType.IMAGE,
+                    content=str(image_path),
+                    metadata={"alt": "Fig", "caption": "A *figure*"},
+                )
+            ],
+        )
+
+        inlined = HTMLExporter(cache_config=cache_config).export(article)
+        output = tmp_path / "page.html"
+        HTMLExporter(inline_assets=False, cache_config=cache_config).export(
+            article, str(output)
+        )
+        external = output.read_text(encoding="utf-8")
+
+        assert 'src="data:image/png;base64,' in inlined
+        assert "<figcaption>A <em>figure</em></figcaption>" in inlined
+        assert f'src="{image_path}"' in external
+        assert '<link rel="stylesheet" href="article.css">' in external
+        assert (tmp_path / "article.css").exists()
+
+    def test_export_incremental_options(self, sample_article, cache_config, tmp_path):
+        """Test that changing the exporter's options forces a re-export."""
+        cache = BlockCache(cache_config)
+        output = str(tmp_path / "article.html")
+
+        assert HTMLExporter(cache_config=cache_config).export_incremental(
+            sample_article, output, cache
+        )
+        assert not HTMLExporter(cache_config=cache_config).export_incremental(
+            sample_article, output, cache
+        )
+        exporter = HTMLExporter(inline_assets=False, cache_config=cache_config)
+        assert exporter.export_incremental(sample_article, output, cache)
+        assert not exporter.export_incremental(sample_article, output, cache)
+
+    def test_html_spans(self):
+        """Test inline Markdown conversion and escaping."""
+        assert html_spans(parse_inline("**a** *b* `<c>` [d](https://e)")) == (
+            "<strong>a</strong> <em>b</em> <code>&lt;c&gt;</code> "
+            '<a href="https://e">d</a>'
+        )
+        assert html_spans(parse_inline("[x](javascript:alert(1))")) == (
+            "[x](javascript:alert(1))"
+        )
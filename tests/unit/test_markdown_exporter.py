@@ -0,0 +1,91 @@
+"""Tests for the Markdown exporter."""
+
+import io
+
+from medium_converter.core.cache import BlockCache
+from medium_converter.core.config import CacheConfig
+from medium_converter.core.models import Article, ContentBlock, ContentType
+from medium_converter.exporters import export_many
+from medium_converter.exporters.markdown import MarkdownExporter
+from medium_converter.exporters.render import RenderBlock
+
+
+class TestMarkdownExporter:
+    """Tests for the Markdown exporter."""
+
+    def test_export_article(self, sample_article):
+        """Test exporting an article with sections and formatted blocks."""
+        result = MarkdownExporter().export(sample_article)
+
+        assert result.startswith("# Sample Article Title\n\nBy Sample Author")
+        assert "## Sample Section\n\n" in result
+        assert "```python\nprint('Hello, world!')\n```\n\n" in result
+
+    def test_export_iter_matches_export(self, sample_article):
+        """Test that the chunks join up to the exported document."""
+        exporter = MarkdownExporter()
+        chunks = list(exporter.export_iter(sample_article))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == exporter.export(sample_article)
+
+    def test_write_streams(self, sample_article, tmp_path):
+        """Test streaming to a path, a text stream and a binary stream."""
+        exporter = MarkdownExporter()
+        expected = exporter.export(sample_article)
+        path = tmp_path / "article.md"
+        text, binary = io.StringIO(), io.BytesIO()
+
+        exporter.write(sample_article, str(path))
+        exporter.write(sample_article, text)
+        exporter.write(sample_article, binary)
+
+        assert path.read_text(encoding="utf-8") == expected
+        assert text.getvalue() == expected
+        assert binary.getvalue() == expected.encode("utf-8")
+
+    def test_ordered_list(self):
+        """Test that ordered list items are numbered."""
+        block = ContentBlock(
+            type=ContentType.LIST,
+            content="One\nTwo",
+            metadata={"list_type": "ordered"},
+        )
+
+        assert MarkdownExporter()._format_block(RenderBlock(block)) == (
+            "1. One\n2. Two\n\n"
+        )
+
+    def test_heading_level_is_clamped(self):
+        """Test that headings deeper than Markdown allows are clamped."""
+        article = Article(
+            title="Title",
+            author="Author",
+            date="2023-01-01",
+            content=[
+                ContentBlock(
+                    type=ContentType.HEADING, content="H", metadata={"level": 9}
+                )
+            ],
+        )
+
+        markdown = export_many(article, ["markdown"])["markdown"]
+
+        assert "\n###### H\n" in markdown
+        assert "#######" not in markdown
+
+    def test_export_incremental(self, sample_article, tmp_path):
+        """Test that unchanged articles are not exported again."""
+        cache = BlockCache(CacheConfig(cache_dir=str(tmp_path / "cache")))
+        output = str(tmp_path / "article.md")
+        exporter = MarkdownExporter()
+
+        assert exporter.export_incremental(sample_article, output, cache)
+        assert not exporter.export_incremental(sample_article, output, cache)
+
+        sample_article.content.append(
+            ContentBlock(type=ContentType.TEXT, content="A new closing paragraph.")
+        )
+        assert exporter.export_incremental(sample_article, output, cache)
+        with open(output, encoding="utf-8") as f:
+            assert f.read().endswith("A new closing paragraph.\n\n")
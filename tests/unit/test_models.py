@@ -1,6 +1,17 @@
 """Tests for the data models."""
 
-from medium_converter.core.models import ContentBlock, ContentType, Section
+from datetime import UTC, datetime
+
+import pytest
+
+from medium_converter.core.codec import CodecError
+from medium_converter.core.models import (
+    EMPTY_METADATA,
+    Article,
+    ContentBlock,
+    ContentType,
+    Section,
+)
 
 
 def test_content_block_creation():
@@ -32,3 +43,128 @@ def test_article_creation(sample_article):
     assert sample_article.estimated_reading_time == 5
     assert sample_article.url == "https://medium.com/sample-article"
     assert sample_article.tags == ["test", "sample"]
+
+
+def test_trusted_construction():
+    """Test that trusted constructors build models equal to validated ones."""
+    block = ContentBlock.trusted(ContentType.TEXT, "Text")
+    code = ContentBlock.trusted(ContentType.CODE, "x", {"language": "python"})
+    section = Section.trusted("Part", [code])
+    article = Article.trusted(
+        title="Title", author="Author", date="2024-01-01", content=[block, section]
+    )
+
+    assert block == ContentBlock(type=ContentType.TEXT, content="Text")
+    assert article == Article(
+        title="Title",
+        author="Author",
+        date="2024-01-01",
+        content=[
+            ContentBlock(type=ContentType.TEXT, content="Text"),
+            Section(
+                title="Part",
+                blocks=[
+                    ContentBlock(
+                        type=ContentType.CODE,
+                        content="x",
+                        metadata={"language": "python"},
+                    )
+                ],
+            ),
+        ],
+    )
+    assert article.model_dump()["content"][0]["metadata"] == {}
+
+
+def test_trusted_blocks_share_empty_metadata():
+    """Test that blocks without metadata share one read-only dict."""
+    first = ContentBlock.trusted(ContentType.TEXT, "One")
+    second = ContentBlock.trusted(ContentType.TEXT, "Two")
+
+    assert first.metadata is second.metadata is EMPTY_METADATA
+    with pytest.raises(TypeError):
+        first.metadata["key"] = "value"
+
+    first.metadata = {"key": "value"}
+    first.content = "Changed"
+    assert second.metadata == {}
+    assert second.content == "Two"
+    assert first.model_copy(deep=True) == first
+
+
+def test_fingerprints(sample_article):
+    """Test that fingerprints change exactly when block data changes."""
+    block = ContentBlock(
+        type=ContentType.HEADING, content="Title", metadata={"level": 2}
+    )
+    same = ContentBlock.trusted(ContentType.HEADING, "Title", {"level": 2})
+    other_level = ContentBlock(
+        type=ContentType.HEADING, content="Title", metadata={"level": 3}
+    )
+    other_type = ContentBlock(type=ContentType.TEXT, content="Title")
+
+    assert block.fingerprint == same.fingerprint
+    assert (
+        len({block.fingerprint, other_level.fingerprint, other_type.fingerprint}) == 3
+    )
+
+    fingerprint = sample_article.fingerprint
+    assert Article.from_bytes(sample_article.to_bytes()).fingerprint == fingerprint
+    sample_article.content[1].blocks[0].content = "Edited"
+    assert sample_article.fingerprint != fingerprint
+
+
+def test_article_bytes_round_trip():
+    """Test that the binary encoding preserves every field."""
+    article = Article(
+        title="Title",
+        author="Author",
+        date=datetime(2024, 1, 1, tzinfo=UTC),
+        content=[
+            ContentBlock(type=ContentType.TEXT, content="Intro ünïcode"),
+            Section(
+                title="Part",
+                blocks=[
+                    ContentBlock(
+                        type=ContentType.CODE,
+                        content="x = 1",
+                        metadata={"language": "python"},
+                    ),
+                    ContentBlock(
+                        type=ContentType.IMAGE,
+                        content="image.png",
+                        metadata={"alt": "", "width": 1400, "ratio": 1.5},
+                    ),
+                ],
+            ),
+            ContentBlock(
+                type=ContentType.HEADING, content="End", metadata={"level": 2}
+            ),
+        ],
+        estimated_reading_time=3,
+        url="https://medium.com/@author/title",
+        tags=["python"],
+    )
+
+    decoded = Article.from_bytes(article.to_bytes())
+
+    assert decoded == article
+    assert isinstance(decoded.content[1], Section)
+    assert decoded.date == article.date
+
+
+def test_article_bytes_text_date(sample_article):
+    """Test that unparsed dates are kept as text."""
+    assert Article.from_bytes(sample_article.to_bytes()) == sample_article
+
+
+def test_article_from_invalid_bytes(sample_article):
+    """Test that foreign, truncated or unknown-version data is rejected."""
+    data = sample_article.to_bytes()
+
+    with pytest.raises(CodecError):
+        Article.from_bytes(b"not an article")
+    with pytest.raises(CodecError):
+        Article.from_bytes(data[:-1])
+    with pytest.raises(CodecError):
+        Article.from_bytes(data[:3] + b"\x63" + data[4:])
@@ -0,0 +1,40 @@
+"""Tests for parallel parsing in a process pool."""
+
+from medium_converter.core.config import ParseConfig
+from medium_converter.core.parse_pool import ParsePool, parse_many
+from medium_converter.core.parser import parse_article
+
+
+def test_parse_many_matches_serial(fixtures_dir):
+    """Test that pool results match serial parsing, in input order."""
+    pages = [
+        (fixtures_dir / "pages" / name).read_bytes()
+        for name in ("sample-post.html", "html-only.html", "apollo-post.html")
+    ]
+
+    articles = parse_many(pages, workers=2)
+
+    assert articles == [parse_article(page) for page in pages]
+
+
+def test_parse_many_with_encodings():
+    """Test that a declared encoding is used to decode its page."""
+    page = "<article><p>café</p></article>".encode("latin-1")
+
+    articles = parse_many([(page, "latin-1"), page], workers=1)
+
+    assert articles[0].content[0].content == "café"
+    assert articles[1] == parse_article(page)
+
+
+async def test_parse_async(fixtures_dir):
+    """Test parsing a single page from async code."""
+    page = (fixtures_dir / "pages" / "sample-post.html").read_bytes()
+    latin = "<article><p>café</p></article>".encode("latin-1")
+
+    with ParsePool(ParseConfig(workers=1)) as pool:
+        article = await pool.parse(page)
+        encoded = await pool.parse(latin, "latin-1")
+
+    assert article == parse_article(page)
+    assert encoded.content[0].content == "café"
@@ -0,0 +1,272 @@
+"""Tests for the HTML parser."""
+
+from datetime import UTC, datetime
+
+from medium_converter.core.models import ContentType
+from medium_converter.core.parser import (
+    StreamingParser,
+    iter_blocks,
+    parse_article,
+    parse_embedded_state,
+    parse_html,
+)
+from medium_converter.core.post_json import (
+    apply_markups,
+    parse_apollo_state,
+    parse_post_json,
+)
+
+
+def test_parse_fixture_article(fixtures_dir):
+    """Test parsing a Medium-like page from raw bytes."""
+    html = (fixtures_dir / "pages" / "sample-post.html").read_bytes()
+    article = parse_article(html)
+
+    assert article.title == "Understanding Async Python"
+    assert article.author == "Jane Writer"
+    assert article.date == datetime(2024, 1, 1, tzinfo=UTC)
+    assert article.estimated_reading_time == 4
+    assert article.url == (
+        "https://medium.com/@author/understanding-async-python-a1b2c3d4e5f6"
+    )
+
+    blocks = article.content
+    assert [block.type for block in blocks] == [
+        ContentType.TEXT,
+        ContentType.HEADING,
+        ContentType.TEXT,
+        ContentType.IMAGE,
+        ContentType.CODE,
+        ContentType.QUOTE,
+        ContentType.LIST,
+        ContentType.LIST,
+        ContentType.HEADING,
+        ContentType.TEXT,
+    ]
+    assert blocks[0].content == "**Async code** lets one thread wait on *many things.*"
+    assert blocks[1].metadata == {"level": 2}
+    assert blocks[2].content == (
+        "Read the [asyncio docs](https://docs.python.org/3/library/asyncio.html) "
+        "for details."
+    )
+    assert blocks[3].content == "https://miro.medium.com/v2/resize:fit:1400/1*abc.png"
+    assert blocks[3].metadata["caption"] == "An event loop diagram"
+    assert blocks[4].content == "import asyncio\nasyncio.run(main())"
+    assert blocks[4].metadata == {"language": "python"}
+    assert blocks[7].content == "Create a loop\n`Run` until complete"
+    assert blocks[7].metadata == {"list_type": "ordered"}
+
+
+def test_parse_ignores_content_outside_article():
+    """Test that navigation and footers are not part of the content."""
+    html = """
+    <html><body>
+      <nav><p>Sign in</p></nav>
+      <article><p>Inside</p></article>
+      <footer><p>Footer</p></footer>
+    </body></html>
+    """
+    article = parse_article(html)
+
+    assert [block.content for block in article.content] == ["Inside"]
+
+
+def test_parse_nested_blocks_once():
+    """Test that blocks nested in other blocks are emitted only once."""
+    html = """
+    <article>
+      <blockquote><p>First line</p><p>Second line</p></blockquote>
+      <figure>
+        <picture><source srcset="small.png 400w, large.png 1400w"></picture>
+        <img alt="Alt text">
+      </figure>
+    </article>
+    """
+    article = parse_article(html)
+
+    assert len(article.content) == 2
+    assert article.content[0].content == "First line\nSecond line"
+    assert article.content[1].content == "large.png"
+    assert article.content[1].metadata == {"alt": "Alt text"}
+
+
+def test_parse_empty_document():
+    """Test that an empty document yields an empty article."""
+    article = parse_article(b"")
+
+    assert article.title == ""
+    assert article.content == []
+
+
+def test_parse_encoding():
+    """Test that pages without a meta charset are decoded as UTF-8."""
+    html = "<html><body><article><p>café – naïve</p></article></body></html>"
+    latin1 = html.replace(" –", "").encode("latin-1")
+    meta = b'<html><head><meta charset="iso-8859-1"></head>' + latin1[6:]
+
+    assert parse_article(html.encode()).content[0].content == "café – naïve"
+    assert parse_article(latin1, "latin-1").content[0].content == "café naïve"
+    assert parse_article(meta).content[0].content == "café naïve"
+
+    parser = StreamingParser()
+    blocks = parser.feed(html.encode()[:30]) + parser.feed(html.encode()[30:])
+    assert [block.content for block in blocks + parser.close()] == ["café – naïve"]
+
+
+def test_parse_escapes_literal_markdown():
+    """Test that literal Markdown characters are not read as formatting."""
+    article = parse_article(
+        "<article><h2>The *args_list</h2>"
+        "<p>Pass *args and **kwargs to <code>f(*a)</code> "
+        '<a href="https://e">[1]</a></p></article>'
+    )
+
+    assert article.title == "The *args_list"
+    assert article.content[1].content == (
+        r"Pass \*args and \*\*kwargs to `f(*a)` [\[1\]](https://e)"
+    )
+
+
+def test_parse_code_with_backticks():
+    """Test that code spans containing backticks get a longer fence."""
+    article = parse_article(
+        "<article><p><code>a`b</code> and <code>`x</code></p></article>"
+    )
+
+    assert article.content[0].content == "``a`b`` and `` `x ``"
+    markups = [{"type": "CODE", "start": 4, "end": 7}]
+    assert apply_markups("Use a`b", markups) == "Use ``a`b``"
+
+
+def test_apply_markups_escapes_literal_markdown():
+    """Test that post JSON text is escaped outside code spans."""
+    markups = [{"type": "CODE", "start": 9, "end": 14}]
+
+    assert apply_markups("Use a*b, f(*a)", markups) == r"Use a\*b, `f(*a)`"
+    assert apply_markups("snake_case", []) == r"snake\_case"
+
+
+def test_apply_markups_nesting_and_offsets():
+    """Test that markups over one range nest and offsets are UTF-16."""
+    markups = [
+        {"type": "STRONG", "start": 0, "end": 5},
+        {"type": "A", "start": 0, "end": 5, "href": "http://x"},
+    ]
+    assert apply_markups("hello world", markups) == "**[hello](http://x)** world"
+
+    markups = [
+        {"type": "A", "start": 0, "end": 11, "href": "http://x"},
+        {"type": "EM", "start": 6, "end": 11},
+    ]
+    assert apply_markups("hello world", markups) == "[hello *world*](http://x)"
+
+    # The emoji is two UTF-16 code units
+    markups = [{"type": "STRONG", "start": 6, "end": 10}]
+    assert apply_markups("Hi 😀 bold", markups) == "Hi 😀 **bold**"
+
+
+def test_parse_collapses_source_whitespace():
+    """Test that newlines in the HTML source do not become line breaks."""
+    article = parse_article("<article><p>One\n   two<br>three</p></article>")
+
+    assert article.content[0].content == "One two\nthree"
+
+
+def test_parse_embedded_apollo_state(fixtures_dir):
+    """Test that the embedded Apollo state is preferred over the markup."""
+    html = (fixtures_dir / "pages" / "apollo-post.html").read_bytes()
+    expected = parse_post_json(
+        (fixtures_dir / "pages" / "sample-post.json").read_bytes()
+    )
+
+    article = parse_article(html)
+
+    assert article == expected
+    assert article.author == "Jane Writer"
+    assert article.tags == ["Python", "Asyncio"]
+    assert article.content[0].content == (
+        "**Async code** lets one thread wait on *many things.*"
+    )
+
+
+def test_parse_apollo_state_picks_main_post():
+    """Test that the root query's post wins over other posts in the state."""
+
+    def post(title, paragraphs):
+        body = {"bodyModel": {"paragraphs": paragraphs}} if paragraphs else {}
+        return {"__typename": "Post", "title": title, "content({})": body}
+
+    paragraph = {"type": "P", "text": "Main body", "markups": []}
+    state = {
+        "Post:teaser": post("Teaser", []),
+        "Post:related": post("Related", [{"type": "P", "text": "Other"}]),
+        "Post:main": post("Main", [{"__ref": "Paragraph:main_0"}]),
+        "Paragraph:main_0": paragraph,
+        "ROOT_QUERY": {'postResult({"id":"main"})': {"__ref": "Post:main"}},
+    }
+
+    article = parse_apollo_state(state)
+    assert article.title == "Main"
+    assert [block.content for block in article.content] == ["Main body"]
+
+    # Without a root query, posts without a body are skipped
+    del state["ROOT_QUERY"]
+    assert parse_apollo_state(state).title == "Related"
+
+
+def test_parse_embedded_state_missing_or_malformed():
+    """Test that pages without a usable state fall back to the HTML."""
+    assert parse_embedded_state(b"<article><p>Hi</p></article>") is None
+
+    html = (
+        "<html><body><article><p>Fallback</p></article>"
+        "<script>window.__APOLLO_STATE__ = {broken;</script></body></html>"
+    )
+    assert parse_embedded_state(html) is None
+    assert [block.content for block in parse_article(html).content] == ["Fallback"]
+
+    no_post = '<script>window.__APOLLO_STATE__ = {"ROOT_QUERY": {}}</script>'
+    assert parse_embedded_state(no_post) is None
+
+
+def test_streaming_parser_matches_tree_parser(fixtures_dir):
+    """Test that feeding a page in small chunks yields the same blocks."""
+    html = (fixtures_dir / "pages" / "sample-post.html").read_bytes()
+    parser = StreamingParser()
+
+    blocks = []
+    for start in range(0, len(html), 16):
+        blocks.extend(parser.feed(html[start : start + 16]))
+    blocks.extend(parser.close())
+
+    assert blocks == parse_html(html).content
+    assert parser.meta["title"] == "Understanding Async Python"
+
+
+def test_streaming_parser_scopes_to_article():
+    """Test that blocks outside the article are dropped once one is seen."""
+    parser = StreamingParser()
+
+    assert parser.feed(b"<body><nav><p>Sign in</p></nav>") == []
+    assert [block.content for block in parser.feed(b"<article><p>In</p>")] == ["In"]
+    assert parser.feed(b"</article><footer><p>Footer</p></footer>") == []
+    assert parser.close() == []
+
+    parser = StreamingParser()
+    assert parser.feed(b"<body><p>No article</p>") == []
+    assert [block.content for block in parser.close()] == ["No article"]
+
+
+async def test_iter_blocks():
+    """Test parsing an async stream of chunks."""
+
+    async def chunks():
+        yield b"<article><h2>Hea"
+        yield b"ding</h2><p>Text</p></article>"
+
+    blocks = [block async for block in iter_blocks(chunks())]
+
+    assert [block.type for block in blocks] == [
+        ContentType.HEADING,
+        ContentType.TEXT,
+    ]
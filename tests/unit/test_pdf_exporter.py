@@ -0,0 +1,109 @@
+"""Tests for the PDF exporter."""
+
+import io
+
+import pytest
+
+from medium_converter.core.models import Article, ContentBlock, ContentType, Section
+from medium_converter.exporters.pdf import PDFExporter, _markup, _styles
+from medium_converter.exporters.render import parse_inline
+
+# Skip tests if reportlab is not available
+pytest.importorskip("reportlab")
+
+
+def make_article(image_path: str = "https://miro.medium.com/image.png") -> Article:
+    """Create an article with one block of every content type."""
+    return Article(
+        title="PDF Article",
+        author="Test Author",
+        date="2023-01-01",
+        tags=["pdf"],
+        estimated_reading_time=3,
+        content=[
+            Section(
+                title="Introduction",
+                blocks=[
+                    ContentBlock(
+                        type=ContentType.TEXT,
+                        content="Some **bold**, *italic* and `a < b` text.",
+                    ),
+                    ContentBlock(type=ContentType.QUOTE, content="A quote & more."),
+                ],
+            ),
+            ContentBlock(
+                type=ContentType.HEADING, content="Details", metadata={"level": 3}
+            ),
+            ContentBlock(
+                type=ContentType.CODE,
+                content="print('Hello, world!')\n" + "x = 1  # " + "y" * 200,
+                metadata={"language": "python"},
+            ),
+            ContentBlock(
+                type=ContentType.LIST,
+                content="One\nTwo",
+                metadata={"list_type": "ordered"},
+            ),
+            ContentBlock(
+                type=ContentType.IMAGE, content=image_path, metadata={"alt": "Figure"}
+            ),
+            ContentBlock(type=ContentType.TEXT, content="Unbalanced **markup"),
+        ],
+    )
+
+
+class TestPDFExporter:
+    """Tests for the PDF exporter."""
+
+    def test_export_article(self):
+        """Test that every block type renders into a PDF."""
+        result = PDFExporter().export(make_article())
+
+        assert result.startswith(b"%PDF")
+        assert result.rstrip().endswith(b"%%EOF")
+
+    def test_export_to_file_and_stream(self, tmp_path):
+        """Test that the PDF is written directly to a path or stream."""
+        output_file = tmp_path / "article.pdf"
+        stream = io.BytesIO()
+        exporter = PDFExporter()
+
+        from_file = exporter.export(make_article(), str(output_file))
+        from_stream = exporter.export(make_article(), stream)
+
+        assert output_file.read_bytes() == from_file
+        assert stream.getvalue() == from_stream
+        assert from_file.startswith(b"%PDF")
+
+    def test_export_local_image(self, tmp_path):
+        """Test that local images are embedded."""
+        pil_image = pytest.importorskip("PIL.Image")
+        image_path = tmp_path / "image.png"
+        pil_image.new("RGB", (2000, 1000), "blue").save(image_path)
+
+        with_image = PDFExporter().export(make_article(str(image_path)))
+        without_image = PDFExporter().export(make_article())
+
+        assert b"/Subtype /Image" in with_image
+        assert b"/Subtype /Image" not in without_image
+
+    def test_export_tall_image(self, tmp_path):
+        """Test that images taller than a page are scaled to fit it."""
+        pil_image = pytest.importorskip("PIL.Image")
+        image_path = tmp_path / "tall.png"
+        pil_image.new("RGB", (600, 3000), "blue").save(image_path)
+
+        pdf = PDFExporter().export(make_article(str(image_path)))
+
+        assert b"/Subtype /Image" in pdf
+
+    def test_styles_are_cached(self):
+        """Test that the stylesheet is built once per process."""
+        assert _styles() is _styles()
+
+    def test_inline_markup(self):
+        """Test the conversion of inline Markdown to reportlab markup."""
+        assert _markup(parse_inline("**a** *b* `*c*` [d](https://e)")) == (
+            '<b>a</b> <i>b</i> <font face="Courier">*c*</font> '
+            '<link href="https://e" color="blue">d</link>'
+        )
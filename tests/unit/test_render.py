@@ -0,0 +1,182 @@
+"""Tests for the render tree shared by the exporters."""
+
+import io
+from unittest.mock import patch
+
+import pytest
+
+from medium_converter.core.models import Article, ContentBlock, ContentType
+from medium_converter.exporters import export_many
+from medium_converter.exporters.render import (
+    RenderSection,
+    Span,
+    build_render_tree,
+    parse_inline,
+)
+
+
+class TestParseInline:
+    """Tests for parsing inline Markdown into spans."""
+
+    def test_plain_text(self):
+        """Test that text without markup is a single span."""
+        assert parse_inline("Plain text") == (Span("Plain text"),)
+        assert parse_inline("") == ()
+
+    def test_formatting(self):
+        """Test code spans, links and nested emphasis."""
+        assert parse_inline("**a *b* c** `*c*` [d](https://e)") == (
+            Span("a ", bold=True),
+            Span("b", bold=True, italic=True),
+            Span(" c", bold=True),
+            Span(" "),
+            Span("*c*", code=True),
+            Span(" "),
+            Span("d", href="https://e"),
+        )
+
+    def test_unsafe_links_and_unmatched_markers(self):
+        """Test that script links and lone markers are kept as text."""
+        assert parse_inline("[x](javascript:alert(1))") == (
+            Span("[x](javascript:alert(1))"),
+        )
+        assert parse_inline("2 * 3") == (Span("2 * 3"),)
+
+    def test_emphasis_around_and_inside_links(self):
+        """Test that emphasis pairs up across link boundaries."""
+        assert parse_inline("**[hello](http://x)** and 2*3*4") == (
+            Span("hello", bold=True, href="http://x"),
+            Span(" and 2"),
+            Span("3", italic=True),
+            Span("4"),
+        )
+        assert parse_inline("[**hi** there](http://x)") == (
+            Span("hi", bold=True, href="http://x"),
+            Span(" there", href="http://x"),
+        )
+        # Markers inside a link label never pair with markers outside it
+        assert parse_inline("**[a**](http://x)") == (
+            Span("**"),
+            Span("a**", href="http://x"),
+        )
+
+    def test_escapes(self):
+        """Test that escaped Markdown characters are literal text."""
+        assert parse_inline(r"Pass \*args and \*\*kwargs") == (
+            Span("Pass *args and **kwargs"),
+        )
+        assert parse_inline(r"[\[1\]](https://e) `a\*b`") == (
+            Span("[1]", href="https://e"),
+            Span(" "),
+            Span(r"a\*b", code=True),
+        )
+
+    def test_code_fences(self):
+        """Test code spans fenced by several backticks."""
+        assert parse_inline("``a`b`` and `` `x ``") == (
+            Span("a`b", code=True),
+            Span(" and "),
+            Span("`x", code=True),
+        )
+        assert parse_inline("``a`") == (Span("``a`"),)
+
+    def test_emphasis_flanking(self):
+        """Test that markers surrounded by whitespace are literal."""
+        assert parse_inline("x * y * z") == (Span("x * y * z"),)
+        assert parse_inline("***a***") == (Span("a", bold=True, italic=True),)
+
+
+class TestRenderTree:
+    """Tests for building render trees."""
+
+    def test_build(self, sample_article):
+        """Test that the tree mirrors the article's structure."""
+        tree = build_render_tree(sample_article)
+
+        assert tree.article is sample_article
+        assert len(tree.content) == len(sample_article.content)
+        assert isinstance(tree.content[1], RenderSection)
+        assert [block.type for block in tree.iter_blocks()] == [
+            ContentType.TEXT,
+            ContentType.TEXT,
+            ContentType.CODE,
+            ContentType.IMAGE,
+        ]
+
+    def test_blocks(self):
+        """Test heading levels, list items and image resolution."""
+        article = Article(
+            title="Title",
+            author="Author",
+            date="2023-01-01",
+            content=[
+                ContentBlock(
+                    type=ContentType.HEADING, content="Deep", metadata={"level": 9}
+                ),
+                ContentBlock(
+                    type=ContentType.LIST,
+                    content="*One*\n\nTwo",
+                    metadata={"list_type": "ordered"},
+                ),
+                ContentBlock(type=ContentType.IMAGE, content="https://e/a.png"),
+            ],
+        )
+
+        heading, listing, image = build_render_tree(
+            article, images={"https://e/a.png": "/tmp/a.png"}
+        ).content
+
+        assert heading.level == 6
+        assert listing.ordered
+        assert listing.items == ((Span("One", italic=True),), (Span("Two"),))
+        assert image.src == "/tmp/a.png"
+        assert image.local
+
+    def test_image_data_is_read_once(self, tmp_path):
+        """Test that local images are read at most once per tree."""
+        image_path = tmp_path / "image.png"
+        image_path.write_bytes(b"image")
+        article = Article(
+            title="Title",
+            author="Author",
+            date="2023-01-01",
+            content=[ContentBlock(type=ContentType.IMAGE, content=str(image_path))],
+        )
+        tree = build_render_tree(article)
+        (block,) = tree.content
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            assert tree.image_data(block) == b"image"
+            assert tree.image_data(block) == b"image"
+        assert mock_open.call_count == 1
+
+
+class TestExportMany:
+    """Tests for exporting to several formats at once."""
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_export_many(self, sample_article, tmp_path, parallel):
+        """Test that one tree drives every requested exporter."""
+        html_output = tmp_path / "article.html"
+        epub_output = io.BytesIO()
+
+        with patch(
+            "medium_converter.exporters.build_render_tree", wraps=build_render_tree
+        ) as mock_build:
+            results = export_many(
+                sample_article,
+                ["markdown", "html", "epub"],
+                outputs={"html": str(html_output), "epub": epub_output},
+                parallel=parallel,
+            )
+
+        mock_build.assert_called_once()
+        assert list(results) == ["markdown", "html", "epub"]
+        assert "# Sample Article Title" in results["markdown"]
+        assert html_output.read_text(encoding="utf-8") == results["html"]
+        assert epub_output.getvalue() == results["epub"]
+
+    def test_unknown_format(self, sample_article):
+        """Test that unknown formats fail before anything is exported."""
+        with pytest.raises(ValueError, match="Unknown export format"):
+            export_many(sample_article, ["markdown", "rtf"])
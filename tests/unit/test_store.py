@@ -0,0 +1,82 @@
+"""Tests for the columnar article store."""
+
+import pytest
+
+from medium_converter.core.models import ContentType
+from medium_converter.core.parser import parse_article
+from medium_converter.core.store import ArticleStore, StoreError
+
+
+@pytest.fixture
+def store(sample_article, fixtures_dir):
+    """Create a store holding the sample article and a parsed page."""
+    store = ArticleStore()
+    store.add(sample_article)
+    store.add(parse_article((fixtures_dir / "pages" / "sample-post.html").read_bytes()))
+    return store
+
+
+def test_materialize_articles(store, sample_article, fixtures_dir):
+    """Test that articles come back equal to the ones added."""
+    page = (fixtures_dir / "pages" / "sample-post.html").read_bytes()
+
+    assert len(store) == 2
+    assert store[0] == sample_article
+    assert store[-1] == parse_article(page)
+    assert list(store) == [store[0], store[1]]
+    assert store.title(1) == "Understanding Async Python"
+    with pytest.raises(IndexError):
+        store[2]
+
+
+def test_scan_and_find(store):
+    """Test scanning blocks and searching texts without materializing."""
+    code = list(store.iter_blocks(ContentType.CODE))
+
+    assert code[0] == (0, "print('Hello, world!')")
+    assert code[1] == (1, "import asyncio\nasyncio.run(main())")
+    assert store.find("event loop") == [1]
+    assert store.find("sample") == [0]
+    assert store.find("not in any article") == []
+
+
+def test_save_and_open_mapped(store, tmp_path, sample_article):
+    """Test that a saved store reopens memory-mapped and read-only."""
+    path = tmp_path / "archive.mcs"
+    store.save(path)
+
+    with ArticleStore.open(path) as mapped:
+        assert mapped.read_only
+        assert list(mapped) == list(store)
+        assert mapped.find("event loop") == [1]
+        assert mapped.block_count == store.block_count
+        with pytest.raises(StoreError):
+            mapped.add(sample_article)
+
+
+def test_open_invalid_file(tmp_path):
+    """Test that other files are rejected."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"x" * 64)
+
+    with pytest.raises(StoreError):
+        ArticleStore.open(path)
+
+
+def test_open_empty_or_corrupt_file(store, tmp_path):
+    """Test that empty files and corrupt side tables are rejected."""
+    empty = tmp_path / "empty.mcs"
+    empty.write_bytes(b"")
+    with pytest.raises(StoreError):
+        ArticleStore.open(empty)
+
+    path = tmp_path / "archive.mcs"
+    store.save(path)
+    data = path.read_bytes()
+    path.write_bytes(data[:-1] + b"!")
+    with pytest.raises(StoreError):
+        ArticleStore.open(path)
+
+    path.write_bytes(data[:-10])
+    with pytest.raises(StoreError):
+        ArticleStore.open(path)